@@ -22,6 +22,7 @@ pytest_plugins = [
     "saleor.graphql.webhook.tests.benchmark.fixtures",
     "saleor.plugins.webhook.tests.subscription_webhooks.fixtures",
     "saleor.tax.tests.fixtures",
+    "saleor.webhook.tests.fixtures",
 ]
 
 if os.environ.get("PYTEST_DB_URL"):
@@ -24,6 +24,7 @@ from ..plugins.manager import PluginsManager
 from ..thumbnail import ICON_MIME_TYPES
 from ..thumbnail.utils import get_filename_from_url
 from ..thumbnail.validators import validate_icon_image
+from ..webhook.cache import invalidate_webhooks_routing
 from ..webhook.models import Webhook, WebhookEvent
 from .error_codes import AppErrorCode
 from .manifest_validations import clean_manifest_data
@@ -255,6 +256,8 @@ def install_app(app_installation: AppInstallation, activate: bool = False):
                 WebhookEvent(webhook=db_webhook, event_type=event_type)
             )
     WebhookEvent.objects.bulk_create(webhook_events)
+    # bulk_create doesn't send signals which refresh the webhooks routing
+    invalidate_webhooks_routing()
 
     _, token = app.tokens.create(name="Default token")  # type: ignore[call-arg] # calling create on a related manager # noqa: E501
 
@@ -1,16 +1,25 @@
+import hashlib
+import json
 from decimal import Decimal
-from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
 
 from django.conf import settings
 from django.utils import timezone
 from prices import Money, TaxedMoney
 
 from ..checkout import base_calculations
+from ..core.cache_version import get_version
 from ..core.prices import quantize_price
 from ..core.taxes import TaxData, zero_money, zero_taxed_money
-from ..discount.utils import generate_sale_discount_objects_for_checkout
+from ..discount.utils import (
+    create_or_update_discount_objects_from_sale_for_checkout,
+    fetch_active_sales_for_checkout,
+)
 from ..payment.models import TransactionItem
+from ..plugins.cache import PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY
+from ..shipping.interface import ShippingMethodData
 from ..tax import TaxCalculationStrategy
+from ..tax.cache import TAX_CONFIGURATION_VERSION_CACHE_KEY
 from ..tax.calculations.checkout import update_checkout_prices_with_flat_rates
 from ..tax.utils import (
     get_charge_taxes_for_checkout,
@@ -22,6 +31,8 @@ from .payment_utils import update_checkout_payment_statuses
 
 if TYPE_CHECKING:
     from ..account.models import Address
+    from ..discount import DiscountInfo
+    from ..discount.models import Voucher
     from ..plugins.manager import PluginsManager
     from .fetch import CheckoutInfo, CheckoutLineInfo
 
@@ -228,13 +239,20 @@ def _fetch_checkout_prices_if_expired(
     then apply tax data as well if we receive one.
 
     Prices can be updated only if force_update == True, or if time elapsed from the
-    last price update is greater than settings.CHECKOUT_PRICES_TTL.
+    last price update is greater than settings.CHECKOUT_PRICES_TTL. Expired prices
+    are recalculated only when the pricing inputs changed since the last update.
     """
     checkout = checkout_info.checkout
 
     if not force_update and checkout.price_expiration > timezone.now():
         return checkout_info, lines
 
+    sales_info = fetch_active_sales_for_checkout(lines)
+    if not force_update and checkout.price_fingerprint == (
+        get_checkout_prices_fingerprint(checkout_info, lines, address, sales_info)
+    ):
+        return checkout_info, lines
+
     tax_configuration = checkout_info.tax_configuration
     tax_calculation_strategy = get_tax_calculation_strategy_for_checkout(
         checkout_info, lines
@@ -243,7 +261,9 @@ def _fetch_checkout_prices_if_expired(
     charge_taxes = get_charge_taxes_for_checkout(checkout_info, lines)
     should_charge_tax = charge_taxes and not checkout.tax_exemption
 
-    generate_sale_discount_objects_for_checkout(checkout_info, lines)
+    create_or_update_discount_objects_from_sale_for_checkout(
+        checkout_info, lines, sales_info
+    )
 
     if prices_entered_with_tax:
         # If prices are entered with tax, we need to always calculate it anyway, to
@@ -282,6 +302,11 @@ def _fetch_checkout_prices_if_expired(
             _get_checkout_base_prices(checkout, checkout_info, lines)
 
     checkout.price_expiration = timezone.now() + settings.CHECKOUT_PRICES_TTL
+    # Fingerprint is taken after the calculation, as it may update the checkout
+    # discount.
+    checkout.price_fingerprint = get_checkout_prices_fingerprint(
+        checkout_info, lines, address, sales_info
+    )
     checkout.save(
         update_fields=[
             "voucher_code",
@@ -293,6 +318,7 @@ def _fetch_checkout_prices_if_expired(
             "shipping_price_gross_amount",
             "shipping_tax_rate",
             "price_expiration",
+            "price_fingerprint",
             "translated_discount_name",
             "discount_amount",
             "discount_name",
@@ -312,6 +338,124 @@ def _fetch_checkout_prices_if_expired(
     return checkout_info, lines
 
 
+def get_checkout_prices_fingerprint(
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    address: Optional["Address"],
+    sales_info: Iterable["DiscountInfo"],
+) -> str:
+    """Return a hash of all inputs the checkout prices are calculated from.
+
+    Tax classes, rates and configurations, as well as plugin configurations, are
+    represented by their version stamps, so changing any of them changes the hash.
+    """
+    checkout = checkout_info.checkout
+    channel = checkout_info.channel
+    tax_configuration = checkout_info.tax_configuration
+
+    delivery_method = checkout_info.delivery_method_info.delivery_method
+    delivery_method_data: Any = None
+    if isinstance(delivery_method, ShippingMethodData):
+        delivery_method_data = [
+            delivery_method.id,
+            delivery_method.price.amount,
+            delivery_method.tax_class.pk if delivery_method.tax_class else None,
+        ]
+    elif delivery_method is not None:
+        delivery_method_data = ["warehouse", delivery_method.pk]
+
+    lines_data = []
+    for line_info in lines:
+        line = line_info.line
+        channel_listing = line_info.channel_listing
+        lines_data.append(
+            [
+                line.pk,
+                line.variant_id,
+                line.quantity,
+                line.price_override,
+                line_info.variant.updated_at,
+                line_info.product.updated_at,
+                channel_listing.price_amount if channel_listing else None,
+                channel_listing.discounted_price_amount if channel_listing else None,
+                line_info.tax_class.pk if line_info.tax_class else None,
+                _get_voucher_fingerprint_data(line_info.voucher, channel.pk),
+            ]
+        )
+
+    sales_data = []
+    for sale_info in sales_info:
+        sale_channel_listing = sale_info.channel_listings.get(channel.slug)
+        sales_data.append(
+            [
+                sale_info.sale.pk,
+                sale_info.sale.type,
+                sale_info.sale.updated_at,
+                sale_channel_listing.discount_value if sale_channel_listing else None,
+                sorted(sale_info.product_ids),
+                sorted(sale_info.variants_ids),
+                sorted(sale_info.category_ids),
+                sorted(sale_info.collection_ids),
+            ]
+        )
+
+    data = {
+        "checkout": [
+            checkout.channel_id,
+            checkout.currency,
+            checkout.country.code,
+            checkout.tax_exemption,
+            checkout.voucher_code,
+            checkout.discount_amount,
+            checkout.discount_name,
+            checkout.translated_discount_name,
+        ],
+        "addresses": [
+            address.as_data() if address else None
+            for address in [
+                address,
+                checkout_info.shipping_address,
+                checkout_info.billing_address,
+            ]
+        ],
+        "delivery_method": delivery_method_data,
+        "voucher": _get_voucher_fingerprint_data(checkout_info.voucher, channel.pk),
+        "lines": lines_data,
+        "sales": sorted(sales_data, key=lambda sale_data: sale_data[0]),
+        "tax_configuration": [
+            tax_configuration.pk,
+            tax_configuration.charge_taxes,
+            tax_configuration.tax_calculation_strategy,
+            tax_configuration.display_gross_prices,
+            tax_configuration.prices_entered_with_tax,
+        ],
+        "versions": [
+            get_version(TAX_CONFIGURATION_VERSION_CACHE_KEY),
+            get_version(PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY),
+        ],
+    }
+    serialized_data = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_data.encode("utf-8")).hexdigest()
+
+
+def _get_voucher_fingerprint_data(
+    voucher: Optional["Voucher"], channel_id: int
+) -> Optional[List[Any]]:
+    if not voucher:
+        return None
+    return [
+        voucher.pk,
+        voucher.type,
+        voucher.discount_value_type,
+        voucher.apply_once_per_order,
+        [
+            channel_listing.discount_value
+            for channel_listing in voucher.channel_listings.all()
+            if channel_listing.channel_id == channel_id
+        ],
+    ]
+
+
 def _calculate_and_add_tax(
     tax_calculation_strategy: str,
     checkout: "Checkout",
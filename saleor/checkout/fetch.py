@@ -14,8 +14,11 @@ from typing import (
 )
 from uuid import UUID
 
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.db.models import OuterRef, Subquery, prefetch_related_objects
 from prices import Money
 
+from ..core.postgres import model_from_json, model_json_object
 from ..core.utils.lazyobjects import lazy_no_retry
 from ..discount import DiscountType, VoucherType
 from ..discount.interface import fetch_voucher_info
@@ -29,6 +32,8 @@ from ..warehouse import WarehouseClickAndCollectOption
 from ..warehouse.models import Warehouse
 
 if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
     from ..account.models import Address, User
     from ..channel.models import Channel
     from ..discount.interface import VoucherInfo
@@ -223,6 +228,119 @@ def get_delivery_method_info(
     raise NotImplementedError()
 
 
+@dataclass
+class CheckoutLineData:
+    """Checkout line along with the related objects fetched in the same query."""
+
+    line: "CheckoutLine"
+    variant_channel_listing: Optional["ProductVariantChannelListing"]
+    product_channel_listing: Optional["ProductChannelListing"]
+    collections: List["Collection"]
+    discounts: List["CheckoutLineDiscount"]
+
+    @property
+    def tax_class(self) -> Optional["TaxClass"]:
+        product = self.line.variant.product
+        return product.tax_class or product.product_type.tax_class
+
+
+def fetch_checkout_lines_data(
+    lines: "QuerySet[CheckoutLine]",
+    prefetch_variant_attributes: bool = False,
+) -> List[CheckoutLineData]:
+    """Fetch checkout lines with everything needed to calculate their prices.
+
+    Variants, products, product types and tax classes are joined to the lines, while
+    channel listings in the checkout channel, collections and discounts are
+    aggregated to JSON in subqueries. Country rates of the tax classes are fetched
+    with one more query.
+    """
+    from ..discount.models import CheckoutLineDiscount
+    from ..product.models import (
+        Collection,
+        CollectionProduct,
+        ProductChannelListing,
+        ProductVariantChannelListing,
+    )
+
+    variant_channel_listings = ProductVariantChannelListing.objects.filter(
+        variant_id=OuterRef("variant_id"), channel_id=OuterRef("checkout__channel_id")
+    ).values(data=model_json_object(ProductVariantChannelListing))
+    product_channel_listings = ProductChannelListing.objects.filter(
+        product_id=OuterRef("variant__product_id"),
+        channel_id=OuterRef("checkout__channel_id"),
+    ).values(data=model_json_object(ProductChannelListing))
+    collections = (
+        CollectionProduct.objects.filter(product_id=OuterRef("variant__product_id"))
+        .values("product_id")
+        .annotate(
+            data=JSONBAgg(
+                model_json_object(Collection, prefix="collection__"), ordering="id"
+            )
+        )
+        .values("data")
+    )
+    discounts = (
+        CheckoutLineDiscount.objects.filter(line_id=OuterRef("pk"))
+        .values("line_id")
+        .annotate(
+            data=JSONBAgg(
+                model_json_object(CheckoutLineDiscount),
+                ordering=("created_at", "id"),
+            )
+        )
+        .values("data")
+    )
+    lines = lines.select_related(
+        "variant__product__product_type__tax_class", "variant__product__tax_class"
+    ).annotate(
+        variant_channel_listing_data=Subquery(variant_channel_listings[:1]),
+        product_channel_listing_data=Subquery(product_channel_listings[:1]),
+        collections_data=Subquery(collections),
+        discounts_data=Subquery(discounts),
+    )
+    if prefetch_variant_attributes:
+        lines = lines.prefetch_related(
+            "variant__attributes__assignment__attribute",
+            "variant__attributes__values",
+        )
+
+    lines_data = []
+    for line in lines:
+        using = line._state.db
+        variant_channel_listing_data = line.variant_channel_listing_data
+        product_channel_listing_data = line.product_channel_listing_data
+        lines_data.append(
+            CheckoutLineData(
+                line=line,
+                variant_channel_listing=model_from_json(
+                    ProductVariantChannelListing, variant_channel_listing_data, using
+                )
+                if variant_channel_listing_data
+                else None,
+                product_channel_listing=model_from_json(
+                    ProductChannelListing, product_channel_listing_data, using
+                )
+                if product_channel_listing_data
+                else None,
+                collections=[
+                    model_from_json(Collection, data, using)
+                    for data in line.collections_data or []
+                ],
+                discounts=[
+                    model_from_json(CheckoutLineDiscount, data, using)
+                    for data in line.discounts_data or []
+                ],
+            )
+        )
+
+    tax_classes = [
+        line_data.tax_class for line_data in lines_data if line_data.tax_class
+    ]
+    prefetch_related_objects(tax_classes, "country_rates")
+    return lines_data
+
+
 def fetch_checkout_lines(
     checkout: "Checkout",
     prefetch_variant_attributes: bool = False,
@@ -233,74 +351,38 @@ def fetch_checkout_lines(
     """Fetch checkout lines as CheckoutLineInfo objects."""
     from .utils import get_voucher_for_checkout
 
-    select_related_fields = ["variant__product__product_type__tax_class"]
-    prefetch_related_fields = [
-        "variant__product__collections",
-        "variant__product__channel_listings__channel",
-        "variant__product__product_type__tax_class__country_rates",
-        "variant__product__tax_class__country_rates",
-        "variant__channel_listings__channel",
-        "discounts",
-    ]
-    if prefetch_variant_attributes:
-        prefetch_related_fields.extend(
-            [
-                "variant__attributes__assignment__attribute",
-                "variant__attributes__values",
-            ]
-        )
-    lines = checkout.lines.select_related(*select_related_fields).prefetch_related(
-        *prefetch_related_fields
-    )
     lines_info = []
     unavailable_variant_pks = []
-    product_channel_listing_mapping: Dict[int, Optional["ProductChannelListing"]] = {}
     channel = checkout.channel
 
-    for line in lines:
+    for line_data in fetch_checkout_lines_data(
+        checkout.lines.all(), prefetch_variant_attributes
+    ):
+        line = line_data.line
         variant = line.variant
         product = variant.product
-        product_type = product.product_type
-        collections = list(product.collections.all())
-        discounts = list(line.discounts.all())
-
-        variant_channel_listing = _get_variant_channel_listing(
-            variant, checkout.channel_id
+        variant_channel_listing = line_data.variant_channel_listing
+        line_info = CheckoutLineInfo(
+            line=line,
+            variant=variant,
+            channel_listing=variant_channel_listing,  # type: ignore[arg-type]
+            product=product,
+            product_type=product.product_type,
+            collections=line_data.collections,
+            tax_class=line_data.tax_class,
+            discounts=line_data.discounts,
+            channel=channel,
         )
 
         if not skip_recalculation and not _is_variant_valid(
-            checkout, product, variant_channel_listing, product_channel_listing_mapping
+            variant_channel_listing, line_data.product_channel_listing
         ):
             unavailable_variant_pks.append(variant.pk)
             if not skip_lines_with_unavailable_variants:
-                lines_info.append(
-                    CheckoutLineInfo(
-                        line=line,
-                        variant=variant,
-                        channel_listing=variant_channel_listing,
-                        product=product,
-                        product_type=product_type,
-                        collections=collections,
-                        tax_class=product.tax_class or product_type.tax_class,
-                        discounts=discounts,
-                        channel=channel,
-                    )
-                )
+                lines_info.append(line_info)
             continue
 
-        lines_info.append(
-            CheckoutLineInfo(
-                line=line,
-                variant=variant,
-                channel_listing=variant_channel_listing,
-                product=product,
-                product_type=product_type,
-                collections=collections,
-                tax_class=product.tax_class or product_type.tax_class,
-                discounts=discounts,
-                channel=channel,
-            )
-        )
+        lines_info.append(line_info)
 
     if not skip_recalculation and checkout.voucher_code and lines_info:
         if not voucher:
@@ -317,27 +399,13 @@ def fetch_checkout_lines(
     return lines_info, unavailable_variant_pks
 
 
-def _get_variant_channel_listing(variant: "ProductVariant", channel_id: int):
-    variant_channel_listing = None
-    for channel_listing in variant.channel_listings.all():
-        if channel_listing.channel_id == channel_id:
-            variant_channel_listing = channel_listing
-    return variant_channel_listing
-
-
 def _is_variant_valid(
-    checkout: "Checkout",
-    product: "Product",
-    variant_channel_listing: "ProductVariantChannelListing",
-    product_channel_listing_mapping: dict,
+    variant_channel_listing: Optional["ProductVariantChannelListing"],
+    product_channel_listing: Optional["ProductChannelListing"],
 ):
     if not variant_channel_listing or variant_channel_listing.price is None:
         return False
 
-    product_channel_listing = _get_product_channel_listing(
-        product_channel_listing_mapping, checkout.channel_id, product
-    )
-
     if (
         not product_channel_listing
         or product_channel_listing.is_available_for_purchase() is False
@@ -348,18 +416,6 @@ def _is_variant_valid(
     return True
 
 
-def _get_product_channel_listing(
-    product_channel_listing_mapping: dict, channel_id: int, product: "Product"
-):
-    product_channel_listing = product_channel_listing_mapping.get(product.id)
-    if product.id not in product_channel_listing_mapping:
-        for channel_listing in product.channel_listings.all():
-            if channel_listing.channel_id == channel_id:
-                product_channel_listing = channel_listing
-        product_channel_listing_mapping[product.id] = product_channel_listing
-    return product_channel_listing
-
-
 def apply_voucher_to_checkout_line(
     voucher_info: "VoucherInfo",
     checkout: "Checkout",
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.20 on 2026-10-18 23:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checkout", "0059_merge_0058"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="checkout",
+            name="price_fingerprint",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
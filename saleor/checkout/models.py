@@ -153,6 +153,8 @@ class Checkout(models.Model):
     )
 
     price_expiration = models.DateTimeField(default=timezone.now)
+    # Hash of the pricing inputs the stored prices were calculated from.
+    price_fingerprint = models.CharField(max_length=64, blank=True, default="")
 
     discount_amount = models.DecimalField(
         max_digits=settings.DEFAULT_MAX_DIGITS,
@@ -482,3 +482,94 @@ def test_fetch_checkout_prices_when_tax_exemption_and_not_include_taxes_in_price
 
     assert checkout.total == shipping_price + all_lines_total_price
     assert checkout.subtotal == all_lines_total_price
+
+
+@patch(
+    "saleor.checkout.calculations.update_checkout_prices_with_flat_rates",
+    wraps=update_checkout_prices_with_flat_rates,
+)
+def test_fetch_checkout_data_skips_recalculation_when_inputs_unchanged(
+    mocked_update_checkout_prices_with_flat_rates,
+    checkout_with_items,
+    fetch_kwargs,
+    django_assert_num_queries,
+):
+    # given
+    checkout = checkout_with_items
+    tc = checkout.channel.tax_configuration
+    tc.country_exceptions.all().delete()
+    tc.tax_calculation_strategy = TaxCalculationStrategy.FLAT_RATES
+    tc.save()
+    fetch_checkout_data(**fetch_kwargs)
+    mocked_update_checkout_prices_with_flat_rates.reset_mock()
+    checkout.price_expiration = timezone.now()
+
+    # when
+    with django_assert_num_queries(0):
+        fetch_checkout_data(**fetch_kwargs)
+
+    # then
+    mocked_update_checkout_prices_with_flat_rates.assert_not_called()
+    assert checkout.price_fingerprint
+
+
+@patch(
+    "saleor.checkout.calculations.update_checkout_prices_with_flat_rates",
+    wraps=update_checkout_prices_with_flat_rates,
+)
+def test_fetch_checkout_data_recalculates_when_line_quantity_changed(
+    mocked_update_checkout_prices_with_flat_rates,
+    checkout_with_items,
+    fetch_kwargs,
+):
+    # given
+    checkout = checkout_with_items
+    tc = checkout.channel.tax_configuration
+    tc.country_exceptions.all().delete()
+    tc.tax_calculation_strategy = TaxCalculationStrategy.FLAT_RATES
+    tc.save()
+    fetch_checkout_data(**fetch_kwargs)
+    fingerprint = checkout.price_fingerprint
+    mocked_update_checkout_prices_with_flat_rates.reset_mock()
+
+    line = fetch_kwargs["lines"][0].line
+    line.quantity += 1
+    line.save(update_fields=["quantity"])
+    checkout.price_expiration = timezone.now()
+
+    # when
+    fetch_checkout_data(**fetch_kwargs)
+    checkout.refresh_from_db()
+
+    # then
+    mocked_update_checkout_prices_with_flat_rates.assert_called_once()
+    assert checkout.price_fingerprint != fingerprint
+
+
+@patch(
+    "saleor.checkout.calculations.update_checkout_prices_with_flat_rates",
+    wraps=update_checkout_prices_with_flat_rates,
+)
+def test_fetch_checkout_data_recalculates_when_tax_rates_changed(
+    mocked_update_checkout_prices_with_flat_rates,
+    checkout_with_items,
+    fetch_kwargs,
+):
+    # given
+    checkout = checkout_with_items
+    tc = checkout.channel.tax_configuration
+    tc.country_exceptions.all().delete()
+    tc.tax_calculation_strategy = TaxCalculationStrategy.FLAT_RATES
+    tc.save()
+    fetch_checkout_data(**fetch_kwargs)
+    mocked_update_checkout_prices_with_flat_rates.reset_mock()
+
+    tax_class = fetch_kwargs["lines"][0].tax_class
+    tax_class.country_rates.update_or_create(country=checkout.country, rate=10)
+    checkout.price_expiration = timezone.now()
+
+    # when
+    fetch_checkout_data(**fetch_kwargs)
+
+    # then
+    mocked_update_checkout_prices_with_flat_rates.assert_called_once()
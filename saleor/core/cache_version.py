@@ -0,0 +1,41 @@
+"""Version stamps of the data cached in the memory of each process.
+
+Data kept in the process memory is stored along with the version stamp read from
+the shared cache and reused as long as the stamp doesn't change. Invalidating the
+stamp makes every process reload the data on the next use.
+"""
+from typing import Callable
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_version(key: str) -> str:
+    """Return the version stamp stored under the key, generating it if missing."""
+    version = cache.get(key)
+    if version is None:
+        version = str(uuid4())
+        if not cache.add(key, version, None):
+            version = cache.get(key) or version
+    return version
+
+
+def invalidate(key: str):
+    # A new version stamp is generated by the first process that reads it.
+    cache.delete(key)
+
+
+def invalidate_on_commit(key: str) -> Callable[..., None]:
+    """Return a signal receiver that invalidates the version stamp.
+
+    The stamp is invalidated right away so the current process sees the change and
+    once again after commit, so other processes can't cache the state from before
+    it. Keep a reference to the receiver, as signals hold receivers weakly.
+    """
+
+    def receiver(sender, **kwargs):
+        invalidate(key)
+        transaction.on_commit(lambda: invalidate(key))
+
+    return receiver
@@ -1,7 +1,10 @@
+import base64
 import json
-from typing import Callable
+import zlib
+from typing import Callable, Optional
 
-from django.db.models import JSONField
+from django.conf import settings
+from django.db.models import JSONField, TextField
 
 
 class SanitizedJSONField(JSONField):
@@ -20,3 +23,38 @@ class SanitizedJSONField(JSONField):
     def get_db_prep_save(self, value: dict, connection):
         """Sanitize the value for saving using the passed sanitizer."""
         return json.dumps(self._sanitizer_method(value))
+
+
+class CompressedTextField(TextField):
+    description = "A text field which long values are stored compressed."
+
+    # Compressed values are stored as base64 encoded zlib data after this prefix,
+    # which distinguishes them from the values stored as plain text.
+    COMPRESSED_PREFIX = "zlib:"
+
+    def __init__(self, *args, threshold_setting: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threshold_setting = threshold_setting
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["threshold_setting"] = self.threshold_setting
+        return name, path, args, kwargs
+
+    def get_prep_value(self, value):
+        """Compress values at least as long as the threshold from settings."""
+        value = super().get_prep_value(value)
+        threshold: Optional[int] = getattr(settings, self.threshold_setting, None)
+        if value is None or not threshold or len(value) < threshold:
+            return value
+        compressed = zlib.compress(value.encode("utf-8"))
+        return self.COMPRESSED_PREFIX + base64.b64encode(compressed).decode("ascii")
+
+    def from_db_value(self, value, expression, connection):
+        return self.to_python(value)
+
+    def to_python(self, value):
+        if isinstance(value, str) and value.startswith(self.COMPRESSED_PREFIX):
+            compressed = base64.b64decode(value[len(self.COMPRESSED_PREFIX) :])
+            return zlib.decompress(compressed).decode("utf-8")
+        return super().to_python(value)
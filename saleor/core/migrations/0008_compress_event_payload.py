@@ -0,0 +1,20 @@
+# Generated by Django 3.2.20 on 2026-10-18 23:13
+
+from django.db import migrations
+import saleor.core.db.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0007_delete_celerytask"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="eventpayload",
+            name="payload",
+            field=saleor.core.db.fields.CompressedTextField(
+                threshold_setting="EVENT_PAYLOAD_COMPRESSION_THRESHOLD"
+            ),
+        ),
+    ]
@@ -7,6 +7,7 @@ from django.db import models, transaction
 from django.db.models import F, JSONField, Max, Q
 
 from . import EventDeliveryStatus, JobStatus
+from .db.fields import CompressedTextField
 from .utils.json_serializer import CustomJsonEncoder
 
 
@@ -143,7 +144,9 @@ class Job(models.Model):
 
 
 class EventPayload(models.Model):
-    payload = models.TextField()
+    payload = CompressedTextField(
+        threshold_setting="EVENT_PAYLOAD_COMPRESSION_THRESHOLD"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
 
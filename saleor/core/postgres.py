@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 from django.conf import settings
 from django.contrib.postgres.search import (
@@ -7,7 +7,10 @@ from django.contrib.postgres.search import (
     SearchVector,
     SearchVectorCombinable,
 )
-from django.db.models import Expression
+from django.db.models import CharField, DecimalField, Expression, F, Model
+from django.db.models.functions import Cast, JSONObject
+
+M = TypeVar("M", bound=Model)
 
 logger = logging.getLogger(__name__)
 
@@ -139,3 +142,29 @@ class FlatConcat(Expression):
 class FlatConcatSearchVector(FlatConcat):
     max_expression_count = settings.INDEX_MAXIMUM_EXPR_COUNT
     silent_drop_expression = True
+
+
+def model_json_object(model: Type[Model], prefix: str = "") -> JSONObject:
+    """Return an expression building a JSON object of all concrete model fields.
+
+    Use it to fetch related objects in a subquery of the main query instead of
+    running a separate query for them. Decimals are converted to strings, so they
+    don't lose precision. The objects are restored with `model_from_json`.
+    """
+    values: Dict[str, Any] = {}
+    for field in model._meta.concrete_fields:
+        value: Any = F(f"{prefix}{field.attname}")
+        if isinstance(field, DecimalField):
+            value = Cast(value, output_field=CharField())
+        values[field.attname] = value
+    return JSONObject(**values)
+
+
+def model_from_json(model: Type[M], data: dict, using: str) -> M:
+    """Return the model instance from the JSON object built by `model_json_object`."""
+    fields = model._meta.concrete_fields
+    return model.from_db(
+        using,
+        [field.attname for field in fields],
+        [field.to_python(data[field.attname]) for field in fields],
+    )
@@ -0,0 +1,89 @@
+import logging
+import time
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+from django.contrib.postgres.search import SearchVector
+from django.db.models import Model, QuerySet, Value
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=Model)
+
+# Approximate size of the search data prepared in a single batch. The batch size
+# is adjusted to it after each batch, so instances with a lot of searchable data
+# (e.g. products with many variants and attributes) are indexed in smaller batches.
+MAX_BATCH_BYTES = 4 * 1024 * 1024
+
+
+def update_search_data_in_batches(
+    queryset: "QuerySet[M]",
+    update_batch: Callable[[List[M]], int],
+    *,
+    batch_size: int,
+    max_batch_size: int,
+    max_batch_bytes: int = MAX_BATCH_BYTES,
+    limit: Optional[int] = None,
+    max_duration: Optional[float] = None,
+) -> int:
+    """Update search data of the instances from the queryset in batches.
+
+    Instances are read in the primary key order, one batch at a time.
+    `update_batch` saves search data of the given instances and returns the size
+    of the indexed text, which is used to fit the next batch in `max_batch_bytes`.
+    No new batch is started after `limit` instances were processed or after
+    `max_duration` seconds. Return the number of processed instances.
+    """
+    model_name = queryset.model._meta.verbose_name_plural
+    queryset = queryset.order_by("pk")
+    processed_count = 0
+    last_pk = None
+    started_at = time.monotonic()
+    while limit is None or processed_count < limit:
+        if max_duration is not None and time.monotonic() - started_at >= max_duration:
+            break
+        if limit is not None:
+            batch_size = min(batch_size, limit - processed_count)
+        batch_qs = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+
+        start = time.monotonic()
+        instances = list(batch_qs[:batch_size])
+        if not instances:
+            break
+        batch_bytes = update_batch(instances)
+        duration = time.monotonic() - start
+
+        processed_count += len(instances)
+        last_pk = instances[-1].pk
+        logger.info(
+            "Updated search data of %d %s in %.3fs (%.1f/s, %d bytes).",
+            len(instances),
+            model_name,
+            duration,
+            len(instances) / duration if duration else 0,
+            batch_bytes,
+        )
+        if len(instances) < batch_size:
+            break
+        batch_size = get_next_batch_size(
+            len(instances), batch_bytes, max_batch_size, max_batch_bytes
+        )
+    return processed_count
+
+
+def get_next_batch_size(
+    batch_size: int, batch_bytes: int, max_batch_size: int, max_batch_bytes: int
+) -> int:
+    if not batch_bytes:
+        return max_batch_size
+    bytes_per_instance = batch_bytes / batch_size
+    return max(1, min(max_batch_size, int(max_batch_bytes / bytes_per_instance)))
+
+
+def get_search_vectors_size(search_vectors: Iterable[SearchVector]) -> int:
+    """Return the approximate size of the text indexed by the search vectors."""
+    size = 0
+    for search_vector in search_vectors:
+        for expression in search_vector.get_source_expressions():
+            if isinstance(expression, Value) and expression.value:
+                size += len(str(expression.value))
+    return size
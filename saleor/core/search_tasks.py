@@ -1,4 +1,5 @@
-from typing import List
+from functools import partial
+from typing import Callable, List
 
 from celery.utils.log import get_task_logger
 
@@ -13,6 +14,7 @@ from ..product.search import (
     prepare_product_search_vector_value,
 )
 from .postgres import FlatConcatSearchVector
+from .search_indexer import get_search_vectors_size, update_search_data_in_batches
 
 task_logger = get_task_logger(__name__)
 
@@ -21,117 +23,138 @@ BATCH_SIZE = 500
 # total time and memory usage. Should be tested after some time and adjusted by
 # running the task on different thresholds and measure memory usage, total time
 # and execution time of a single SQL statement.
+# The following batches are sized by the amount of indexed data, up to the
+# maximum below.
+MAX_BATCH_SIZE = 2000
+# The number of instances updated by a single task, the remaining instances
+# are updated by the next task.
+TASK_INSTANCES_LIMIT = 10000
 
 
 @app.task
 def set_user_search_document_values(updated_count: int = 0) -> None:
-    users = list(
-        User.objects.filter(search_document="")
-        .prefetch_related("addresses")
-        .order_by("-id")[:BATCH_SIZE]
+    users = User.objects.filter(search_document="").prefetch_related("addresses")
+    batch_count = update_search_data_in_batches(
+        users,
+        partial(
+            set_search_document_values,
+            prepare_search_document_func=prepare_user_search_document_value,
+        ),
+        batch_size=BATCH_SIZE,
+        max_batch_size=MAX_BATCH_SIZE,
+        limit=TASK_INSTANCES_LIMIT,
     )
 
-    if not users:
+    if not batch_count:
         task_logger.info("No users to update.")
         return
 
-    updated_count += set_search_document_values(
-        users, prepare_user_search_document_value
-    )
-
+    updated_count += batch_count
     task_logger.info("Updated %d users", updated_count)
 
-    if len(users) < BATCH_SIZE:
+    if batch_count < TASK_INSTANCES_LIMIT:
         task_logger.info("Setting user search document values finished.")
         return
 
-    del users
-
     set_user_search_document_values.delay(updated_count)
 
 
 @app.task
 def set_order_search_document_values(updated_count: int = 0) -> None:
-    orders = list(
-        Order.objects.filter(search_vector=None)
-        .prefetch_related(
-            "user",
-            "billing_address",
-            "shipping_address",
-            "payments",
-            "discounts",
-            "lines",
-        )
-        .order_by("-number")[:BATCH_SIZE]
+    orders = Order.objects.filter(search_vector=None).prefetch_related(
+        "user",
+        "billing_address",
+        "shipping_address",
+        "payments",
+        "discounts",
+        "lines",
+    )
+    batch_count = update_search_data_in_batches(
+        orders,
+        partial(
+            set_search_vector_values,
+            prepare_search_vector_func=prepare_order_search_vector_value,
+        ),
+        batch_size=BATCH_SIZE,
+        max_batch_size=MAX_BATCH_SIZE,
+        limit=TASK_INSTANCES_LIMIT,
     )
 
-    if not orders:
+    if not batch_count:
         task_logger.info("No orders to update.")
         return
 
-    updated_count += set_search_vector_values(orders, prepare_order_search_vector_value)
-
+    updated_count += batch_count
     task_logger.info("Updated %d orders", updated_count)
 
-    if len(orders) < BATCH_SIZE:
+    if batch_count < TASK_INSTANCES_LIMIT:
         task_logger.info("Setting order search document values finished.")
         return
 
-    del orders
-
     set_order_search_document_values.delay(updated_count)
 
 
 @app.task
 def set_product_search_document_values(updated_count: int = 0) -> None:
-    products = list(
-        Product.objects.filter(search_vector=None)
-        .prefetch_related(*PRODUCT_FIELDS_TO_PREFETCH)
-        .order_by("-id")[:BATCH_SIZE]
+    products = Product.objects.filter(search_vector=None).prefetch_related(
+        *PRODUCT_FIELDS_TO_PREFETCH
+    )
+    batch_count = update_search_data_in_batches(
+        products,
+        partial(
+            set_search_vector_values,
+            prepare_search_vector_func=prepare_product_search_vector_value,
+        ),
+        batch_size=BATCH_SIZE,
+        max_batch_size=MAX_BATCH_SIZE,
+        limit=TASK_INSTANCES_LIMIT,
     )
 
-    if not products:
+    if not batch_count:
         task_logger.info("No products to update.")
         return
 
-    updated_count += set_search_vector_values(
-        products,
-        prepare_product_search_vector_value,
-    )
-
+    updated_count += batch_count
     task_logger.info("Updated %d products", updated_count)
 
-    if len(products) < BATCH_SIZE:
+    if batch_count < TASK_INSTANCES_LIMIT:
         task_logger.info("Setting product search document values finished.")
         return
 
-    del products
-
     set_product_search_document_values.delay(updated_count)
 
 
-def set_search_document_values(instances: List, prepare_search_document_func):
+def set_search_document_values(
+    instances: List, prepare_search_document_func: Callable
+) -> int:
+    """Set search documents of the instances and return their total length."""
     if not instances:
         return 0
     Model = instances[0]._meta.model
+    indexed_size = 0
     for instance in instances:
         instance.search_document = prepare_search_document_func(
             instance, already_prefetched=True
         )
+        indexed_size += len(instance.search_document)
     Model.objects.bulk_update(instances, ["search_document"])
 
-    return len(instances)
+    return indexed_size
 
 
 def set_search_vector_values(
-    instances,
-    prepare_search_vector_func,
-):
+    instances: List,
+    prepare_search_vector_func: Callable,
+) -> int:
+    """Set search vectors of the instances and return the size of indexed text."""
+    if not instances:
+        return 0
     Model = instances[0]._meta.model
+    indexed_size = 0
     for instance in instances:
-        instance.search_vector = FlatConcatSearchVector(
-            *prepare_search_vector_func(instance, already_prefetched=True)
-        )
+        search_vectors = prepare_search_vector_func(instance, already_prefetched=True)
+        indexed_size += get_search_vectors_size(search_vectors)
+        instance.search_vector = FlatConcatSearchVector(*search_vectors)
     Model.objects.bulk_update(instances, ["search_vector"])
 
-    return len(instances)
+    return indexed_size
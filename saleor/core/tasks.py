@@ -25,21 +25,38 @@ def delete_from_storage_task(path):
 
 
 @app.task
-def delete_event_payloads_task(expiration_date=None):
+def delete_event_payloads_task(expiration_date=None, start_pk=None):
+    """Delete expired event payloads in ranges of primary keys, from the oldest.
+
+    Payloads are deleted when they were created before the delete period and none of
+    their deliveries was created within it. As primary keys grow with the creation
+    time, the task stops at the first range containing a payload that isn't expired.
+    """
     expiration_date = expiration_date or timezone.now() + datetime.timedelta(minutes=60)
     delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    first_pk = (
+        EventPayload.objects.filter(pk__gte=start_pk or 0)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+        .first()
+    )
+    if first_pk is None:
+        return
+
+    payloads_range = EventPayload.objects.filter(
+        pk__gte=first_pk, pk__lt=first_pk + BATCH_SIZE
+    )
     valid_deliveries = EventDelivery.objects.filter(created_at__gt=delete_period)
-    payloads_to_delete = EventPayload.objects.filter(
+    payloads_range.filter(created_at__lte=delete_period).filter(
         ~Exists(valid_deliveries.filter(payload_id=OuterRef("id")))
-    ).order_by("-pk")
-    ids = payloads_to_delete.values_list("pk", flat=True)[:BATCH_SIZE]
-    qs = EventPayload.objects.filter(pk__in=ids)
-    if ids:
-        if expiration_date > timezone.now():
-            qs.delete()
-            delete_event_payloads_task.delay(expiration_date)
-        else:
-            task_logger.warning("Task invocation time limit reached, aborting task")
+    ).delete()
+    if payloads_range.filter(created_at__gt=delete_period).exists():
+        return
+
+    if expiration_date > timezone.now():
+        delete_event_payloads_task.delay(expiration_date, first_pk + BATCH_SIZE)
+    else:
+        task_logger.warning("Task invocation time limit reached, aborting task")
 
 
 @app.task(
@@ -0,0 +1,47 @@
+from django.core.cache import cache
+
+from ..cache_version import get_version, invalidate, invalidate_on_commit
+
+VERSION_CACHE_KEY = "test_cache_version"
+
+
+def test_get_version_returns_stored_version():
+    # given
+    invalidate(VERSION_CACHE_KEY)
+    version = get_version(VERSION_CACHE_KEY)
+
+    # when
+    same_version = get_version(VERSION_CACHE_KEY)
+
+    # then
+    assert same_version == version
+    assert cache.get(VERSION_CACHE_KEY) == version
+
+
+def test_invalidate_changes_version():
+    # given
+    version = get_version(VERSION_CACHE_KEY)
+
+    # when
+    invalidate(VERSION_CACHE_KEY)
+
+    # then
+    assert get_version(VERSION_CACHE_KEY) != version
+
+
+def test_invalidate_on_commit_receiver_invalidates_now_and_after_commit(
+    db, django_capture_on_commit_callbacks
+):
+    # given
+    receiver = invalidate_on_commit(VERSION_CACHE_KEY)
+    version = get_version(VERSION_CACHE_KEY)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        receiver(sender=None)
+        version_before_commit = get_version(VERSION_CACHE_KEY)
+
+    # then
+    assert len(callbacks) == 1
+    assert version_before_commit != version
+    assert get_version(VERSION_CACHE_KEY) != version_before_commit
@@ -0,0 +1,41 @@
+from ..db.fields import CompressedTextField
+from ..models import EventPayload
+
+
+def test_compressed_text_field_stores_long_value_compressed(settings):
+    # given
+    settings.EVENT_PAYLOAD_COMPRESSION_THRESHOLD = 10
+    payload = '{"key": "' + "value" * 100 + '"}'
+
+    # when
+    event_payload = EventPayload.objects.create(payload=payload)
+
+    # then
+    stored_value = EventPayload.objects.filter(pk=event_payload.pk).values_list(
+        "payload", flat=True
+    )
+    raw_value = EventPayload.objects.raw(
+        "SELECT id, payload::text AS raw FROM core_eventpayload WHERE id = %s",
+        [event_payload.pk],
+    )[0].raw
+    assert raw_value.startswith(CompressedTextField.COMPRESSED_PREFIX)
+    assert len(raw_value) < len(payload)
+    assert stored_value.get() == payload
+    assert EventPayload.objects.get(pk=event_payload.pk).payload == payload
+
+
+def test_compressed_text_field_stores_short_value_as_text(settings):
+    # given
+    settings.EVENT_PAYLOAD_COMPRESSION_THRESHOLD = 1000
+    payload = '{"key": "value"}'
+
+    # when
+    event_payload = EventPayload.objects.create(payload=payload)
+
+    # then
+    raw_value = EventPayload.objects.raw(
+        "SELECT id, payload::text AS raw FROM core_eventpayload WHERE id = %s",
+        [event_payload.pk],
+    )[0].raw
+    assert raw_value == payload
+    assert EventPayload.objects.get(pk=event_payload.pk).payload == payload
@@ -0,0 +1,91 @@
+from django.db.models import Value
+
+from ...product.models import Product
+from ..postgres import NoValidationSearchVector
+from ..search_indexer import (
+    get_next_batch_size,
+    get_search_vectors_size,
+    update_search_data_in_batches,
+)
+
+
+def test_update_search_data_in_batches(product_list):
+    # given
+    batches = []
+
+    def update_batch(instances):
+        batches.append([instance.pk for instance in instances])
+        return 0
+
+    # when
+    processed_count = update_search_data_in_batches(
+        Product.objects.all(), update_batch, batch_size=2, max_batch_size=2
+    )
+
+    # then
+    product_pks = sorted(product.pk for product in product_list)
+    assert processed_count == len(product_list)
+    assert batches == [product_pks[:2], product_pks[2:]]
+
+
+def test_update_search_data_in_batches_adjusts_batch_size(product_list):
+    # given
+    batches = []
+
+    def update_batch(instances):
+        batches.append(len(instances))
+        return 100 * len(instances)
+
+    # when
+    update_search_data_in_batches(
+        Product.objects.all(),
+        update_batch,
+        batch_size=1,
+        max_batch_size=10,
+        max_batch_bytes=200,
+    )
+
+    # then
+    assert batches == [1, 2]
+
+
+def test_update_search_data_in_batches_with_limit(product_list):
+    # given
+    batches = []
+
+    def update_batch(instances):
+        batches.append(len(instances))
+        return 0
+
+    # when
+    processed_count = update_search_data_in_batches(
+        Product.objects.all(), update_batch, batch_size=2, max_batch_size=2, limit=1
+    )
+
+    # then
+    assert processed_count == 1
+    assert batches == [1]
+
+
+def test_get_next_batch_size():
+    assert get_next_batch_size(100, 1000, 500, 100) == 10
+    assert get_next_batch_size(100, 1000, 500, 100000) == 500
+    assert get_next_batch_size(100, 1000, 500, 1) == 1
+    assert get_next_batch_size(100, 0, 500, 100) == 500
+
+
+def test_get_search_vectors_size():
+    # given
+    search_vectors = [
+        NoValidationSearchVector(Value("name"), config="simple", weight="A"),
+        NoValidationSearchVector(
+            Value("sku"), Value("variant"), config="simple", weight="A"
+        ),
+        NoValidationSearchVector(Value(None), config="simple", weight="C"),
+    ]
+
+    # when
+    size = get_search_vectors_size(search_vectors)
+
+    # then
+    assert size == len("name") + len("sku") + len("variant")
@@ -1,4 +1,5 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.core.files.storage import default_storage
 from django.utils import timezone
@@ -59,6 +60,37 @@ def test_delete_event_payloads_task(webhook, settings):
     assert EventDeliveryAttempt.objects.count() == 1
 
 
+@patch("saleor.core.tasks.BATCH_SIZE", 1)
+def test_delete_event_payloads_task_in_ranges(webhook, settings):
+    # given
+    delete_period = settings.EVENT_PAYLOAD_DELETE_PERIOD
+    start_time = timezone.now()
+    before_delete_period = start_time - delete_period - timedelta(seconds=1)
+    after_delete_period = start_time - delete_period + timedelta(seconds=1)
+    with freeze_time(before_delete_period):
+        expired_payloads = EventPayload.objects.bulk_create(
+            [EventPayload(payload="{}") for _ in range(3)]
+        )
+        retried_payload = EventPayload.objects.create(payload="{}")
+    with freeze_time(after_delete_period):
+        EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY,
+            payload=retried_payload,
+            webhook=webhook,
+        )
+        payload = EventPayload.objects.create(payload="{}")
+
+    # when
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+
+    # then
+    assert not EventPayload.objects.filter(
+        pk__in=[expired_payload.pk for expired_payload in expired_payloads]
+    ).exists()
+    assert set(EventPayload.objects.all()) == {retried_payload, payload}
+
+
 def test_delete_files_from_storage_task(
     product_with_image, variant_with_image, media_root
 ):
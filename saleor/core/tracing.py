@@ -19,7 +19,7 @@ def opentracing_trace(span_name, component_name, service_name):
         span = scope.span
         span.set_tag(opentracing.tags.COMPONENT, component_name)
         span.set_tag("service.name", service_name)
-        yield
+        yield span
 
 
 @contextmanager
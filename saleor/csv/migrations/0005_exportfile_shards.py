@@ -0,0 +1,33 @@
+# Generated by Django 3.2.20 on 2026-10-18 22:27
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("csv", "0004_auto_20210709_1043"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportfile",
+            name="completed_shards",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.PositiveIntegerField(),
+                blank=True,
+                default=list,
+                size=None,
+            ),
+        ),
+        migrations.AddField(
+            model_name="exportfile",
+            name="parts_token",
+            field=models.UUIDField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="exportfile",
+            name="total_shards",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
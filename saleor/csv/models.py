@@ -1,3 +1,4 @@
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.db.models import JSONField
 from django.utils import timezone
@@ -17,6 +18,13 @@ class ExportFile(Job):
         App, related_name="export_files", on_delete=models.CASCADE, null=True
     )
     content_file = models.FileField(upload_to="export_files", null=True)
+    # Progress of the export split into shards processed by separate tasks.
+    total_shards = models.PositiveIntegerField(default=0)
+    completed_shards = ArrayField(
+        models.PositiveIntegerField(), default=list, blank=True
+    )
+    # Random name of the directory with parts of the file exported by the shards.
+    parts_token = models.UUIDField(null=True, blank=True, editable=False)
 
 
 class ExportEvent(models.Model):
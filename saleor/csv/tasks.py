@@ -1,9 +1,11 @@
 from typing import Dict, Union
+from uuid import uuid4
 
 import celery
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.files.storage import default_storage
+from django.db import transaction
 from django.db.models import Q
 from django.db.models.expressions import Exists, OuterRef
 from django.utils import timezone
@@ -13,7 +15,15 @@ from ..core import JobStatus
 from . import events
 from .models import ExportEvent, ExportFile
 from .notifications import send_export_failed_info
-from .utils.export import export_gift_cards, export_products
+from .utils.export import (
+    delete_abandoned_export_file_parts,
+    delete_export_file_parts,
+    export_gift_cards,
+    export_products,
+    export_products_shard,
+    get_products_export_shards,
+    merge_products_export_parts,
+)
 
 task_logger = get_task_logger(__name__)
 
@@ -22,16 +32,23 @@ class ExportTask(celery.Task):
     # should be updated when new export task is added
     TASK_NAME_TO_DATA_TYPE_MAPPING = {
         "export-products": "products",
+        "export-products-shard": "products",
         "export-gift-cards": "gift cards",
     }
 
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         export_file_id = args[0]
-        export_file = ExportFile.objects.get(pk=export_file_id)
-
-        export_file.content_file = None
-        export_file.status = JobStatus.FAILED
-        export_file.save(update_fields=["status", "updated_at", "content_file"])
+        with transaction.atomic():
+            export_file = ExportFile.objects.select_for_update().get(pk=export_file_id)
+            if export_file.total_shards and export_file.status == JobStatus.FAILED:
+                # another shard of the export has already failed
+                return
+            export_file.content_file = None
+            export_file.status = JobStatus.FAILED
+            export_file.save(update_fields=["status", "updated_at", "content_file"])
+
+        # parts of the shards that are still processed are deleted by their tasks
+        delete_export_file_parts(export_file, export_file.completed_shards)
 
         events.export_failed_event(
             export_file=export_file,
@@ -50,8 +67,18 @@ class ExportTask(celery.Task):
         export_file_id = args[0]
 
         export_file = ExportFile.objects.get(pk=export_file_id)
-        export_file.status = JobStatus.SUCCESS
-        export_file.save(update_fields=["status", "updated_at"])
+        if export_file.total_shards:
+            # the export split into shards is finished by the task that merges them
+            if not export_file.content_file:
+                return
+            updated = ExportFile.objects.filter(
+                pk=export_file_id, status=JobStatus.PENDING
+            ).update(status=JobStatus.SUCCESS, updated_at=timezone.now())
+            if not updated:
+                return
+        else:
+            export_file.status = JobStatus.SUCCESS
+            export_file.save(update_fields=["status", "updated_at"])
         events.export_success_event(
             export_file=export_file, user=export_file.user, app=export_file.app
         )
@@ -66,7 +93,67 @@ def export_products_task(
     delimiter: str = ",",
 ):
     export_file = ExportFile.objects.get(pk=export_file_id)
-    export_products(export_file, scope, export_info, file_type, delimiter)
+    shards = get_products_export_shards(scope)
+    if len(shards) <= 1:
+        export_products(export_file, scope, export_info, file_type, delimiter)
+        return
+
+    export_file.total_shards = len(shards)
+    export_file.parts_token = uuid4()
+    export_file.save(update_fields=["total_shards", "parts_token", "updated_at"])
+    for shard_index, (first_pk, last_pk) in enumerate(shards):
+        export_products_shard_task.delay(
+            export_file_id,
+            shard_index,
+            first_pk,
+            last_pk,
+            scope,
+            export_info,
+            file_type,
+            delimiter,
+        )
+
+
+@app.task(name="export-products-shard", base=ExportTask)
+def export_products_shard_task(
+    export_file_id: int,
+    shard_index: int,
+    first_pk: int,
+    last_pk: int,
+    scope: Dict[str, Union[str, dict]],
+    export_info: Dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    export_file = ExportFile.objects.get(pk=export_file_id)
+    if export_file.status == JobStatus.FAILED:
+        return
+
+    export_products_shard(
+        export_file,
+        shard_index,
+        first_pk,
+        last_pk,
+        scope,
+        export_info,
+        file_type,
+        delimiter,
+    )
+
+    with transaction.atomic():
+        export_file = ExportFile.objects.select_for_update().get(pk=export_file_id)
+        if export_file.status == JobStatus.FAILED:
+            delete_export_file_parts(export_file, [shard_index])
+            return
+        if shard_index in export_file.completed_shards:
+            # the shard has already been completed by the previous run of the task
+            return
+        export_file.completed_shards.append(shard_index)
+        export_file.save(update_fields=["completed_shards", "updated_at"])
+
+    # the task that exported the last shard merges the parts into the export file
+    if set(export_file.completed_shards) == set(range(export_file.total_shards)):
+        merge_products_export_parts(export_file, export_info, file_type, delimiter)
 
 
 @app.task(name="export-gift-cards", base=ExportTask)
@@ -84,6 +171,10 @@ def export_gift_cards_task(
 def delete_old_export_files():
     now = timezone.now()
 
+    parts_counter = delete_abandoned_export_file_parts()
+    if parts_counter:
+        task_logger.debug("Delete %s parts of export files.", parts_counter)
+
     events = ExportEvent.objects.filter(
         date__lte=now - settings.EXPORT_FILES_TIMEDELTA,
     ).values("export_file_id")
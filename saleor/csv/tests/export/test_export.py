@@ -18,7 +18,6 @@ from ....graphql.product.filters import ProductFilter
 from ....product.models import Product, ProductChannelListing
 from ... import FileTypes
 from ...utils.export import (
-    append_to_file,
     create_file_with_headers,
     export_gift_cards,
     export_gift_cards_in_batches,
@@ -26,6 +25,8 @@ from ...utils.export import (
     export_products_in_batches,
     get_filename,
     get_queryset,
+    get_queryset_shards,
+    open_file_writer,
     parse_input,
     save_csv_file_in_export_file,
 )
@@ -521,6 +522,25 @@ def get_product_queryset_filter(product_list):
     assert queryset.count() == len(product_list) - 1
 
 
+def test_get_queryset_shards(product_list):
+    # given
+    pks = sorted(product.pk for product in product_list)
+
+    # when
+    shards = get_queryset_shards(Product.objects.all(), 2)
+
+    # then
+    assert shards == [(pks[0], pks[1]), (pks[2], pks[2])]
+
+
+def test_get_queryset_shards_for_empty_queryset(product_list):
+    # when
+    shards = get_queryset_shards(Product.objects.none(), 2)
+
+    # then
+    assert shards == []
+
+
 def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
     # given
     file_headers = ["id", "name", "collections"]
@@ -578,7 +598,7 @@ def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
+def test_open_file_writer_for_csv(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -593,7 +613,8 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     etl.tocsv(table, temp_file.name, delimiter=delimiter)
 
     # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
+    with open_file_writer(headers, temp_file, FileTypes.CSV, delimiter) as write_rows:
+        write_rows(export_data)
 
     # then
     user_export_file.refresh_from_db()
@@ -607,7 +628,7 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
+def test_open_file_writer_for_xlsx(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -623,7 +644,10 @@ def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
     etl.io.xlsx.toxlsx(table, temp_file.name)
 
     # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, ",")
+    with open_file_writer(
+        expected_headers, temp_file, FileTypes.XLSX, ","
+    ) as write_rows:
+        write_rows(export_data)
 
     # then
     user_export_file.refresh_from_db()
@@ -645,6 +669,31 @@ def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
+def test_open_file_writer_for_xlsx_keeps_rows_from_all_writes(
+    user_export_file, tmpdir, media_root
+):
+    # given
+    headers = ["id", "name"]
+    temp_file = create_file_with_headers(headers, ",", FileTypes.XLSX)
+
+    # when
+    with open_file_writer(headers, temp_file, FileTypes.XLSX, ",") as write_rows:
+        write_rows([{"id": "1", "name": "A"}])
+        write_rows(iter([{"id": "2"}, {"id": "3", "name": "C"}]))
+
+    # then
+    sheet = openpyxl.load_workbook(temp_file).active
+    assert list(sheet.values) == [
+        ("id", "name"),
+        ("1", "A"),
+        ("2", None),
+        ("3", "C"),
+    ]
+
+    temp_file.close()
+    shutil.rmtree(tmpdir)
+
+
 @patch("saleor.csv.utils.export.BATCH_SIZE", 1)
 def test_export_products_in_batches_for_csv(
     product_list,
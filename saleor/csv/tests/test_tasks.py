@@ -1,8 +1,12 @@
+import csv
 import datetime
 from unittest.mock import ANY, MagicMock, Mock, patch
+from uuid import uuid4
 
 import pytz
 from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.test import override_settings
 from django.utils import timezone
 from freezegun import freeze_time
@@ -14,8 +18,10 @@ from ..tasks import (
     ExportTask,
     delete_old_export_files,
     export_gift_cards_task,
+    export_products_shard_task,
     export_products_task,
 )
+from ..utils.export import export_products_shard, get_export_file_part_path
 
 
 @patch("saleor.csv.tasks.export_products")
@@ -58,6 +64,123 @@ def test_export_products_task_failed(
     send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
 
 
+@patch("saleor.csv.utils.export.send_export_download_link_notification")
+@patch("saleor.csv.utils.export.SHARD_SIZE", 2)
+def test_export_products_task_in_shards(
+    send_notification_mock, product_list, user_export_file, media_root
+):
+    # given
+    scope = {"all": ""}
+    export_info = {"fields": ["name"], "warehouses": [], "attributes": []}
+
+    # when
+    export_products_task.delay(user_export_file.id, scope, export_info, FileTypes.CSV)
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.SUCCESS
+    assert user_export_file.total_shards == 2
+    assert sorted(user_export_file.completed_shards) == [0, 1]
+
+    with user_export_file.content_file.open("r") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["id", "name"]
+    assert [row[1] for row in rows[1:]] == [
+        product.name for product in sorted(product_list, key=lambda p: p.pk)
+    ]
+
+    assert not default_storage.exists(get_export_file_part_path(user_export_file, 0))
+    send_notification_mock.assert_called_once_with(user_export_file, "products")
+    assert (
+        ExportEvent.objects.filter(
+            export_file=user_export_file, type=ExportEvents.EXPORT_SUCCESS
+        ).count()
+        == 1
+    )
+
+
+@patch("saleor.csv.tasks.send_export_failed_info")
+@patch("saleor.csv.tasks.export_products_shard")
+@patch("saleor.csv.utils.export.SHARD_SIZE", 1)
+def test_export_products_task_in_shards_failed(
+    export_products_shard_mock,
+    send_export_failed_info_mock,
+    product_list,
+    user_export_file,
+):
+    # given
+    scope = {"all": ""}
+    export_info = {"fields": ["name"], "warehouses": [], "attributes": []}
+    export_products_shard_mock.side_effect = Exception("Test error")
+
+    # when
+    export_products_task.delay(user_export_file.id, scope, export_info, FileTypes.CSV)
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.FAILED
+    assert user_export_file.completed_shards == []
+    # the remaining shards are skipped after the first one has failed
+    export_products_shard_mock.assert_called_once()
+    send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
+
+
+@patch("saleor.csv.tasks.merge_products_export_parts")
+def test_export_products_shard_task_retried_after_completion(
+    merge_products_export_parts_mock, product_list, user_export_file, media_root
+):
+    # given
+    product = product_list[0]
+    scope = {"all": ""}
+    export_info = {"fields": ["name"], "warehouses": [], "attributes": []}
+    user_export_file.total_shards = 2
+    user_export_file.completed_shards = [0]
+    user_export_file.parts_token = uuid4()
+    user_export_file.save()
+
+    # when
+    export_products_shard_task(
+        user_export_file.id, 0, product.pk, product.pk, scope, export_info, "csv"
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.completed_shards == [0]
+    merge_products_export_parts_mock.assert_not_called()
+
+
+def test_export_products_shard_task_deletes_part_when_export_failed(
+    product_list, user_export_file, media_root
+):
+    # given
+    product = product_list[0]
+    scope = {"all": ""}
+    export_info = {"fields": ["name"], "warehouses": [], "attributes": []}
+    user_export_file.total_shards = 2
+    user_export_file.parts_token = uuid4()
+    user_export_file.save()
+
+    def export_shard_while_other_shard_fails(*args):
+        export_products_shard(*args)
+        ExportFile.objects.filter(pk=user_export_file.pk).update(
+            status=JobStatus.FAILED
+        )
+
+    # when
+    with patch(
+        "saleor.csv.tasks.export_products_shard",
+        side_effect=export_shard_while_other_shard_fails,
+    ):
+        export_products_shard_task(
+            user_export_file.id, 1, product.pk, product.pk, scope, export_info, "csv"
+        )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.completed_shards == []
+    assert not default_storage.exists(get_export_file_part_path(user_export_file, 1))
+
+
 @patch("saleor.csv.tasks.export_gift_cards")
 def test_export_gift_cards_task(export_gift_cards_mock, user_export_file):
     # given
@@ -304,3 +427,34 @@ def test_delete_old_export_files(default_storage_delete_mock, staff_user):
             id__in=[export_file.id for export_file in not_expired_export_files]
         )
     ) == len(not_expired_export_files)
+
+
+def test_delete_old_export_files_deletes_abandoned_parts(staff_user, media_root):
+    # given
+    pending_export_file, failed_export_file = ExportFile.objects.bulk_create(
+        [
+            ExportFile(
+                user=staff_user,
+                status=JobStatus.PENDING,
+                total_shards=2,
+                parts_token=uuid4(),
+            ),
+            ExportFile(
+                user=staff_user,
+                status=JobStatus.FAILED,
+                total_shards=2,
+                parts_token=uuid4(),
+            ),
+        ]
+    )
+    for export_file in [pending_export_file, failed_export_file]:
+        default_storage.save(
+            get_export_file_part_path(export_file, 0), ContentFile(b"id,name")
+        )
+
+    # when
+    delete_old_export_files()
+
+    # then
+    assert default_storage.exists(get_export_file_part_path(pending_export_file, 0))
+    assert not default_storage.exists(get_export_file_part_path(failed_export_file, 0))
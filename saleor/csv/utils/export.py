@@ -1,18 +1,24 @@
+import csv
+import io
 import uuid
+from contextlib import contextmanager
 from datetime import date, datetime
 from tempfile import NamedTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, Dict, List, Set, Union
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, List, Set, Tuple, Union
 
+import openpyxl
 import petl as etl
+from django.core.files.storage import default_storage
 from django.utils import timezone
 
+from ...core import JobStatus
 from ...giftcard.models import GiftCard
 from ...plugins.manager import get_plugins_manager
 from ...product.models import Product
 from .. import FileTypes
 from ..notifications import send_export_download_link_notification
 from .product_headers import get_product_export_fields_and_headers_info
-from .products_data import get_products_data
+from .products_data import iter_products_data
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -22,6 +28,11 @@ if TYPE_CHECKING:
 
 BATCH_SIZE = 10000
 
+# Number of products exported by a single task when the export is split into shards.
+SHARD_SIZE = 50000
+
+EXPORT_FILE_PARTS_DIR = "export_files/parts"
+
 
 def export_products(
     export_file: "ExportFile",
@@ -62,6 +73,88 @@ def export_products(
     manager.product_export_completed(export_file)
 
 
+def get_products_export_shards(
+    scope: Dict[str, Union[str, dict]]
+) -> List[Tuple[int, int]]:
+    from ...graphql.product.filters import ProductFilter
+
+    queryset = get_queryset(Product, ProductFilter, scope)
+    return get_queryset_shards(queryset, SHARD_SIZE)
+
+
+def export_products_shard(
+    export_file: "ExportFile",
+    shard_index: int,
+    first_pk: int,
+    last_pk: int,
+    scope: Dict[str, Union[str, dict]],
+    export_info: Dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    """Export products from the given primary key range into a part of the file.
+
+    Parts are merged into the export file by `merge_products_export_parts` once
+    all shards are exported.
+    """
+    from ...graphql.product.filters import ProductFilter
+
+    queryset = get_queryset(Product, ProductFilter, scope).filter(
+        pk__gte=first_pk, pk__lte=last_pk
+    )
+
+    (
+        export_fields,
+        file_headers,
+        data_headers,
+    ) = get_product_export_fields_and_headers_info(export_info)
+
+    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+
+    export_products_in_batches(
+        queryset,
+        export_info,
+        set(export_fields),
+        data_headers,
+        delimiter,
+        temporary_file,
+        file_type,
+    )
+
+    part_path = get_export_file_part_path(export_file, shard_index)
+    # the shard task may be retried after the part has been saved
+    default_storage.delete(part_path)
+    default_storage.save(part_path, temporary_file)
+    temporary_file.close()
+
+
+def merge_products_export_parts(
+    export_file: "ExportFile",
+    export_info: Dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    file_name = get_filename("product", file_type)
+    _, file_headers, _ = get_product_export_fields_and_headers_info(export_info)
+
+    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+
+    part_paths = [
+        get_export_file_part_path(export_file, shard_index)
+        for shard_index in range(export_file.total_shards)
+    ]
+    append_parts_to_file(part_paths, temporary_file, file_type, delimiter)
+
+    save_csv_file_in_export_file(export_file, temporary_file, file_name)
+    temporary_file.close()
+    delete_export_file_parts(export_file, range(export_file.total_shards))
+
+    send_export_download_link_notification(export_file, "products")
+    manager = get_plugins_manager()
+
+    manager.product_export_completed(export_file)
+
+
 def export_gift_cards(
     export_file: "ExportFile",
     scope: Dict[str, Union[str, dict]],
@@ -169,21 +262,15 @@ def export_products_in_batches(
     attributes = export_info.get("attributes")
     channels = export_info.get("channels")
 
-    for batch_pks in queryset_in_batches(queryset):
-        product_batch = Product.objects.filter(pk__in=batch_pks).prefetch_related(
-            "attributes",
-            "variants",
-            "collections",
-            "media",
-            "product_type",
-            "category",
-        )
+    with open_file_writer(headers, temporary_file, file_type, delimiter) as write_rows:
+        for batch_pks in queryset_in_batches(queryset):
+            product_batch = Product.objects.filter(pk__in=batch_pks)
 
-        export_data = get_products_data(
-            product_batch, export_fields, attributes, warehouses, channels
-        )
+            export_data = iter_products_data(
+                product_batch, export_fields, attributes, warehouses, channels
+            )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+            write_rows(export_data)
 
 
 def export_gift_cards_in_batches(
@@ -193,12 +280,81 @@ def export_gift_cards_in_batches(
     temporary_file: Any,
     file_type: str,
 ):
-    for batch_pks in queryset_in_batches(queryset):
-        gift_card_batch = GiftCard.objects.filter(pk__in=batch_pks)
+    with open_file_writer(
+        export_fields, temporary_file, file_type, delimiter
+    ) as write_rows:
+        for batch_pks in queryset_in_batches(queryset):
+            gift_card_batch = GiftCard.objects.filter(pk__in=batch_pks)
+
+            write_rows(gift_card_batch.values(*export_fields).iterator())
+
+
+def get_queryset_shards(queryset: "QuerySet", shard_size: int) -> List[Tuple[int, int]]:
+    """Split the queryset into ranges of primary keys with `shard_size` instances.
+
+    Return the list of the first and the last primary key of each range.
+    """
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    shards = []
+    last_pk = 0
 
-        export_data = list(gift_card_batch.values(*export_fields))
+    while True:
+        shard_pks = pks.filter(pk__gt=last_pk)
+        first_pk = shard_pks.first()
+        if first_pk is None:
+            break
+
+        shard_end = list(shard_pks[shard_size - 1 : shard_size])
+        last_pk = shard_end[0] if shard_end else shard_pks.last()
+        shards.append((first_pk, last_pk))
+
+        if not shard_end:
+            break
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+    return shards
+
+
+def get_export_file_parts_dir(parts_token: Union[str, uuid.UUID]) -> str:
+    return f"{EXPORT_FILE_PARTS_DIR}/{parts_token}"
+
+
+def get_export_file_part_path(export_file: "ExportFile", shard_index: int) -> str:
+    return f"{get_export_file_parts_dir(export_file.parts_token)}/{shard_index}"
+
+
+def delete_export_file_parts(export_file: "ExportFile", shard_indexes: Iterable[int]):
+    for shard_index in shard_indexes:
+        default_storage.delete(get_export_file_part_path(export_file, shard_index))
+
+
+def delete_abandoned_export_file_parts() -> int:
+    """Delete parts of the exports that are no longer processed.
+
+    Parts are left behind when the export fails while other shards are processed.
+    """
+    from ..models import ExportFile
+
+    try:
+        parts_tokens, _ = default_storage.listdir(EXPORT_FILE_PARTS_DIR)
+    except FileNotFoundError:
+        return 0
+
+    pending_parts_tokens = {
+        str(parts_token)
+        for parts_token in ExportFile.objects.filter(
+            status=JobStatus.PENDING, parts_token__isnull=False
+        ).values_list("parts_token", flat=True)
+    }
+    counter = 0
+    for parts_token in parts_tokens:
+        if parts_token in pending_parts_tokens:
+            continue
+        parts_dir = get_export_file_parts_dir(parts_token)
+        _, file_names = default_storage.listdir(parts_dir)
+        for file_name in file_names:
+            default_storage.delete(f"{parts_dir}/{file_name}")
+            counter += 1
+    return counter
 
 
 def queryset_in_batches(queryset):
@@ -220,19 +376,71 @@ def queryset_in_batches(queryset):
         start_pk = pks[-1]
 
 
-def append_to_file(
-    export_data: List[Dict[str, Union[str, bool]]],
-    headers: List[str],
-    temporary_file: Any,
-    file_type: str,
-    delimiter: str,
+@contextmanager
+def open_file_writer(
+    headers: List[str], temporary_file: Any, file_type: str, delimiter: str
 ):
-    table = etl.fromdicts(export_data, header=headers, missing="")
+    """Open the file for appending rows for the whole export.
 
+    Yield a function that writes the given rows right away, so no more than
+    a single batch of rows is kept in memory. Values are written in the order of
+    `headers`, missing ones are left empty.
+    """
+    if file_type == FileTypes.CSV:
+        with open(temporary_file.name, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=delimiter)
+            yield lambda rows: writer.writerows(
+                [row.get(header, "") for header in headers] for row in rows
+            )
+    else:
+        with _open_xlsx_writer(temporary_file) as sheet:
+            yield lambda rows: _append_xlsx_rows(sheet, headers, rows)
+
+
+def append_parts_to_file(
+    part_paths: List[str], temporary_file: Any, file_type: str, delimiter: str
+):
+    """Append rows from the parts of the export file, skipping their headers."""
     if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
+        with open(temporary_file.name, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=delimiter)
+            for part_path in part_paths:
+                with default_storage.open(part_path, "rb") as part:
+                    reader = csv.reader(
+                        io.TextIOWrapper(part, encoding="utf-8", newline=""),
+                        delimiter=delimiter,
+                    )
+                    next(reader, None)
+                    writer.writerows(reader)
     else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
+        with _open_xlsx_writer(temporary_file) as sheet:
+            for part_path in part_paths:
+                with default_storage.open(part_path, "rb") as part:
+                    workbook = openpyxl.load_workbook(part, read_only=True)
+                    for row in workbook.active.iter_rows(min_row=2, values_only=True):
+                        sheet.append(row)
+                    workbook.close()
+
+
+@contextmanager
+def _open_xlsx_writer(temporary_file: Any):
+    # XLSX file can't be appended to, so the rows already stored in the file
+    # are copied into a write-only workbook, which is saved when the export ends.
+    source = openpyxl.load_workbook(temporary_file.name, read_only=True)
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in source.active.iter_rows(values_only=True):
+        sheet.append(row)
+    source.close()
+
+    yield sheet
+
+    workbook.save(temporary_file.name)
+
+
+def _append_xlsx_rows(sheet, headers: List[str], rows: Iterable[Dict[str, Any]]):
+    for row in rows:
+        sheet.append([row.get(header) for header in headers])
 
 
 def save_csv_file_in_export_file(
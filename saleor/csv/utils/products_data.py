@@ -1,6 +1,6 @@
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Union
 from urllib.parse import urljoin
 
 import graphene
@@ -18,6 +18,9 @@ from . import ProductExportFields
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
+# Number of product rows fetched at once from the server-side cursor.
+ITERATOR_CHUNK_SIZE = 2000
+
 
 def get_products_data(
     queryset: "QuerySet",
@@ -31,8 +34,26 @@ def get_products_data(
     It return list with product and variant data which can be used as import to
     csv writer and list of attribute and warehouse headers.
     """
+    return list(
+        iter_products_data(
+            queryset, export_fields, attribute_ids, warehouse_ids, channel_ids
+        )
+    )
+
 
-    products_with_variants_data = []
+def iter_products_data(
+    queryset: "QuerySet",
+    export_fields: Set[str],
+    attribute_ids: Optional[List[str]],
+    warehouse_ids: Optional[List[str]],
+    channel_ids: Optional[List[str]],
+) -> Iterator[Dict[str, Union[str, bool]]]:
+    """Yield data of products and their variants with fields values.
+
+    Relation data of all products from the queryset is fetched in bulk upfront,
+    product and variant rows are read with a server-side cursor, so only a single
+    chunk of them is kept in memory.
+    """
     export_variant_id = "variants__id" in export_fields
 
     product_fields = set(
@@ -72,7 +93,7 @@ def get_products_data(
         queryset, export_fields, attribute_ids, warehouse_ids, channel_ids
     )
 
-    for product_data in products_data:
+    for product_data in products_data.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
         pk = product_data["id"]
         if export_variant_id:
             variant_pk = product_data.get("variants__id")
@@ -90,11 +111,7 @@ def get_products_data(
                 "ProductVariant", variant_pk
             )
 
-        data = {**product_data, **product_relations_data, **variant_relations_data}
-
-        products_with_variants_data.append(data)
-
-    return products_with_variants_data
+        yield {**product_data, **product_relations_data, **variant_relations_data}
 
 
 def get_products_relations_data(
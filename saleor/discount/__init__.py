@@ -1,9 +1,21 @@
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
 if TYPE_CHECKING:
     from .models import Sale, SaleChannelListing
 
+default_app_config = "saleor.discount.app.DiscountAppConfig"
+
 
 class DiscountValueType:
     FIXED = "fixed"
@@ -42,3 +54,47 @@ class DiscountInfo:
     category_ids: Union[List[int], Set[int]]
     collection_ids: Union[List[int], Set[int]]
     variants_ids: Union[List[int], Set[int]]
+
+
+class DiscountsIndex:
+    """Map catalogue IDs to the discounts that contain them.
+
+    Looking up the discounts applicable to a product costs O(matches) instead of
+    checking every discount. Discounts are returned in their original order.
+    """
+
+    def __init__(self, discounts: Iterable[DiscountInfo]):
+        self.discounts = list(discounts)
+        self._by_product_id: DefaultDict[int, List[int]] = defaultdict(list)
+        self._by_variant_id: DefaultDict[int, List[int]] = defaultdict(list)
+        self._by_category_id: DefaultDict[int, List[int]] = defaultdict(list)
+        self._by_collection_id: DefaultDict[int, List[int]] = defaultdict(list)
+        for position, discount in enumerate(self.discounts):
+            for product_id in discount.product_ids:
+                self._by_product_id[product_id].append(position)
+            for variant_id in discount.variants_ids:
+                self._by_variant_id[variant_id].append(position)
+            for category_id in discount.category_ids:
+                self._by_category_id[category_id].append(position)
+            for collection_id in discount.collection_ids:
+                self._by_collection_id[collection_id].append(position)
+
+    def get_discounts(
+        self,
+        product_ids: Iterable[int] = (),
+        variant_ids: Iterable[Optional[int]] = (),
+        category_ids: Iterable[Optional[int]] = (),
+        collection_ids: Iterable[int] = (),
+    ) -> List[DiscountInfo]:
+        """Return discounts containing any of the given catalogue IDs."""
+        positions: Set[int] = set()
+        for ids, discounts_by_id in [
+            (product_ids, self._by_product_id),
+            (variant_ids, self._by_variant_id),
+            (category_ids, self._by_category_id),
+            (collection_ids, self._by_collection_id),
+        ]:
+            for catalogue_id in ids:
+                if catalogue_id in discounts_by_id:
+                    positions.update(discounts_by_id[catalogue_id])
+        return [self.discounts[position] for position in sorted(positions)]
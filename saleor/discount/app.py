@@ -0,0 +1,30 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class DiscountAppConfig(AppConfig):
+    name = "saleor.discount"
+
+    def ready(self):
+        from ..product.models import Category
+        from .models import Sale, SaleChannelListing
+        from .signals import invalidate_active_discounts_cache
+
+        # preventing duplicate signals
+        for model in [Sale, SaleChannelListing, Category]:
+            post_save.connect(
+                invalidate_active_discounts_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_active_discounts_on_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_active_discounts_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_active_discounts_on_{model.__name__}_delete",
+            )
+        for field in ["categories", "collections", "products", "variants"]:
+            m2m_changed.connect(
+                invalidate_active_discounts_cache,
+                sender=getattr(Sale, field).through,
+                dispatch_uid=f"invalidate_active_discounts_on_sale_{field}_change",
+            )
@@ -0,0 +1,122 @@
+import datetime
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, List, Optional
+
+from django.core.cache import cache
+
+from ..core.cache_version import invalidate
+from . import DiscountInfo, DiscountsIndex
+
+ACTIVE_DISCOUNTS_VERSION_CACHE_KEY = "active_discounts_version"
+
+# Upper bound for how long the catalogue is reused, in case it's changed in a way
+# that doesn't send any signal (e.g. `QuerySet.update`).
+ACTIVE_DISCOUNTS_CACHE_TIMEOUT = 60 * 60
+
+
+@dataclass(frozen=True)
+class ActiveDiscounts:
+    version: str
+    valid_from: datetime.datetime
+    valid_until: datetime.datetime
+    discounts: List[DiscountInfo]
+
+    def is_valid(self, version: str, date: datetime.datetime) -> bool:
+        return self.version == version and self.valid_from <= date < self.valid_until
+
+    @cached_property
+    def index(self) -> DiscountsIndex:
+        return DiscountsIndex(self.discounts)
+
+    def __getstate__(self):
+        # The index is rebuilt by each process on the first use.
+        state = self.__dict__.copy()
+        state.pop("index", None)
+        return state
+
+
+_active_discounts: Optional[ActiveDiscounts] = None
+_lock = threading.Lock()
+
+
+def generate_active_discounts_cache_key(version: str) -> str:
+    return f"active_discounts-{version}"
+
+
+def get_cached_active_discounts(
+    version: str, date: datetime.datetime
+) -> Optional[List[DiscountInfo]]:
+    """Return the catalogue of discounts active at the given date if it's cached.
+
+    The process memory is checked first and the shared cache afterwards.
+    """
+    global _active_discounts
+
+    active_discounts = _active_discounts
+    if active_discounts is not None and active_discounts.is_valid(version, date):
+        return active_discounts.discounts
+
+    active_discounts = cache.get(generate_active_discounts_cache_key(version))
+    if active_discounts is not None and active_discounts.is_valid(version, date):
+        with _lock:
+            _active_discounts = active_discounts
+        return active_discounts.discounts
+    return None
+
+
+def cache_active_discounts(
+    version: str,
+    date: datetime.datetime,
+    valid_from: datetime.datetime,
+    valid_until: Optional[datetime.datetime],
+    discounts: List[DiscountInfo],
+):
+    """Store the catalogue of discounts active at `date`.
+
+    The catalogue is valid from `valid_from` until `valid_until`, the closest
+    moments around `date` at which any sale starts or ends.
+    """
+    global _active_discounts
+
+    max_valid_until = date + datetime.timedelta(seconds=ACTIVE_DISCOUNTS_CACHE_TIMEOUT)
+    if valid_until is None or valid_until > max_valid_until:
+        valid_until = max_valid_until
+    active_discounts = ActiveDiscounts(
+        version=version,
+        valid_from=valid_from,
+        valid_until=valid_until,
+        discounts=discounts,
+    )
+    timeout = (valid_until - date).total_seconds()
+    if timeout > 0:
+        cache.set(
+            generate_active_discounts_cache_key(version),
+            active_discounts,
+            int(timeout) + 1,
+        )
+    with _lock:
+        _active_discounts = active_discounts
+
+
+def get_active_discounts_index(
+    discounts: Iterable[DiscountInfo],
+) -> Optional[DiscountsIndex]:
+    """Return the index of the given discounts if they are the cached catalogue."""
+    active_discounts = _active_discounts
+    if active_discounts is not None and active_discounts.discounts is discounts:
+        return active_discounts.index
+    return None
+
+
+def invalidate_active_discounts():
+    invalidate(ACTIVE_DISCOUNTS_VERSION_CACHE_KEY)
+
+
+def clear_active_discounts():
+    """Drop the catalogue cached by the current process."""
+    global _active_discounts
+
+    with _lock:
+        _active_discounts = None
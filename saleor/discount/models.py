@@ -231,6 +231,11 @@ class SaleQueryset(models.QuerySet["Sale"]):
             date = timezone.now()
         return self.filter(end_date__lt=date, start_date__lt=date)
 
+    def not_expired(self, date=None):
+        if date is None:
+            date = timezone.now()
+        return self.filter(Q(end_date__isnull=True) | Q(end_date__gte=date))
+
 
 class VoucherTranslation(Translation):
     voucher = models.ForeignKey(
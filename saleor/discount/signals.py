@@ -0,0 +1,6 @@
+from ..core.cache_version import invalidate_on_commit
+from .cache import ACTIVE_DISCOUNTS_VERSION_CACHE_KEY
+
+invalidate_active_discounts_cache = invalidate_on_commit(
+    ACTIVE_DISCOUNTS_VERSION_CACHE_KEY
+)
@@ -0,0 +1,140 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from ..cache import clear_active_discounts
+from ..models import Sale, SaleChannelListing
+from ..utils import fetch_active_discounts
+
+
+def test_fetch_active_discounts_reuses_cached_catalogue(
+    sale, django_assert_num_queries
+):
+    # given
+    discounts = fetch_active_discounts()
+
+    # when
+    with django_assert_num_queries(0):
+        cached_discounts = fetch_active_discounts()
+
+    # then
+    assert cached_discounts == discounts
+    assert [discount.sale for discount in cached_discounts] == [sale]
+
+
+def test_fetch_active_discounts_uses_shared_cache(sale, django_assert_num_queries):
+    # given
+    discounts = fetch_active_discounts()
+    clear_active_discounts()
+
+    # when
+    with django_assert_num_queries(0):
+        cached_discounts = fetch_active_discounts()
+
+    # then
+    assert cached_discounts == discounts
+
+
+def test_fetch_active_discounts_invalidated_on_sale_change(sale):
+    # given
+    fetch_active_discounts()
+    sale.name = "New name"
+
+    # when
+    sale.save(update_fields=["name"])
+
+    # then
+    discounts = fetch_active_discounts()
+    assert [discount.sale.name for discount in discounts] == ["New name"]
+
+
+def test_fetch_active_discounts_invalidated_on_catalogue_change(sale, product_list):
+    # given
+    fetch_active_discounts()
+    product = product_list[0]
+
+    # when
+    sale.products.add(product)
+
+    # then
+    discounts = fetch_active_discounts()
+    assert product.pk in discounts[0].product_ids
+
+
+def test_fetch_active_discounts_invalidated_on_channel_listing_change(
+    sale, channel_USD, channel_PLN
+):
+    # given
+    fetch_active_discounts()
+
+    # when
+    SaleChannelListing.objects.create(
+        sale=sale,
+        channel=channel_PLN,
+        discount_value=10,
+        currency=channel_PLN.currency_code,
+    )
+
+    # then
+    discounts = fetch_active_discounts()
+    assert set(discounts[0].channel_listings) == {channel_USD.slug, channel_PLN.slug}
+
+
+def test_fetch_active_discounts_expires_when_sale_starts(sale):
+    # given
+    now = timezone.now()
+    start_date = now + timedelta(hours=1)
+    upcoming_sale = Sale.objects.create(name="Upcoming sale", start_date=start_date)
+    assert [discount.sale for discount in fetch_active_discounts(now)] == [sale]
+
+    # when
+    discounts = fetch_active_discounts(start_date + timedelta(seconds=1))
+
+    # then
+    assert {discount.sale for discount in discounts} == {sale, upcoming_sale}
+
+
+def test_fetch_active_discounts_expires_when_sale_ends(sale):
+    # given
+    now = timezone.now()
+    sale.end_date = now + timedelta(hours=1)
+    sale.save(update_fields=["end_date"])
+    assert [discount.sale for discount in fetch_active_discounts(now)] == [sale]
+
+    # when
+    discounts = fetch_active_discounts(sale.end_date + timedelta(seconds=1))
+
+    # then
+    assert discounts == []
+
+
+def test_fetch_active_discounts_reused_for_earlier_date(
+    sale, django_assert_num_queries
+):
+    # given
+    now = timezone.now()
+    sale.start_date = now - timedelta(hours=1)
+    sale.save(update_fields=["start_date"])
+    discounts = fetch_active_discounts(now)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_discounts = fetch_active_discounts(now - timedelta(seconds=1))
+
+    # then
+    assert cached_discounts == discounts
+
+
+def test_fetch_active_discounts_not_reused_before_sale_ended(sale):
+    # given
+    now = timezone.now()
+    sale.start_date = now - timedelta(hours=1)
+    sale.end_date = now - timedelta(minutes=1)
+    sale.save(update_fields=["start_date", "end_date"])
+    assert fetch_active_discounts(now) == []
+
+    # when
+    discounts = fetch_active_discounts(sale.end_date - timedelta(seconds=1))
+
+    # then
+    assert [discount.sale for discount in discounts] == [sale]
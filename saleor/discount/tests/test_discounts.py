@@ -6,7 +6,7 @@ from django.utils import timezone
 from prices import Money, TaxedMoney
 
 from ...product.models import Product, ProductVariant, ProductVariantChannelListing
-from .. import DiscountInfo, DiscountValueType, VoucherType
+from .. import DiscountInfo, DiscountsIndex, DiscountValueType, VoucherType
 from ..models import (
     NotApplicable,
     Sale,
@@ -18,8 +18,10 @@ from ..models import (
 from ..utils import (
     add_voucher_usage_by_customer,
     decrease_voucher_usage,
+    fetch_active_discounts,
     fetch_catalogue_info,
     get_product_discount_on_sale,
+    get_product_discounts,
     increase_voucher_usage,
     remove_voucher_usage_by_customer,
     validate_voucher,
@@ -723,3 +725,83 @@ def test_fetch_catalogue_info_for_sale_has_one_element_sets(sale):
     assert catalogue_info["collections"] == collection_ids
     assert catalogue_info["products"] == product_ids
     assert catalogue_info["variants"] == variant_ids
+
+
+def _create_discount_info(sale_id, **ids):
+    return DiscountInfo(
+        sale=Sale(id=sale_id),
+        channel_listings={},
+        product_ids=ids.get("product_ids", set()),
+        category_ids=ids.get("category_ids", set()),
+        collection_ids=ids.get("collection_ids", set()),
+        variants_ids=ids.get("variants_ids", set()),
+    )
+
+
+def test_discounts_index_get_discounts():
+    # given
+    product_discount = _create_discount_info(1, product_ids={1})
+    variant_discount = _create_discount_info(2, variants_ids={2})
+    category_discount = _create_discount_info(3, category_ids={3})
+    collection_discount = _create_discount_info(4, collection_ids={4, 5})
+    other_discount = _create_discount_info(5, product_ids={10}, category_ids={10})
+    index = DiscountsIndex(
+        [
+            product_discount,
+            variant_discount,
+            category_discount,
+            collection_discount,
+            other_discount,
+        ]
+    )
+
+    # when
+    discounts = index.get_discounts(
+        product_ids=[1],
+        variant_ids=[2],
+        category_ids=[3],
+        collection_ids=[5],
+    )
+
+    # then
+    assert discounts == [
+        product_discount,
+        variant_discount,
+        category_discount,
+        collection_discount,
+    ]
+
+
+def test_discounts_index_get_discounts_returns_each_discount_once():
+    # given
+    discount = _create_discount_info(1, product_ids={1}, category_ids={2})
+    index = DiscountsIndex([discount])
+
+    # when
+    discounts = index.get_discounts(product_ids=[1], category_ids=[2, None])
+
+    # then
+    assert discounts == [discount]
+
+
+def test_get_product_discounts_for_cached_discounts(
+    sale, new_sale, product, channel_USD
+):
+    # given
+    discounts = fetch_active_discounts()
+    variant = product.variants.first()
+    collection_ids = set(product.collections.values_list("id", flat=True))
+
+    # when
+    product_discounts = list(
+        get_product_discounts(
+            product=product,
+            collection_ids=collection_ids,
+            discounts=discounts,
+            channel=channel_USD,
+            variant_id=variant.id,
+        )
+    )
+
+    # then
+    assert [sale_id for sale_id, _ in product_discounts] == [sale.id]
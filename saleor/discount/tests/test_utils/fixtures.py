@@ -2,11 +2,19 @@ import pytest
 
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ....plugins.manager import get_plugins_manager
+from ....tests.utils import reset_cache_version
 from ... import DiscountInfo, DiscountValueType
+from ...cache import ACTIVE_DISCOUNTS_VERSION_CACHE_KEY, clear_active_discounts
 from ...models import Sale, SaleChannelListing
 from ...utils import fetch_sale_channel_listings
 
 
+@pytest.fixture(autouse=True)
+def clear_active_discounts_cache():
+    clear_active_discounts()
+    reset_cache_version(ACTIVE_DISCOUNTS_VERSION_CACHE_KEY)
+
+
 @pytest.fixture
 def checkout_lines_info(checkout_with_items, categories, published_collections):
     lines = checkout_with_items.lines.all()
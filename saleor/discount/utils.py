@@ -25,8 +25,16 @@ from django.utils import timezone
 from prices import Money, TaxedMoney, fixed_discount, percentage_discount
 
 from ..channel.models import Channel
+from ..core.cache_version import get_version
 from ..core.taxes import zero_money
-from . import DiscountInfo, DiscountType
+from . import DiscountInfo, DiscountsIndex, DiscountType
+from .cache import (
+    ACTIVE_DISCOUNTS_CACHE_TIMEOUT,
+    ACTIVE_DISCOUNTS_VERSION_CACHE_KEY,
+    cache_active_discounts,
+    get_active_discounts_index,
+    get_cached_active_discounts,
+)
 from .models import (
     CheckoutLineDiscount,
     DiscountValueType,
@@ -115,6 +123,14 @@ def get_product_discounts(
     variant_id: Optional[int] = None,
 ) -> Iterator[Tuple[int, Callable]]:
     """Return sale ids, discount values for all discounts applicable to a product."""
+    index = get_active_discounts_index(discounts)
+    if index is not None:
+        discounts = index.get_discounts(
+            product_ids=[product.id],
+            variant_ids=[variant_id],
+            category_ids=[product.category_id],
+            collection_ids=collection_ids,
+        )
     for discount in discounts:
         try:
             yield get_product_discount_on_sale(
@@ -387,7 +403,10 @@ def fetch_sale_channel_listings(
 
 
 def fetch_discounts(date: datetime.date) -> List[DiscountInfo]:
-    sales = list(Sale.objects.active(date))
+    return fetch_discounts_for_sales(list(Sale.objects.active(date)))
+
+
+def fetch_discounts_for_sales(sales: List[Sale]) -> List[DiscountInfo]:
     pks = {s.pk for s in sales}
     collections = fetch_collections(pks)
     channel_listings = fetch_sale_channel_listings(pks)
@@ -408,8 +427,65 @@ def fetch_discounts(date: datetime.date) -> List[DiscountInfo]:
     ]
 
 
-def fetch_active_discounts() -> List[DiscountInfo]:
-    return fetch_discounts(timezone.now())
+def fetch_active_discounts(
+    date: Optional[datetime.datetime] = None,
+) -> List[DiscountInfo]:
+    """Return discounts active at the given date.
+
+    The catalogue is cached in the process memory and in the shared cache until
+    the closest start or end date of any sale, or until any sale is changed.
+    """
+    if date is None:
+        date = timezone.now()
+    version = get_version(ACTIVE_DISCOUNTS_VERSION_CACHE_KEY)
+    discounts = get_cached_active_discounts(version, date)
+    if discounts is None:
+        # Upcoming and recently ended sales are fetched along with the active ones
+        # to find out when the catalogue changes.
+        min_date = date - datetime.timedelta(seconds=ACTIVE_DISCOUNTS_CACHE_TIMEOUT)
+        sales = list(Sale.objects.not_expired(min_date))
+        active_sales = [
+            sale
+            for sale in sales
+            if sale.start_date <= date
+            and (sale.end_date is None or sale.end_date >= date)
+        ]
+        discounts = fetch_discounts_for_sales(active_sales)
+        valid_from = get_sales_valid_from(date, sales, min_date)
+        valid_until = get_sales_valid_until(date, sales)
+        cache_active_discounts(version, date, valid_from, valid_until, discounts)
+    return discounts
+
+
+def get_sales_valid_from(
+    date: datetime.datetime, sales: Iterable[Sale], min_date: datetime.datetime
+) -> datetime.datetime:
+    """Return the latest date before `date` at which the given sales start or end.
+
+    Requests that are still processed with an earlier date can use the catalogue
+    as long as no sale started or ended in the meantime.
+    """
+    dates = [min_date]
+    for sale in sales:
+        if sale.end_date and sale.end_date < date:
+            # Sales are active until the end date inclusive.
+            dates.append(sale.end_date + datetime.timedelta(microseconds=1))
+        elif sale.start_date <= date:
+            dates.append(sale.start_date)
+    return max(dates)
+
+
+def get_sales_valid_until(
+    date: datetime.datetime, sales: Iterable[Sale]
+) -> Optional[datetime.datetime]:
+    """Return the closest date after which the given sales start or end."""
+    dates = []
+    for sale in sales:
+        if sale.start_date > date:
+            dates.append(sale.start_date)
+        elif sale.end_date and sale.end_date >= date:
+            dates.append(sale.end_date)
+    return min(dates, default=None)
 
 
 def fetch_catalogue_info(instance: Sale) -> CatalogueInfo:
@@ -455,32 +531,35 @@ def fetch_active_sales_for_checkout(
     if not lines_info:
         return []
 
-    sales = list(Sale.objects.active(timezone.now()))
-
-    pks = {s.pk for s in sales}
-    channel_listings = fetch_sale_channel_listings(pks)
-    product_pks_by_sale_pk_map = fetch_products(pks, lines_info)
-    variant_pks_by_sale_pk_map = fetch_variants(pks, lines_info)
-    category_pks_by_sale_pk_map = fetch_categories(pks, lines_info)
-    collection_pks_by_sale_pk_map = fetch_collections(pks, lines_info)
+    product_ids = set()
+    variant_ids = set()
+    category_ids = set()
+    collection_ids = set()
+    for line_info in lines_info:
+        product_ids.add(line_info.product.pk)
+        variant_ids.add(line_info.variant.pk)
+        category_ids.add(line_info.product.category_id)
+        collection_ids.update(collection.pk for collection in line_info.collections)
 
+    discounts = fetch_active_discounts()
+    index = get_active_discounts_index(discounts) or DiscountsIndex(discounts)
     discounts_info = []
-    for sale in sales:
-        category_ids = category_pks_by_sale_pk_map[sale.pk]
-        collection_ids = collection_pks_by_sale_pk_map[sale.pk]
-        product_ids = product_pks_by_sale_pk_map[sale.pk]
-        variants_ids = variant_pks_by_sale_pk_map[sale.pk]
-        if category_ids or collection_ids or product_ids or variants_ids:
-            discounts_info.append(
-                DiscountInfo(
-                    sale=sale,
-                    category_ids=category_ids,
-                    channel_listings=channel_listings[sale.pk],
-                    collection_ids=collection_ids,
-                    product_ids=product_ids,
-                    variants_ids=variants_ids,
-                )
+    for discount in index.get_discounts(
+        product_ids=product_ids,
+        variant_ids=variant_ids,
+        category_ids=category_ids,
+        collection_ids=collection_ids,
+    ):
+        discounts_info.append(
+            DiscountInfo(
+                sale=discount.sale,
+                category_ids=category_ids.intersection(discount.category_ids),
+                channel_listings=discount.channel_listings,
+                collection_ids=collection_ids.intersection(discount.collection_ids),
+                product_ids=product_ids.intersection(discount.product_ids),
+                variants_ids=variant_ids.intersection(discount.variants_ids),
             )
+        )
 
     return discounts_info
 
@@ -634,13 +713,31 @@ def create_or_update_discount_objects_from_sale_for_checkout(
 
     sales_data_by_line_map: Dict[UUID, dict] = defaultdict(dict)
 
-    for sale_info in sales_info:
+    # Group lines by the sales that may apply to them, so each sale is checked
+    # only against its candidate lines.
+    index = DiscountsIndex(sales_info)
+    lines_info_by_sale_pk: Dict[int, List["CheckoutLineInfo"]] = defaultdict(list)
+    for line_info in lines_info:
+        for sale_info in index.get_discounts(
+            product_ids=[line_info.product.pk],
+            variant_ids=[line_info.variant.pk],
+            category_ids=[line_info.product.category_id],
+            collection_ids=[collection.pk for collection in line_info.collections],
+        ):
+            lines_info_by_sale_pk[sale_info.sale.pk].append(line_info)
+
+    for sale_info in index.discounts:
+        sale_lines_info = lines_info_by_sale_pk.get(sale_info.sale.pk)
+        if not sale_lines_info:
+            continue
         if sale_info.sale.type == DiscountValueType.FIXED:
-            _apply_fixed_sale_on_lines(lines_info, sale_info, sales_data_by_line_map)
+            _apply_fixed_sale_on_lines(
+                sale_lines_info, sale_info, sales_data_by_line_map
+            )
 
         else:
             _apply_percentage_sale_on_lines(
-                lines_info, sale_info, sales_data_by_line_map, currency_precision
+                sale_lines_info, sale_info, sales_data_by_line_map, currency_precision
             )
 
     for line_info in lines_info:
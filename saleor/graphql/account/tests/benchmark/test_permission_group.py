@@ -348,7 +348,7 @@ def test_groups_for_federation_query_count(
         ],
     }
 
-    with django_assert_num_queries(2):
+    with django_assert_num_queries(1):
         response = api_client.post_graphql(query, variables)
         content = get_graphql_content(response)
         assert len(content["data"]["_entities"]) == 1
@@ -363,7 +363,7 @@ def test_groups_for_federation_query_count(
         ],
     }
 
-    with django_assert_num_queries(2):
+    with django_assert_num_queries(1):
         response = api_client.post_graphql(query, variables)
         content = get_graphql_content(response)
         assert len(content["data"]["_entities"]) == 3
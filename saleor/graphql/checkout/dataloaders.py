@@ -6,8 +6,10 @@ from promise import Promise
 
 from ...checkout.fetch import (
     CheckoutInfo,
+    CheckoutLineData,
     CheckoutLineInfo,
     apply_voucher_to_checkout_line,
+    fetch_checkout_lines_data,
     get_delivery_method_info,
     update_delivery_method_lists_for_checkout_info,
 )
@@ -37,11 +39,11 @@ from ..discount.dataloaders import (
 from ..plugins.dataloaders import get_plugin_manager_promise
 from ..product.dataloaders import (
     CollectionsByVariantIdLoader,
+    ProductByIdLoader,
     ProductByVariantIdLoader,
     ProductChannelListingByProductIdAndChannelSlugLoader,
     ProductTypeByVariantIdLoader,
     ProductVariantByIdLoader,
-    VariantChannelListingByVariantIdAndChannelIdLoader,
 )
 from ..shipping.dataloaders import (
     ShippingMethodByIdLoader,
@@ -66,73 +68,51 @@ class CheckoutLinesInfoByCheckoutTokenLoader(DataLoader[str, List[CheckoutLineIn
     context_key = "checkoutlinesinfo_by_checkout"
 
     def batch_load(self, keys):
-        def with_checkout_lines(results):
-            checkouts, checkout_lines = results
-
-            variants_pks = set()
-            lines_pks = set()
-            for lines in checkout_lines:
-                for line in lines:
-                    lines_pks.add(line.id)
-                    variants_pks.add(line.variant_id)
-            lines_pks = list(lines_pks)
-            variants_pks = list(variants_pks)
-            if not variants_pks:
-                return [[] for _ in keys]
-
+        def with_checkouts(checkouts):
             channel_pks = [checkout.channel_id for checkout in checkouts]
-
-            def with_variants_products_collections(results):
-                (
-                    variants,
-                    products,
-                    product_types,
-                    collections,
-                    tax_classes,
-                    channel_listings,
-                    voucher_infos,
-                    channels,
-                    checkout_lines_discounts,
-                ) = results
-                variants_map = dict(zip(variants_pks, variants))
-                products_map = dict(zip(variants_pks, products))
-                product_types_map = dict(zip(variants_pks, product_types))
-                collections_map = dict(zip(variants_pks, collections))
-                tax_class_map = dict(zip(variants_pks, tax_classes))
-                channel_listings_map = dict(
-                    zip(variant_ids_channel_ids, channel_listings)
+            voucher_codes = {
+                checkout.voucher_code for checkout in checkouts if checkout.voucher_code
+            }
+            lines_data = fetch_checkout_lines_data(
+                CheckoutLine.objects.using(self.database_connection_name).filter(
+                    checkout_id__in=keys
                 )
+            )
+            self.prime_loaders(lines_data)
+
+            def with_channels_and_vouchers(results):
+                channels, voucher_infos = results
                 channels = dict(zip(channel_pks, channels))
-                checkout_lines_discounts = dict(
-                    zip(lines_pks, checkout_lines_discounts)
-                )
+                checkouts_map = {checkout.pk: checkout for checkout in checkouts}
 
                 lines_info_map = defaultdict(list)
+                for line_data in lines_data:
+                    line = line_data.line
+                    variant = line.variant
+                    product = variant.product
+                    channel_listing = line_data.variant_channel_listing
+                    if channel_listing and channel_listing.price_amount is None:
+                        channel_listing = None
+                    checkout = checkouts_map[line.checkout_id]
+                    lines_info_map[checkout.pk].append(
+                        CheckoutLineInfo(
+                            line=line,
+                            variant=variant,
+                            channel_listing=channel_listing,  # type: ignore[arg-type] # noqa: E501
+                            product=product,
+                            product_type=product.product_type,
+                            collections=line_data.collections,
+                            discounts=line_data.discounts,
+                            tax_class=line_data.tax_class,
+                            channel=channels[checkout.channel_id],
+                        )
+                    )
+
                 voucher_infos_map = {
                     voucher_info.voucher.code: voucher_info
                     for voucher_info in voucher_infos
                     if voucher_info
                 }
-                for checkout, lines in zip(checkouts, checkout_lines):
-                    lines_info_map[checkout.pk].extend(
-                        [
-                            CheckoutLineInfo(
-                                line=line,
-                                variant=variants_map[line.variant_id],
-                                channel_listing=channel_listings_map[
-                                    (line.variant_id, checkout.channel_id)
-                                ],
-                                product=products_map[line.variant_id],
-                                product_type=product_types_map[line.variant_id],
-                                collections=collections_map[line.variant_id],
-                                discounts=checkout_lines_discounts[line.id],
-                                tax_class=tax_class_map[line.variant_id],
-                                channel=channels[checkout.channel_id],
-                            )
-                            for line in lines
-                        ]
-                    )
-
                 for checkout in checkouts:
                     if not checkout.voucher_code:
                         continue
@@ -151,58 +131,42 @@ class CheckoutLinesInfoByCheckoutTokenLoader(DataLoader[str, List[CheckoutLineIn
                         )
                 return [lines_info_map[key] for key in keys]
 
-            checkout_lines_discounts = CheckoutLineDiscountsByCheckoutLineIdLoader(
-                self.context
-            ).load_many(lines_pks)
-            variants = ProductVariantByIdLoader(self.context).load_many(variants_pks)
-            products = ProductByVariantIdLoader(self.context).load_many(variants_pks)
-            product_types = ProductTypeByVariantIdLoader(self.context).load_many(
-                variants_pks
-            )
-            collections = CollectionsByVariantIdLoader(self.context).load_many(
-                variants_pks
-            )
-            tax_classes = TaxClassByVariantIdLoader(self.context).load_many(
-                variants_pks
-            )
-
-            voucher_codes = {
-                checkout.voucher_code for checkout in checkouts if checkout.voucher_code
-            }
+            channels = ChannelByIdLoader(self.context).load_many(channel_pks)
             voucher_infos = VoucherInfoByVoucherCodeLoader(self.context).load_many(
                 voucher_codes
             )
+            return Promise.all([channels, voucher_infos]).then(
+                with_channels_and_vouchers
+            )
 
-            variant_ids_channel_ids = []
-            for channel_id, lines in zip(channel_pks, checkout_lines):
-                variant_ids_channel_ids.extend(
-                    [(line.variant_id, channel_id) for line in lines]
-                )
-
-            channel_listings = VariantChannelListingByVariantIdAndChannelIdLoader(
-                self.context
-            ).load_many(variant_ids_channel_ids)
-
-            channels = ChannelByIdLoader(self.context).load_many(channel_pks)
-            return Promise.all(
-                [
-                    variants,
-                    products,
-                    product_types,
-                    collections,
-                    tax_classes,
-                    channel_listings,
-                    voucher_infos,
-                    channels,
-                    checkout_lines_discounts,
-                ]
-            ).then(with_variants_products_collections)
-
-        checkouts = CheckoutByTokenLoader(self.context).load_many(keys)
-        checkout_lines = CheckoutLinesByCheckoutTokenLoader(self.context).load_many(
-            keys
-        )
-        return Promise.all([checkouts, checkout_lines]).then(with_checkout_lines)
+        return CheckoutByTokenLoader(self.context).load_many(keys).then(with_checkouts)
+
+    def prime_loaders(self, lines_data: Iterable[CheckoutLineData]):
+        """Share the fetched objects with the loaders that would query them again."""
+        lines_map = defaultdict(list)
+        for line_data in lines_data:
+            line = line_data.line
+            variant = line.variant
+            product = variant.product
+            lines_map[line.checkout_id].append(line)
+            CheckoutLineByIdLoader(self.context).prime(line.pk, line)
+            CheckoutLineDiscountsByCheckoutLineIdLoader(self.context).prime(
+                line.pk, line_data.discounts
+            )
+            ProductVariantByIdLoader(self.context).prime(variant.pk, variant)
+            ProductByIdLoader(self.context).prime(product.pk, product)
+            ProductByVariantIdLoader(self.context).prime(variant.pk, product)
+            ProductTypeByVariantIdLoader(self.context).prime(
+                variant.pk, product.product_type
+            )
+            CollectionsByVariantIdLoader(self.context).prime(
+                variant.pk, line_data.collections
+            )
+            TaxClassByVariantIdLoader(self.context).prime(
+                variant.pk, line_data.tax_class
+            )
+        for checkout_id, lines in lines_map.items():
+            CheckoutLinesByCheckoutTokenLoader(self.context).prime(checkout_id, lines)
 
 
 class CheckoutByUserLoader(DataLoader[int, List[Checkout]]):
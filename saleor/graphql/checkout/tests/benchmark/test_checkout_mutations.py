@@ -430,7 +430,7 @@ def test_create_checkout_with_reservations(
         }
     }
 
-    with django_assert_num_queries(62):
+    with django_assert_num_queries(61):
         response = api_client.post_graphql(query, variables)
         assert get_graphql_content(response)["data"]["checkoutCreate"]
         assert Checkout.objects.first().lines.count() == 10
@@ -695,7 +695,7 @@ def test_update_checkout_lines_with_reservations(
         assert not data["errors"]
 
     # Updating multiple lines in checkout has same query count as updating one
-    with django_assert_num_queries(74):
+    with django_assert_num_queries(73):
         variables = {
             "id": to_global_id_or_none(checkout),
             "lines": [],
@@ -953,7 +953,7 @@ def test_add_checkout_lines_with_reservations(
 
     checkout.lines.exclude(id=line.id).delete()
 
-    with django_assert_num_queries(73):
+    with django_assert_num_queries(72):
         variables = {
             "id": Node.to_global_id("Checkout", checkout.pk),
             "lines": new_lines,
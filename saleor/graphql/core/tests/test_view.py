@@ -3,6 +3,7 @@ from unittest import mock
 import graphene
 import pytest
 from django.test import override_settings
+from graphql import get_default_backend
 from graphql.execution.base import ExecutionResult
 
 from .... import __version__ as saleor_version
@@ -10,7 +11,8 @@ from ....demo.views import EXAMPLE_QUERY
 from ....graphql.utils import INTERNAL_ERROR_MESSAGE
 from ...tests.fixtures import API_PATH
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
-from ...views import generate_cache_key
+from ...views import document_cache, generate_cache_key
+from ..validators.query_cost import validate_query_cost
 
 
 def test_batch_queries(category, product, api_client, channel_USD):
@@ -332,3 +334,59 @@ def test_introspection_query_is_not_cached_in_debug_mode(
 def test_generate_cache_key_use_saleor_version():
     cache_key = generate_cache_key(INTROSPECTION_QUERY)
     assert saleor_version in cache_key
+
+
+def test_parsed_document_is_cached(api_client):
+    # given
+    query = "{ shop { name } }"
+    backend = get_default_backend()
+    with mock.patch.object(
+        backend, "document_from_string", wraps=backend.document_from_string
+    ) as document_from_string_mock:
+        # when
+        for _ in range(2):
+            response = api_client.post_graphql(query)
+            get_graphql_content(response)
+
+    # then
+    document_from_string_mock.assert_called_once()
+    assert document_cache.hits == 1
+    assert document_cache.misses == 1
+
+
+def test_cached_document_validation_errors_are_returned(api_client):
+    # given
+    query = "{ shop { unknownField } }"
+    api_client.post_graphql(query)
+
+    # when
+    response = api_client.post_graphql(query)
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        'Cannot query field "unknownField" on type "Shop".'
+    )
+    assert document_cache.hits == 1
+
+
+@override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=1)
+@mock.patch(
+    "saleor.graphql.document_cache.validate_query_cost",
+    wraps=validate_query_cost,
+)
+def test_query_cost_is_cached_per_variables(validate_query_cost_mock, api_client):
+    # given
+    query = """
+        query GetProducts($first: Int) {
+            products(first: $first) { edges { node { id } } }
+        }
+    """
+
+    # when
+    for first in [10, 10, 20]:
+        api_client.post_graphql(query, variables={"first": first})
+
+    # then
+    assert validate_query_cost_mock.call_count == 2
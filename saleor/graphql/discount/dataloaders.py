@@ -3,23 +3,15 @@ from typing import List, Optional
 
 from django.db.models import F
 
-from ...discount import DiscountInfo
 from ...discount.interface import VoucherInfo
 from ...discount.models import (
     CheckoutLineDiscount,
     OrderDiscount,
-    Sale,
     SaleChannelListing,
     Voucher,
     VoucherChannelListing,
 )
-from ...discount.utils import (
-    fetch_categories,
-    fetch_collections,
-    fetch_products,
-    fetch_sale_channel_listings,
-    fetch_variants,
-)
+from ...discount.utils import fetch_active_discounts
 from ..core.dataloaders import DataLoader
 
 
@@ -27,45 +19,7 @@ class DiscountsByDateTimeLoader(DataLoader):
     context_key = "discounts"
 
     def batch_load(self, keys):
-        sales_map = {
-            datetime: list(
-                Sale.objects.using(self.database_connection_name)
-                .active(datetime)
-                .order_by("id")
-            )
-            for datetime in keys
-        }
-        pks = {s.pk for d, ss in sales_map.items() for s in ss}
-        collections = fetch_collections(
-            pks, database_connection_name=self.database_connection_name
-        )
-        channel_listings = fetch_sale_channel_listings(
-            pks, self.database_connection_name
-        )
-        products = fetch_products(
-            pks, database_connection_name=self.database_connection_name
-        )
-        categories = fetch_categories(
-            pks, database_connection_name=self.database_connection_name
-        )
-        variants = fetch_variants(
-            pks, database_connection_name=self.database_connection_name
-        )
-
-        return [
-            [
-                DiscountInfo(
-                    sale=sale,
-                    channel_listings=channel_listings[sale.pk],
-                    category_ids=categories[sale.pk],
-                    collection_ids=collections[sale.pk],
-                    product_ids=products[sale.pk],
-                    variants_ids=variants[sale.pk],
-                )
-                for sale in sales_map[datetime]
-            ]
-            for datetime in keys
-        ]
+        return [fetch_active_discounts(datetime) for datetime in keys]
 
 
 class SaleChannelListingBySaleIdAndChanneSlugLoader(DataLoader):
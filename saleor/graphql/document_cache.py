@@ -0,0 +1,116 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from graphql import GraphQLDocument
+from graphql.error import GraphQLError
+from graphql.validation import validate
+
+from .core.validators.query_cost import validate_query_cost
+
+T = TypeVar("T")
+
+# Maximum number of distinct variable sets for which a query cost is remembered
+# per cached document.
+QUERY_COST_CACHE_SIZE = 32
+
+
+class LRUCache(Generic[T]):
+    """Thread-safe, size-bounded mapping that evicts least recently used entries.
+
+    Tracks the number of hits and misses so that the effectiveness of the cache
+    can be monitored. A `max_size` of zero disables caching.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, T]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: T):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class CachedDocument(GraphQLDocument):
+    """Parsed GraphQL document with memoized validation results.
+
+    Schema validation does not depend on the request, so it's computed once per
+    document. Query cost depends on the variables, so it's memoized per variable set.
+    """
+
+    def __init__(self, document: GraphQLDocument):
+        super().__init__(
+            schema=document.schema,
+            document_string=document.document_string,
+            document_ast=document.document_ast,
+            execute=document.execute,
+        )
+        self._validation_errors: Optional[List[GraphQLError]] = None
+        self._query_costs: LRUCache[Tuple[Any, Any]] = LRUCache(QUERY_COST_CACHE_SIZE)
+
+    def get_validation_errors(self) -> List[GraphQLError]:
+        if self._validation_errors is None:
+            self._validation_errors = validate(self.schema, self.document_ast)
+        return self._validation_errors
+
+    def get_query_cost(self, schema, variables, cost_map, maximum_cost):
+        variables_key = get_variables_key(variables)
+        if variables_key is None:
+            return validate_query_cost(schema, self, variables, cost_map, maximum_cost)
+        key = (maximum_cost, variables_key)
+        cost = self._query_costs.get(key)
+        if cost is None:
+            cost = validate_query_cost(schema, self, variables, cost_map, maximum_cost)
+            self._query_costs.set(key, cost)
+        return cost
+
+
+def get_variables_key(variables: Optional[dict]) -> Optional[str]:
+    if not variables:
+        return ""
+    try:
+        serialized_variables = json.dumps(variables, sort_keys=True)
+    except (TypeError, ValueError):
+        # Variables containing non-serializable values (e.g. uploaded files)
+        # are not cached.
+        return None
+    # Variables may be large, so only their digest is kept in the cache.
+    return hashlib.sha256(serialized_variables.encode("utf-8")).hexdigest()
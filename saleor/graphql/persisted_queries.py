@@ -0,0 +1,162 @@
+"""Support for automatic persisted queries (APQ).
+
+Clients may send only the SHA-256 hash of a query in the
+`extensions.persistedQuery.sha256Hash` field of the request. If the hash is not
+known yet, the `PersistedQueryNotFound` error is returned and the client is
+expected to retry with both the query and its hash, which registers the query.
+
+Queries are registered in the Django cache. Queries listed in the manifest file
+set in `GRAPHQL_PERSISTED_QUERIES_MANIFEST` are always available. With
+`GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST_ONLY` enabled, only the queries from
+the manifest can be executed.
+"""
+import hashlib
+import json
+import threading
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql.error import GraphQLError
+
+from .. import __version__ as saleor_version
+
+PERSISTED_QUERY_VERSION = 1
+
+_manifest: Optional[Dict[str, str]] = None
+_manifest_lock = threading.Lock()
+
+
+class PersistedQueryError(GraphQLError):
+    code = ""
+
+    def __init__(self, message: str):
+        super().__init__(message, extensions={"code": self.code})
+
+
+class PersistedQueryNotFound(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_FOUND"
+
+    def __init__(self):
+        super().__init__("PersistedQueryNotFound")
+
+
+class PersistedQueryNotSupported(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_SUPPORTED"
+
+    def __init__(self):
+        super().__init__("PersistedQueryNotSupported")
+
+
+class PersistedQueryNotAllowed(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_ALLOWED"
+
+    def __init__(self):
+        super().__init__("Only queries from the allow-list can be executed.")
+
+
+def hash_query(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def generate_persisted_query_cache_key(query_hash: str) -> str:
+    return f"persisted-query-{saleor_version}-{query_hash}"
+
+
+def get_persisted_query_hash(extensions) -> Optional[str]:
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    if persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        raise PersistedQueryNotSupported()
+    query_hash = persisted_query.get("sha256Hash")
+    if not query_hash or not isinstance(query_hash, str):
+        raise GraphQLError("Persisted query hash must be a string.")
+    return query_hash.lower()
+
+
+def has_persisted_query_hash(data) -> bool:
+    """Return whether the request data refers to a query by its hash."""
+    extensions = data.get("extensions") if isinstance(data, dict) else None
+    if not isinstance(extensions, dict):
+        return False
+    persisted_query = extensions.get("persistedQuery")
+    return isinstance(persisted_query, dict) and bool(persisted_query.get("sha256Hash"))
+
+
+def get_persisted_queries_manifest() -> Dict[str, str]:
+    """Return the mapping of query hashes to the queries from the manifest file.
+
+    Both a plain `{"<sha256>": "<query>"}` mapping and the Apollo persisted
+    query manifest format are accepted. The file is read once per process.
+    """
+    global _manifest
+
+    if _manifest is not None:
+        return _manifest
+    with _manifest_lock:
+        if _manifest is None:
+            _manifest = load_persisted_queries_manifest(
+                settings.GRAPHQL_PERSISTED_QUERIES_MANIFEST
+            )
+    return _manifest
+
+
+def load_persisted_queries_manifest(path: Optional[str]) -> Dict[str, str]:
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as manifest_file:
+        data = json.load(manifest_file)
+    if "operations" in data:
+        queries = [operation["body"] for operation in data["operations"]]
+    else:
+        queries = list(data.values())
+    return {hash_query(query): query for query in queries}
+
+
+def clear_persisted_queries_manifest():
+    global _manifest
+
+    with _manifest_lock:
+        _manifest = None
+
+
+def resolve_persisted_query(query: Optional[str], extensions) -> Optional[str]:
+    """Return the query to execute for the given request data.
+
+    Registers the query when both the query and its hash are provided and returns
+    the registered query when only the hash is given.
+    """
+    query_hash = get_persisted_query_hash(extensions)
+    allow_list_only = settings.GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST_ONLY
+    if query_hash is None:
+        if allow_list_only and query and isinstance(query, str):
+            if hash_query(query) not in get_persisted_queries_manifest():
+                raise PersistedQueryNotAllowed()
+        return query
+
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+        raise PersistedQueryNotSupported()
+
+    manifest = get_persisted_queries_manifest()
+    if query and isinstance(query, str):
+        if hash_query(query) != query_hash:
+            raise GraphQLError("Provided sha256Hash does not match query.")
+        if query_hash not in manifest:
+            if allow_list_only:
+                raise PersistedQueryNotAllowed()
+            cache.set(
+                generate_persisted_query_cache_key(query_hash),
+                query,
+                settings.GRAPHQL_PERSISTED_QUERIES_TIMEOUT,
+            )
+        return query
+
+    if persisted_query := manifest.get(query_hash):
+        return persisted_query
+    if not allow_list_only:
+        if persisted_query := cache.get(generate_persisted_query_cache_key(query_hash)):
+            return persisted_query
+    raise PersistedQueryNotFound()
@@ -829,13 +829,9 @@ class ProductBulkCreate(BaseMutation):
     @classmethod
     def post_save_actions(cls, info, products, variants, channels):
         manager = get_plugin_manager_promise(info.context).get()
-        product_ids = []
-        for product in products:
-            cls.call_event(manager.product_created, product.node)
-            product_ids.append(product.node.id)
-
-        for variant in variants:
-            cls.call_event(manager.product_variant_created, variant)
+        product_ids = [product.node.id for product in products]
+        cls.call_event(manager.products_created, [product.node for product in products])
+        cls.call_event(manager.product_variants_created, variants)
 
         for channel in channels:
             cls.call_event(manager.channel_updated, channel)
@@ -922,8 +922,9 @@ class ProductVariantBulkCreate(BaseMutation):
         update_product_discounted_price_task.delay(product.pk)
         update_product_search_vector(product)
 
-        for instance in instances:
-            cls.call_event(manager.product_variant_created, instance.node)
+        cls.call_event(
+            manager.product_variants_created, [instance.node for instance in instances]
+        )
 
     @classmethod
     @traced_atomic_transaction()
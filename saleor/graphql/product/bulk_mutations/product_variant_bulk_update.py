@@ -663,8 +663,9 @@ class ProductVariantBulkUpdate(BaseMutation):
         update_product_discounted_price_task.delay(product.pk)
         update_product_search_vector(product)
 
-        for instance in instances:
-            cls.call_event(manager.product_variant_updated, instance.node)
+        cls.call_event(
+            manager.product_variants_updated, [instance.node for instance in instances]
+        )
 
     @classmethod
     @traced_atomic_transaction()
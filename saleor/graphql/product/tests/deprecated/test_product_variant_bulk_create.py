@@ -60,7 +60,7 @@ PRODUCT_VARIANT_BULK_CREATE_MUTATION = """
 """
 
 
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_created")
 def test_product_variant_bulk_create_by_name(
     product_variant_created_webhook_mock,
     staff_api_client,
@@ -106,10 +106,11 @@ def test_product_variant_bulk_create_by_name(
     product_variant = ProductVariant.objects.get(sku=sku)
     product.refresh_from_db()
     assert product.default_variant == product_variant
-    assert product_variant_created_webhook_mock.call_count == data["count"]
+    product_variant_created_webhook_mock.assert_called_once()
+    assert len(product_variant_created_webhook_mock.call_args.args[0]) == data["count"]
 
 
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_created")
 def test_product_variant_bulk_create_by_attribute_id(
     product_variant_created_webhook_mock,
     staff_api_client,
@@ -149,7 +150,8 @@ def test_product_variant_bulk_create_by_attribute_id(
     product_variant = ProductVariant.objects.get(sku=sku)
     product.refresh_from_db()
     assert product.default_variant == product_variant
-    assert product_variant_created_webhook_mock.call_count == data["count"]
+    product_variant_created_webhook_mock.assert_called_once()
+    assert len(product_variant_created_webhook_mock.call_args.args[0]) == data["count"]
 
 
 def test_product_variant_bulk_create_with_swatch_attribute(
@@ -148,7 +148,7 @@ def test_product_bulk_create_with_base_data(
     assert args == {product.id for product in products}
 
 
-@patch("saleor.plugins.manager.PluginsManager.product_created")
+@patch("saleor.plugins.manager.PluginsManager.products_created")
 def test_product_bulk_create_send_product_created_webhook(
     created_webhook_mock,
     staff_api_client,
@@ -203,9 +203,10 @@ def test_product_bulk_create_send_product_created_webhook(
     assert not data["results"][0]["errors"]
     assert not data["results"][1]["errors"]
     assert data["count"] == 2
-    assert created_webhook_mock.call_count == 2
-    for call in created_webhook_mock.call_args_list:
-        assert isinstance(call.args[0], Product)
+    created_webhook_mock.assert_called_once()
+    products = created_webhook_mock.call_args.args[0]
+    assert len(products) == 2
+    assert all(isinstance(product, Product) for product in products)
 
 
 def test_product_bulk_create_with_same_name_and_no_slug(
@@ -1192,8 +1193,8 @@ def test_product_bulk_create_with_variants_with_duplicated_sku(
     assert prod_2_errors[0]["code"] == ProductBulkCreateErrorCode.UNIQUE.name
 
 
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
-@patch("saleor.plugins.manager.PluginsManager.product_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_created")
+@patch("saleor.plugins.manager.PluginsManager.products_created")
 def test_product_bulk_create_with_variants_send_product_variant_created_event(
     product_created_webhook_mock,
     variant_created_webhook_mock,
@@ -1291,8 +1292,8 @@ def test_product_bulk_create_with_variants_send_product_variant_created_event(
     assert not data["results"][0]["errors"]
     assert not data["results"][1]["errors"]
     assert data["count"] == 2
-    assert product_created_webhook_mock.call_count == 2
-    assert variant_created_webhook_mock.call_count == 3
+    assert len(product_created_webhook_mock.call_args.args[0]) == 2
+    assert len(variant_created_webhook_mock.call_args.args[0]) == 3
 
 
 def test_product_bulk_create_with_variants_and_stocks(
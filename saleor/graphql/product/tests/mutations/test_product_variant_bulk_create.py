@@ -100,7 +100,7 @@ PRODUCT_VARIANT_BULK_CREATE_MUTATION = """
 
 
 @patch("saleor.product.tasks.update_product_discounted_price_task.delay")
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_created")
 def test_product_variant_bulk_create_by_name(
     product_variant_created_webhook_mock,
     update_product_discounted_price_task_mock,
@@ -162,12 +162,13 @@ def test_product_variant_bulk_create_by_name(
     product_variant = ProductVariant.objects.get(sku=sku1)
     product.refresh_from_db()
     assert product.default_variant == product_variant
-    assert product_variant_created_webhook_mock.call_count == data["count"]
+    product_variant_created_webhook_mock.assert_called_once()
+    assert len(product_variant_created_webhook_mock.call_args.args[0]) == data["count"]
     update_product_discounted_price_task_mock.call_count == data["count"]
 
 
 @patch("saleor.product.tasks.update_product_discounted_price_task.delay")
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_created")
 def test_product_variant_bulk_create_by_attribute_id(
     product_variant_created_webhook_mock,
     update_product_discounted_price_task_mock,
@@ -212,7 +213,8 @@ def test_product_variant_bulk_create_by_attribute_id(
     product_variant = ProductVariant.objects.get(sku=sku)
     product.refresh_from_db()
     assert product.default_variant == product_variant
-    assert product_variant_created_webhook_mock.call_count == data["count"]
+    product_variant_created_webhook_mock.assert_called_once()
+    assert len(product_variant_created_webhook_mock.call_args.args[0]) == data["count"]
     update_product_discounted_price_task_mock.assert_called_once_with(product.id)
 
 
@@ -68,7 +68,7 @@ PRODUCT_VARIANT_BULK_UPDATE_MUTATION = """
 
 
 @patch("saleor.product.tasks.update_product_discounted_price_task.delay")
-@patch("saleor.plugins.manager.PluginsManager.product_variant_updated")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_updated")
 def test_product_variant_bulk_update(
     product_variant_created_webhook_mock,
     update_product_discounted_price_task_mock,
@@ -114,7 +114,8 @@ def test_product_variant_bulk_update(
     assert variant_data["metadata"][0]["value"] == metadata_value
     assert product_with_single_variant.variants.count() == 1
     assert old_name != new_name
-    assert product_variant_created_webhook_mock.call_count == data["count"]
+    product_variant_created_webhook_mock.assert_called_once()
+    assert len(product_variant_created_webhook_mock.call_args.args[0]) == data["count"]
     update_product_discounted_price_task_mock.assert_called_once_with(
         product_with_single_variant.id
     )
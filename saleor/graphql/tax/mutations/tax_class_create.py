@@ -2,6 +2,7 @@ import graphene
 
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
+from ....tax.signals import invalidate_tax_configuration_cache
 from ...account.enums import CountryCodeEnum
 from ...core.descriptions import ADDED_IN_39
 from ...core.doc_category import DOC_CATEGORY_TAXES
@@ -74,6 +75,8 @@ class TaxClassCreate(ModelMutation):
             for item in country_rates
         ]
         models.TaxClassCountryRate.objects.bulk_create(to_create)
+        # bulk operations don't send the model signals
+        invalidate_tax_configuration_cache(sender=models.TaxClassCountryRate)
 
     @classmethod
     def save(cls, _info, instance, cleaned_input):
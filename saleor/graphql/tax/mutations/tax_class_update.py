@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
+from ....tax.signals import invalidate_tax_configuration_cache
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_39
@@ -124,6 +125,8 @@ class TaxClassUpdate(ModelMutation):
             and item.get("rate") is not None
         ]
         models.TaxClassCountryRate.objects.bulk_create(to_create)
+        # bulk operations don't send the model signals
+        invalidate_tax_configuration_cache(sender=models.TaxClassCountryRate)
 
         # Delete instances where null rates were provided.
         to_delete = [
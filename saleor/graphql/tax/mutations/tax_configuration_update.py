@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
+from ....tax.signals import invalidate_tax_configuration_cache
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_39
@@ -175,6 +176,8 @@ class TaxConfigurationUpdate(ModelMutation):
             if item["country_code"] not in updated_countries
         ]
         models.TaxConfigurationPerCountry.objects.bulk_create(to_create)
+        # bulk operations don't send the model signals
+        invalidate_tax_configuration_cache(sender=models.TaxConfigurationPerCountry)
 
     @classmethod
     def remove_countries_configuration(cls, country_codes):
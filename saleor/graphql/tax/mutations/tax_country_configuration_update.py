@@ -8,6 +8,7 @@ from graphql import GraphQLError
 
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
+from ....tax.signals import invalidate_tax_configuration_cache
 from ...account.enums import CountryCodeEnum
 from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_39
@@ -217,6 +218,8 @@ class TaxCountryConfigurationUpdate(BaseMutation):
                 )
                 to_create.append(obj)
         models.TaxClassCountryRate.objects.bulk_create(to_create)
+        # bulk operations don't send the model signals
+        invalidate_tax_configuration_cache(sender=models.TaxClassCountryRate)
 
         # Delete instances where null rates were provided.
         models.TaxClassCountryRate.objects.filter(
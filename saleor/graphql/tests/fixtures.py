@@ -15,6 +15,7 @@ from ...core.jwt import create_access_token
 from ...plugins.manager import get_plugins_manager
 from ...tests.utils import flush_post_commit_hooks
 from ..utils import handled_errors_logger, unhandled_errors_logger
+from ..views import document_cache
 from .utils import assert_no_permission
 
 API_PATH = reverse("api")
@@ -154,6 +155,11 @@ def api_client():
     return ApiClient(user=None)
 
 
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_cache.clear()
+
+
 @pytest.fixture
 def schema_context():
     params = {
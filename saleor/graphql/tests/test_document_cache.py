@@ -0,0 +1,51 @@
+from ..document_cache import LRUCache, get_variables_key
+
+
+def test_lru_cache_evicts_least_recently_used_entry():
+    # given
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # when
+    cache.set("c", 3)
+
+    # then
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats() == {"size": 2, "max_size": 2, "hits": 3, "misses": 1}
+
+
+def test_lru_cache_disabled_when_size_is_zero():
+    # given
+    cache = LRUCache(max_size=0)
+
+    # when
+    cache.set("a", 1)
+
+    # then
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_get_variables_key_is_independent_of_key_order():
+    assert get_variables_key({"a": 1, "b": 2}) == get_variables_key({"b": 2, "a": 1})
+    assert get_variables_key(None) == ""
+
+
+def test_get_variables_key_for_not_serializable_variables():
+    assert get_variables_key({"file": object()}) is None
+
+
+def test_get_variables_key_size_is_independent_of_variables_size():
+    # given
+    variables = {"ids": [str(i) for i in range(10000)]}
+
+    # when
+    key = get_variables_key(variables)
+
+    # then
+    assert len(key) == 64
+    assert key != get_variables_key({"ids": []})
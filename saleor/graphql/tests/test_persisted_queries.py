@@ -0,0 +1,224 @@
+import json
+
+import pytest
+from django.core.cache import cache
+
+from ..persisted_queries import (
+    clear_persisted_queries_manifest,
+    generate_persisted_query_cache_key,
+    hash_query,
+)
+from .fixtures import API_PATH
+from .utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_SHOP_NAME = "{ shop { name } }"
+
+
+def _persisted_query_extensions(query_hash):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+@pytest.fixture
+def persisted_queries_manifest(tmp_path, settings):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "format": "apollo-persisted-query-manifest",
+                "version": 1,
+                "operations": [{"id": "1", "body": QUERY_SHOP_NAME}],
+            }
+        )
+    )
+    settings.GRAPHQL_PERSISTED_QUERIES_MANIFEST = str(manifest_path)
+    clear_persisted_queries_manifest()
+    yield manifest_path
+    clear_persisted_queries_manifest()
+
+
+def test_persisted_query_not_found(api_client):
+    # given
+    data = {"extensions": _persisted_query_extensions(hash_query(QUERY_SHOP_NAME))}
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_registered_and_executed_by_hash(api_client, site_settings):
+    # given
+    extensions = _persisted_query_extensions(hash_query(QUERY_SHOP_NAME))
+    response = api_client.post({"query": QUERY_SHOP_NAME, "extensions": extensions})
+    get_graphql_content(response)
+
+    # when
+    response = api_client.post({"extensions": extensions})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_hash_mismatch(api_client):
+    # given
+    extensions = _persisted_query_extensions(hash_query("{ shop { domain { host } } }"))
+
+    # when
+    response = api_client.post({"query": QUERY_SHOP_NAME, "extensions": extensions})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Provided sha256Hash does not match query."
+    )
+
+
+def test_persisted_query_not_supported(api_client, settings):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    extensions = _persisted_query_extensions(hash_query(QUERY_SHOP_NAME))
+
+    # when
+    response = api_client.post({"query": QUERY_SHOP_NAME, "extensions": extensions})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+
+def test_persisted_query_executed_using_get(client, site_settings):
+    # given
+    query_hash = hash_query(QUERY_SHOP_NAME)
+    client.post(
+        API_PATH,
+        {
+            "query": QUERY_SHOP_NAME,
+            "extensions": _persisted_query_extensions(query_hash),
+        },
+        content_type="application/json",
+    )
+
+    # when
+    response = client.get(
+        API_PATH,
+        {"extensions": json.dumps(_persisted_query_extensions(query_hash))},
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert response["Cache-Control"] == "public, max-age=60"
+    assert response["Vary"] == "Authorization, Authorization-Bearer"
+
+
+def test_persisted_query_executed_using_get_by_staff_is_not_cached(
+    staff_api_client, site_settings
+):
+    # given
+    query_hash = hash_query(QUERY_SHOP_NAME)
+    staff_api_client.post(
+        {
+            "query": QUERY_SHOP_NAME,
+            "extensions": _persisted_query_extensions(query_hash),
+        }
+    )
+
+    # when
+    response = staff_api_client.get(
+        API_PATH,
+        {"extensions": json.dumps(_persisted_query_extensions(query_hash))},
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert response["Cache-Control"] == "private, no-cache"
+
+
+def test_query_without_persisted_query_hash_cannot_be_executed_using_get(client):
+    # when
+    response = client.get(
+        API_PATH, {"query": QUERY_SHOP_NAME, "extensions": json.dumps({})}
+    )
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "GET requests must contain the hash of a persisted query."
+    )
+
+
+def test_persisted_mutation_cannot_be_executed_using_get(client):
+    # given
+    query = "mutation { tokenRefresh { token } }"
+    query_hash = hash_query(query)
+    client.post(
+        API_PATH,
+        {"query": query, "extensions": _persisted_query_extensions(query_hash)},
+        content_type="application/json",
+    )
+
+    # when
+    response = client.get(
+        API_PATH,
+        {"extensions": json.dumps(_persisted_query_extensions(query_hash))},
+    )
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Only query operations can be performed using GET."
+    )
+
+
+def test_persisted_query_from_manifest(
+    api_client, site_settings, persisted_queries_manifest
+):
+    # given
+    data = {"extensions": _persisted_query_extensions(hash_query(QUERY_SHOP_NAME))}
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_allow_list_only_rejects_query_not_in_manifest(
+    api_client, settings, persisted_queries_manifest
+):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST_ONLY = True
+
+    # when
+    response = api_client.post_graphql("{ shop { domain { host } } }")
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+
+
+def test_allow_list_only_does_not_register_queries(
+    api_client, settings, persisted_queries_manifest
+):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST_ONLY = True
+    query = "{ shop { domain { host } } }"
+    query_hash = hash_query(query)
+
+    # when
+    response = api_client.post(
+        {"query": query, "extensions": _persisted_query_extensions(query_hash)}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+    assert cache.get(generate_persisted_query_cache_key(query_hash)) is None
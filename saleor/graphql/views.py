@@ -12,6 +12,7 @@ from django.db import connection
 from django.db.backends.postgresql.base import DatabaseWrapper
 from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
 from django.shortcuts import render
+from django.utils.cache import patch_cache_control, patch_vary_headers
 from django.views.generic import View
 from graphql import GraphQLDocument, get_default_backend
 from graphql.error import GraphQLError, GraphQLSyntaxError
@@ -19,17 +20,23 @@ from graphql.execution import ExecutionResult
 from jwt.exceptions import PyJWTError
 
 from .. import __version__ as saleor_version
+from ..core.auth import get_token_from_request
 from ..core.exceptions import PermissionDenied, ReadOnlyException
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from ..webhook import observability
 from .api import API_PATH, schema
 from .context import get_context_value
-from .core.validators.query_cost import validate_query_cost
+from .document_cache import CachedDocument, LRUCache
+from .persisted_queries import has_persisted_query_hash, resolve_persisted_query
 from .query_cost_map import COST_MAP
 from .utils import format_error, query_fingerprint, query_identifier
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
 
+document_cache: LRUCache[CachedDocument] = LRUCache(
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+)
+
 
 def tracing_wrapper(execute, sql, params, many, context):
     conn: DatabaseWrapper = context["connection"]
@@ -100,6 +107,10 @@ class GraphQLView(View):
     def dispatch(self, request, *args, **kwargs):
         # Handle options method the GraphQlView restricts it.
         if request.method == "GET":
+            # GET requests are allowed only for persisted queries, as these are
+            # small enough to be sent in the URL and can be cached by CDNs.
+            if "extensions" in request.GET:
+                return self.handle_query(request)
             if settings.PLAYGROUND_ENABLED:
                 return self.render_playground(request)
             return HttpResponseNotAllowed(["OPTIONS", "POST"])
@@ -130,6 +141,21 @@ class GraphQLView(View):
                 status=400,
             )
 
+        if request.method == "GET" and not has_persisted_query_hash(data):
+            return JsonResponse(
+                data={
+                    "errors": [
+                        self.format_error(
+                            GraphQLError(
+                                "GET requests must contain the hash of a persisted "
+                                "query."
+                            )
+                        )
+                    ]
+                },
+                status=400,
+            )
+
         if isinstance(data, list):
             responses = [self.get_response(request, entry) for entry in data]
             result: Union[list, Optional[dict]] = [
@@ -138,7 +164,29 @@ class GraphQLView(View):
             status_code = max((code for response, code in responses), default=200)
         else:
             result, status_code = self.get_response(request, data)
-        return JsonResponse(data=result, status=status_code, safe=False)
+        response = JsonResponse(data=result, status=status_code, safe=False)
+        if request.method == "GET":
+            self.set_cache_headers(request, response, result)
+        return response
+
+    @staticmethod
+    def set_cache_headers(request: HttpRequest, response: JsonResponse, result):
+        """Allow shared caches to store successful responses to anonymous requests.
+
+        Responses to GET requests depend only on the URL and the auth headers.
+        """
+        patch_vary_headers(response, ["Authorization", "Authorization-Bearer"])
+        max_age = settings.GRAPHQL_PERSISTED_QUERIES_CACHE_MAX_AGE
+        if (
+            max_age
+            and response.status_code == 200
+            and isinstance(result, dict)
+            and not result.get("errors")
+            and not get_token_from_request(request)
+        ):
+            patch_cache_control(response, public=True, max_age=max_age)
+        else:
+            patch_cache_control(response, private=True, no_cache=True)
 
     def handle_query(self, request: HttpRequest) -> JsonResponse:
         tracer = opentracing.global_tracer()
@@ -221,12 +269,15 @@ class GraphQLView(View):
 
     def parse_query(
         self, query: Optional[str]
-    ) -> Tuple[Optional[GraphQLDocument], Optional[ExecutionResult]]:
+    ) -> Tuple[Optional[CachedDocument], Optional[ExecutionResult]]:
         """Attempt to parse a query (mandatory) to a gql document object.
 
         If no query was given or query is not a string, it returns an error.
         If the query is invalid, it returns an error as well.
         Otherwise, it returns the parsed gql document.
+
+        Parsed documents are kept in the process-wide `document_cache`, keyed by
+        the schema and the hash of the query string.
         """
         if not query or not isinstance(query, str):
             return (
@@ -236,14 +287,20 @@ class GraphQLView(View):
                 ),
             )
 
+        key = (self.schema, generate_cache_key(query))
+        document = document_cache.get(key)
+        if document is not None:
+            return document, None
+
         # Attempt to parse the query, if it fails, return the error
         try:
-            return (
-                self.backend.document_from_string(self.schema, query),
-                None,
+            document = CachedDocument(
+                self.backend.document_from_string(self.schema, query)
             )
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
+        document_cache.set(key, document)
+        return document, None
 
     def check_if_query_contains_only_schema(self, document: GraphQLDocument):
         query_with_schema = False
@@ -268,7 +325,12 @@ class GraphQLView(View):
                 request.build_absolute_uri(request.get_full_path()),
             )
 
-            query, variables, operation_name = self.get_graphql_params(request, data)
+            try:
+                query, variables, operation_name = self.get_graphql_params(
+                    request, data
+                )
+            except GraphQLError as e:
+                return ExecutionResult(errors=[e], invalid=True)
 
             document, error = self.parse_query(query)
             with observability.report_gql_operation() as operation:
@@ -278,6 +340,19 @@ class GraphQLView(View):
             if error or document is None:
                 return error
 
+            if (
+                request.method == "GET"
+                and document.get_operation_type(operation_name) != "query"
+            ):
+                return ExecutionResult(
+                    errors=[
+                        GraphQLError(
+                            "Only query operations can be performed using GET."
+                        )
+                    ],
+                    invalid=True,
+                )
+
             raw_query_string = document.document_string
             span.set_tag("graphql.query", raw_query_string)
             span.set_tag("graphql.query_identifier", query_identifier(document))
@@ -289,9 +364,8 @@ class GraphQLView(View):
             except GraphQLError as e:
                 return ExecutionResult(errors=[e], invalid=True)
 
-            query_cost, cost_errors = validate_query_cost(
+            query_cost, cost_errors = document.get_query_cost(
                 schema,
-                document,
                 variables,
                 COST_MAP,
                 settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
@@ -324,14 +398,22 @@ class GraphQLView(View):
                         response = cache.get(key)
 
                     if not response:
-                        response = document.execute(
-                            root=self.get_root_value(),
-                            variables=variables,
-                            operation_name=operation_name,
-                            context=context,
-                            middleware=self.middleware,
-                            **extra_options,
-                        )
+                        # Schema validation results are cached on the document,
+                        # so the backend is asked to skip it.
+                        if validation_errors := document.get_validation_errors():
+                            response = ExecutionResult(
+                                errors=validation_errors, invalid=True
+                            )
+                        else:
+                            response = document.execute(
+                                root=self.get_root_value(),
+                                variables=variables,
+                                operation_name=operation_name,
+                                context=context,
+                                middleware=self.middleware,
+                                validate=False,
+                                **extra_options,
+                            )
                         if should_use_cache_for_scheme:
                             cache.set(key, response)
 
@@ -348,6 +430,12 @@ class GraphQLView(View):
 
     @staticmethod
     def parse_body(request: HttpRequest):
+        if request.method == "GET":
+            data = request.GET.dict()
+            for field in ["variables", "extensions"]:
+                if field in data:
+                    data[field] = json.loads(data[field])
+            return data
         content_type = request.content_type
         if content_type == "application/graphql":
             return {"query": request.body.decode("utf-8")}
@@ -362,6 +450,7 @@ class GraphQLView(View):
     def get_graphql_params(request: HttpRequest, data: dict):
         query = data.get("query")
         variables = data.get("variables")
+        extensions = data.get("extensions")
         operation_name = data.get("operationName")
         if operation_name == "null":
             operation_name = None
@@ -376,6 +465,8 @@ class GraphQLView(View):
                     obj_set(operations, file_instance, file_key, False)
             query = operations.get("query")
             variables = operations.get("variables")
+            extensions = operations.get("extensions")
+        query = resolve_persisted_query(query, extensions)
         return query, variables, operation_name
 
     @classmethod
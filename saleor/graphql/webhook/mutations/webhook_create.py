@@ -6,6 +6,7 @@ from django.core.exceptions import ValidationError
 from ....permission.auth_filters import AuthorizationFilters
 from ....permission.enums import AppPermission
 from ....webhook import models
+from ....webhook.cache import invalidate_webhooks_routing
 from ....webhook.error_codes import WebhookErrorCode
 from ....webhook.validators import (
     HEADERS_LENGTH_LIMIT,
@@ -184,3 +185,4 @@ class WebhookCreate(ModelMutation, NotifyUserEventValidationMixin):
                 for event in events
             ]
         )
+        invalidate_webhooks_routing()
@@ -3,6 +3,7 @@ import graphene
 from ....permission.auth_filters import AuthorizationFilters
 from ....permission.enums import AppPermission
 from ....webhook import models
+from ....webhook.cache import invalidate_webhooks_routing
 from ....webhook.validators import HEADERS_LENGTH_LIMIT, HEADERS_NUMBER_LIMIT
 from ...app.dataloaders import get_app_promise
 from ...core import ResolveInfo
@@ -107,6 +108,7 @@ class WebhookUpdate(WebhookCreate, NotifyUserEventValidationMixin):
                     for event in events
                 ]
             )
+            invalidate_webhooks_routing()
 
     @classmethod
     def get_instance(cls, info: ResolveInfo, **data):
@@ -1,11 +1,16 @@
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Set
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.utils import timezone
-from django.utils.functional import SimpleLazyObject
-from graphql import get_default_backend, parse
+from django.utils.functional import SimpleLazyObject, cached_property
+from graphql import get_default_backend, parse, validate
 from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult
+from graphql.language.visitor import TypeInfoVisitor, Visitor, visit
+from graphql.type.definition import get_named_type
+from graphql.utils.type_info import TypeInfo
 from promise import Promise
 
 from ...app.models import App
@@ -16,6 +21,12 @@ from ..utils import format_error
 
 logger = get_task_logger(__name__)
 
+# Types which fields are resolved depending on the app that receives the payload.
+APP_DEPENDENT_TYPES = {"App", "AppExtension", "AppToken", "Webhook"}
+
+# Number of subscription documents kept by each process.
+SUBSCRIPTION_DOCUMENTS_CACHE_SIZE = 512
+
 
 def initialize_request(
     requestor=None,
@@ -57,6 +68,70 @@ def get_event_payload(event):
     return event
 
 
+class _SelectedTypesVisitor(Visitor):
+    def __init__(self, type_info: TypeInfo):
+        self.type_info = type_info
+        self.type_names: Set[str] = set()
+
+    def enter_Field(self, node, *args):
+        field_type = self.type_info.get_type()
+        if field_type:
+            self.type_names.add(get_named_type(field_type).name)
+
+
+class SubscriptionDocument:
+    """Subscription query parsed and validated once, ready to be executed."""
+
+    def __init__(self, subscription_query: str):
+        from ..api import schema
+
+        graphql_backend = get_default_backend()
+        self.document = graphql_backend.document_from_string(
+            schema, parse(subscription_query)
+        )
+        self.validation_errors = validate(schema, self.document.document_ast)
+
+    @property
+    def normalized_query(self) -> str:
+        """Return the query printed in the canonical form.
+
+        Queries which differ only in formatting or comments have the same
+        normalized form.
+        """
+        return self.document.document_string
+
+    @cached_property
+    def is_app_dependent(self) -> bool:
+        """Return whether the payload can differ between apps with same permissions.
+
+        It's the case when the query selects any of the types which are resolved
+        differently for the app that owns them, e.g. the `recipient` of the event.
+        """
+        type_info = TypeInfo(self.document.schema)
+        visitor = _SelectedTypesVisitor(type_info)
+        visit(self.document.document_ast, TypeInfoVisitor(type_info, visitor))
+        return bool(visitor.type_names & APP_DEPENDENT_TYPES)
+
+    def execute(self, **kwargs):
+        if self.validation_errors:
+            return ExecutionResult(errors=self.validation_errors, invalid=True)
+        return self.document.execute(validate=False, **kwargs)
+
+
+@lru_cache(maxsize=SUBSCRIPTION_DOCUMENTS_CACHE_SIZE)
+def get_subscription_document(subscription_query: str) -> SubscriptionDocument:
+    """Return the document of the query, cached by the process."""
+    return SubscriptionDocument(subscription_query)
+
+
+def normalize_subscription_query(subscription_query: str) -> str:
+    return get_subscription_document(subscription_query).normalized_query
+
+
+def is_app_dependent_subscription_query(subscription_query: str) -> bool:
+    return get_subscription_document(subscription_query).is_app_dependent
+
+
 def generate_payload_from_subscription(
     event_type: str,
     subscribable_object,
@@ -80,21 +155,63 @@ def generate_payload_from_subscription(
     return: A payload ready to send via webhook. None if the function was not able to
     generate a payload
     """
-    from ..api import schema
+    return generate_payloads_from_subscription(
+        event_type, [subscribable_object], subscription_query, request, app
+    )[0]
+
+
+def generate_payloads_from_subscription(
+    event_type: str,
+    subscribable_objects: Sequence[Any],
+    subscription_query: Optional[str],
+    request: SaleorContext,
+    app: Optional[App] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """Generate webhook payloads for many objects from the same subscription query.
+
+    The query is executed for each object with a shared context.
+    Results are resolved only after the query is executed for all objects, so the
+    dataloaders load the data of all objects in the same batches.
+    return: A payload for each of the objects, None for the objects for which
+    the payload couldn't be generated.
+    """
     from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)  # type: ignore
-    document = graphql_backend.document_from_string(
-        schema,
-        ast,
-    )
+    document = get_subscription_document(subscription_query)  # type: ignore
     app_id = app.pk if app else None
     request.app = app
+    context = get_context_value(request)
+
+    results = []
+    for subscribable_object in subscribable_objects:
+        results.append(
+            _execute_subscription(
+                document,
+                subscription_query,
+                event_type,
+                subscribable_object,
+                context,
+                app_id,
+            )
+        )
+    return [
+        _get_payload_from_result(result) if result is not None else None
+        for result in results
+    ]
+
+
+def _execute_subscription(
+    document: SubscriptionDocument,
+    subscription_query: Optional[str],
+    event_type: str,
+    subscribable_object,
+    context: SaleorContext,
+    app_id: Optional[int],
+):
     results = document.execute(
         allow_subscriptions=True,
         root=(event_type, subscribable_object),
-        context=get_context_value(request),
+        context=context,
     )
     if hasattr(results, "errors"):
         logger.warning(
@@ -113,8 +230,10 @@ def generate_payload_from_subscription(
             extra={"query": subscription_query, "app": app_id},
         )
         return None
+    return payload[0]
+
 
-    payload_instance = payload[0]
+def _get_payload_from_result(payload_instance) -> Optional[Dict[str, Any]]:
     event_payload = get_event_payload(payload_instance.data.get("event"))
 
     if payload_instance.errors:
@@ -0,0 +1,60 @@
+from ....webhook.event_types import WebhookEventAsyncType
+from ..subscription_payload import (
+    generate_payload_from_subscription,
+    get_subscription_document,
+    initialize_request,
+)
+
+SUBSCRIPTION_QUERY = """
+    subscription {
+      event {
+        ... on ProductUpdated {
+          product {
+            id
+          }
+        }
+      }
+    }
+"""
+
+
+def test_get_subscription_document_is_cached():
+    # when
+    document = get_subscription_document(SUBSCRIPTION_QUERY)
+
+    # then
+    assert get_subscription_document(SUBSCRIPTION_QUERY) is document
+    assert not document.validation_errors
+
+
+def test_get_subscription_document_normalized_query():
+    # given
+    formatted_query = " ".join(SUBSCRIPTION_QUERY.split())
+
+    # when
+    document = get_subscription_document(formatted_query)
+
+    # then
+    assert document is not get_subscription_document(SUBSCRIPTION_QUERY)
+    assert (
+        document.normalized_query
+        == get_subscription_document(SUBSCRIPTION_QUERY).normalized_query
+    )
+
+
+def test_generate_payload_from_subscription_invalid_query(product, webhook_app):
+    # given
+    query = "subscription { event { ... on ProductUpdated { invalidField } } }"
+
+    # when
+    payload = generate_payload_from_subscription(
+        WebhookEventAsyncType.PRODUCT_UPDATED,
+        product,
+        query,
+        initialize_request(),
+        webhook_app,
+    )
+
+    # then
+    assert payload is None
+    assert get_subscription_document(query).validation_errors
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, List
 from django.apps import AppConfig
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 
 if TYPE_CHECKING:
@@ -14,11 +15,25 @@ class PluginConfig(AppConfig):
     verbose_name = "Plugins"
 
     def ready(self):
+        from .models import PluginConfiguration
+        from .signals import invalidate_plugin_configurations_cache
+
         plugins = getattr(settings, "PLUGINS", [])
 
         for plugin_path in plugins:
             self.load_and_check_plugin(plugin_path)
 
+        post_save.connect(
+            invalidate_plugin_configurations_cache,
+            sender=PluginConfiguration,
+            dispatch_uid="invalidate_plugin_configurations_on_save",
+        )
+        post_delete.connect(
+            invalidate_plugin_configurations_cache,
+            sender=PluginConfiguration,
+            dispatch_uid="invalidate_plugin_configurations_on_delete",
+        )
+
     def load_and_check_plugin(self, plugin_path: str):
         try:
             plugin = import_string(plugin_path)
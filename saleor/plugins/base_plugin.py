@@ -923,6 +923,12 @@ class BasePlugin:
     # created.
     product_created: Callable[["Product", Any], Any]
 
+    # Trigger when products are created by a bulk operation.
+    #
+    # Overwrite this method if you need to handle the products created in bulk at
+    # once. Otherwise `product_created` is called for each of them.
+    products_created: Callable[[List["Product"], Any], Any]
+
     # Trigger when product is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a product is
@@ -965,6 +971,12 @@ class BasePlugin:
     # variant is created.
     product_variant_created: Callable[["ProductVariant", Any], Any]
 
+    # Trigger when product variants are created by a bulk operation.
+    #
+    # Overwrite this method if you need to handle the product variants created in
+    # bulk at once. Otherwise `product_variant_created` is called for each of them.
+    product_variants_created: Callable[[List["ProductVariant"], Any], Any]
+
     # Trigger when product variant is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a product
@@ -977,6 +989,12 @@ class BasePlugin:
     # variant is updated.
     product_variant_updated: Callable[["ProductVariant", Any], Any]
 
+    # Trigger when product variants are updated by a bulk operation.
+    #
+    # Overwrite this method if you need to handle the product variants updated in
+    # bulk at once. Otherwise `product_variant_updated` is called for each of them.
+    product_variants_updated: Callable[[List["ProductVariant"], Any], Any]
+
     # Trigger when product variant metadata is updated.
     #
     # Overwrite this method if you need to trigger specific logic after a product
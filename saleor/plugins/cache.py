@@ -0,0 +1,79 @@
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import DefaultDict, Dict, Optional
+
+import opentracing
+from django.conf import settings
+
+from ..core.cache_version import get_version, invalidate
+from .models import PluginConfiguration
+
+PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY = "plugin_configurations_version"
+
+
+@dataclass(frozen=True)
+class PluginConfigurations:
+    version: str
+    global_configs: Dict[str, PluginConfiguration]
+    channel_configs: Dict[int, Dict[str, PluginConfiguration]]
+
+
+_plugin_configurations: Optional[PluginConfigurations] = None
+_lock = threading.Lock()
+
+
+def get_plugin_configurations() -> PluginConfigurations:
+    """Return plugin configurations stored in the database.
+
+    Configurations are kept in the process memory and reloaded only when the
+    version stamp stored in the cache changes, which happens every time any
+    `PluginConfiguration` is saved or deleted.
+    """
+    global _plugin_configurations
+
+    version = get_version(PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY)
+    configurations = _plugin_configurations
+    if configurations is not None and configurations.version == version:
+        return configurations
+    with _lock:
+        configurations = _load_plugin_configurations(version)
+        _plugin_configurations = configurations
+    return configurations
+
+
+def _load_plugin_configurations(version: str) -> PluginConfigurations:
+    with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
+        # Configurations are read from the primary database, as the replica may
+        # not contain the change that has invalidated the cache yet.
+        qs = PluginConfiguration.objects.using(
+            settings.DATABASE_CONNECTION_DEFAULT_NAME
+        ).all()
+        global_configs: Dict[str, PluginConfiguration] = {}
+        channel_configs: DefaultDict[int, Dict[str, PluginConfiguration]] = defaultdict(
+            dict
+        )
+        for db_plugin_config in qs:
+            if db_plugin_config.channel_id is None:
+                global_configs[db_plugin_config.identifier] = db_plugin_config
+            else:
+                channel_configs[db_plugin_config.channel_id][
+                    db_plugin_config.identifier
+                ] = db_plugin_config
+        return PluginConfigurations(
+            version=version,
+            global_configs=global_configs,
+            channel_configs=dict(channel_configs),
+        )
+
+
+def invalidate_plugin_configurations():
+    invalidate(PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY)
+
+
+def clear_plugin_configurations():
+    """Drop configurations cached by the current process."""
+    global _plugin_configurations
+
+    with _lock:
+        _plugin_configurations = None
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from copy import deepcopy
 from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
@@ -50,6 +51,7 @@ from ..payment.interface import (
 )
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
+from .cache import PluginConfigurations, get_plugin_configurations
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
@@ -88,11 +90,11 @@ NotifyEventTypeChoice = str
 
 
 class PluginsManager(PaymentInterface):
-    """Base manager for handling plugins logic."""
+    """Base manager for handling plugins logic.
 
-    plugins_per_channel: Dict[str, List["BasePlugin"]] = {}
-    global_plugins: List["BasePlugin"] = []
-    all_plugins: List["BasePlugin"] = []
+    Plugins are instantiated lazily: global plugins on first use and channel plugins
+    separately for each channel that is requested.
+    """
 
     def _load_plugin(
         self,
@@ -105,9 +107,10 @@ class PluginsManager(PaymentInterface):
         db_config = None
         if PluginClass.PLUGIN_ID in db_configs_map:
             db_config = db_configs_map[PluginClass.PLUGIN_ID]
-            plugin_config = db_config.configuration
+            # Configurations are shared between the managers of the same process,
+            # so each plugin gets its own copy.
+            plugin_config = deepcopy(db_config.configuration)
             active = db_config.active
-            channel = db_config.channel
         else:
             plugin_config = PluginClass.DEFAULT_CONFIGURATION
             active = PluginClass.get_default_active()
@@ -122,60 +125,130 @@ class PluginsManager(PaymentInterface):
         )
 
     def __init__(self, plugins: List[str], requestor_getter=None, allow_replica=True):
-        with opentracing.global_tracer().start_active_span("PluginsManager.__init__"):
-            self.all_plugins = []
-            self.global_plugins = []
-            self.plugins_per_channel = defaultdict(list)
-
-            global_db_configs, channel_db_configs = self._get_db_plugin_configs()
-            channels = Channel.objects.all()
-
-            for plugin_path in plugins:
-                with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
-                    if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
-                        plugin = self._load_plugin(
-                            PluginClass,
-                            global_db_configs,
-                            requestor_getter=requestor_getter,
-                            allow_replica=allow_replica,
-                        )
-                        self.global_plugins.append(plugin)
-                        self.all_plugins.append(plugin)
-                    else:
-                        for channel in channels:
-                            channel_configs = channel_db_configs.get(channel, {})
-                            plugin = self._load_plugin(
-                                PluginClass,
-                                channel_configs,
-                                channel,
-                                requestor_getter,
-                                allow_replica,
-                            )
-                            self.plugins_per_channel[channel.slug].append(plugin)
-                            self.all_plugins.append(plugin)
-
-            for channel in channels:
-                self.plugins_per_channel[channel.slug].extend(self.global_plugins)
-
-    def _get_db_plugin_configs(self):
-        with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
-            qs = (
-                PluginConfiguration.objects.all()
-                .using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-                .prefetch_related("channel")
+        self._plugin_paths = plugins
+        self.requestor_getter = requestor_getter
+        self.allow_replica = allow_replica
+        self._plugin_classes: Optional[List[Type["BasePlugin"]]] = None
+        self._global_plugins: Optional[List["BasePlugin"]] = None
+        self._plugins_per_channel: DefaultDict[str, List["BasePlugin"]] = defaultdict(
+            list
+        )
+        self._all_channels_loaded = False
+        self._all_plugins: Optional[List["BasePlugin"]] = None
+        self._db_configs: Optional[PluginConfigurations] = None
+        self._plugins_per_method: Dict[
+            Tuple[Optional[str], str], List["BasePlugin"]
+        ] = {}
+
+    @property
+    def plugin_classes(self) -> List[Type["BasePlugin"]]:
+        if self._plugin_classes is None:
+            self._plugin_classes = [
+                import_string(plugin_path) for plugin_path in self._plugin_paths
+            ]
+        return self._plugin_classes
+
+    @property
+    def global_plugins(self) -> List["BasePlugin"]:
+        if self._global_plugins is None:
+            with opentracing.global_tracer().start_active_span(
+                "PluginsManager.load_global_plugins"
+            ):
+                global_db_configs = self._get_db_plugin_configs().global_configs
+                self._global_plugins = [
+                    self._load_plugin(
+                        PluginClass,
+                        global_db_configs,
+                        requestor_getter=self.requestor_getter,
+                        allow_replica=self.allow_replica,
+                    )
+                    for PluginClass in self.plugin_classes
+                    if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False)
+                ]
+        return self._global_plugins
+
+    @property
+    def plugins_per_channel(self) -> DefaultDict[str, List["BasePlugin"]]:
+        if not self._all_channels_loaded:
+            for channel in Channel.objects.all():
+                if channel.slug not in self._plugins_per_channel:
+                    self._load_channel_plugins(channel)
+            self._all_channels_loaded = True
+        return self._plugins_per_channel
+
+    @property
+    def all_plugins(self) -> List["BasePlugin"]:
+        if self._all_plugins is None:
+            plugins_per_channel = self.plugins_per_channel
+            all_plugins = []
+            for PluginClass in self.plugin_classes:
+                if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
+                    all_plugins.extend(
+                        plugin
+                        for plugin in self.global_plugins
+                        if type(plugin) is PluginClass
+                    )
+                    continue
+                for plugins in plugins_per_channel.values():
+                    all_plugins.extend(
+                        plugin for plugin in plugins if type(plugin) is PluginClass
+                    )
+            self._all_plugins = all_plugins
+        return self._all_plugins
+
+    def _load_channel_plugins(self, channel: "Channel") -> List["BasePlugin"]:
+        with opentracing.global_tracer().start_active_span(
+            "PluginsManager.load_channel_plugins"
+        ):
+            channel_configs = self._get_db_plugin_configs().channel_configs.get(
+                channel.pk, {}
             )
-            channel_configs: DefaultDict[Channel, Dict] = defaultdict(dict)
-            global_configs = {}
-            for db_plugin_config in qs:
-                channel = db_plugin_config.channel
-                if channel is None:
-                    global_configs[db_plugin_config.identifier] = db_plugin_config
-                else:
-                    channel_configs[channel][
-                        db_plugin_config.identifier
-                    ] = db_plugin_config
-            return global_configs, channel_configs
+            plugins = [
+                self._load_plugin(
+                    PluginClass,
+                    channel_configs,
+                    channel,
+                    self.requestor_getter,
+                    self.allow_replica,
+                )
+                for PluginClass in self.plugin_classes
+                if getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False)
+            ]
+            plugins.extend(self.global_plugins)
+            self._plugins_per_channel[channel.slug] = plugins
+            return plugins
+
+    def _get_db_plugin_configs(self) -> PluginConfigurations:
+        if self._db_configs is None:
+            self._db_configs = get_plugin_configurations()
+        return self._db_configs
+
+    def _get_channel_plugins(self, channel_slug: str) -> List["BasePlugin"]:
+        if channel_slug in self._plugins_per_channel or self._all_channels_loaded:
+            return self._plugins_per_channel[channel_slug]
+        channel = Channel.objects.filter(slug=channel_slug).first()
+        if not channel:
+            return self._plugins_per_channel[channel_slug]
+        return self._load_channel_plugins(channel)
+
+    def _get_plugins_implementing(
+        self, method_name: str, channel_slug: Optional[str] = None
+    ) -> List["BasePlugin"]:
+        """Return plugins for a given channel that implement the given method.
+
+        `BasePlugin` only declares the hooks, so the plugins that don't override
+        the method are skipped. The result is memoized per manager.
+        """
+        key = (channel_slug or None, method_name)
+        plugins = self._plugins_per_method.get(key)
+        if plugins is None:
+            plugins = [
+                plugin
+                for plugin in self.get_plugins(channel_slug=channel_slug)
+                if hasattr(plugin, method_name)
+            ]
+            self._plugins_per_method[key] = plugins
+        return plugins
 
     def __run_method_on_plugins(
         self,
@@ -187,13 +260,34 @@ class PluginsManager(PaymentInterface):
     ):
         """Try to run a method with the given name on each declared active plugin."""
         value = default_value
-        plugins = self.get_plugins(channel_slug=channel_slug, active_only=True)
+        plugins = self._get_plugins_implementing(method_name, channel_slug)
         for plugin in plugins:
+            if not plugin.active:
+                continue
             value = self.__run_method_on_single_plugin(
                 plugin, method_name, value, *args, **kwargs
             )
         return value
 
+    def __run_method_on_plugins_in_bulk(
+        self, bulk_method_name: str, method_name: str, objects: List[Any]
+    ):
+        """Run the bulk method on plugins that implement it.
+
+        The method for a single object is called for each of the objects on the
+        plugins that don't implement the bulk method.
+        """
+        for plugin in self.get_plugins():
+            if not plugin.active:
+                continue
+            if hasattr(plugin, bulk_method_name):
+                self.__run_method_on_single_plugin(
+                    plugin, bulk_method_name, None, objects
+                )
+            elif hasattr(plugin, method_name):
+                for obj in objects:
+                    self.__run_method_on_single_plugin(plugin, method_name, None, obj)
+
     def __run_method_on_single_plugin(
         self,
         plugin: Optional["BasePlugin"],
@@ -622,6 +716,11 @@ class PluginsManager(PaymentInterface):
         default_value = None
         return self.__run_method_on_plugins("product_created", default_value, product)
 
+    def products_created(self, products: List["Product"]):
+        return self.__run_method_on_plugins_in_bulk(
+            "products_created", "product_created", products
+        )
+
     def product_updated(self, product: "Product"):
         default_value = None
         return self.__run_method_on_plugins("product_updated", default_value, product)
@@ -668,6 +767,16 @@ class PluginsManager(PaymentInterface):
             "product_variant_updated", default_value, product_variant
         )
 
+    def product_variants_created(self, product_variants: List["ProductVariant"]):
+        return self.__run_method_on_plugins_in_bulk(
+            "product_variants_created", "product_variant_created", product_variants
+        )
+
+    def product_variants_updated(self, product_variants: List["ProductVariant"]):
+        return self.__run_method_on_plugins_in_bulk(
+            "product_variants_updated", "product_variant_updated", product_variants
+        )
+
     def product_variant_deleted(self, product_variant: "ProductVariant"):
         default_value = None
         return self.__run_method_on_plugins(
@@ -1590,7 +1699,7 @@ class PluginsManager(PaymentInterface):
     ) -> List["BasePlugin"]:
         """Return list of plugins for a given channel."""
         if channel_slug:
-            plugins = self.plugins_per_channel[channel_slug]
+            plugins = self._get_channel_plugins(channel_slug)
         else:
             plugins = self.all_plugins
 
@@ -1704,7 +1813,7 @@ class PluginsManager(PaymentInterface):
         *args,
         channel_slug: Optional[str] = None,
     ):
-        plugins = self.get_plugins(channel_slug=channel_slug)
+        plugins = self._get_plugins_implementing(method_name, channel_slug)
         for plugin in plugins:
             result = self.__run_method_on_single_plugin(
                 plugin, method_name, None, *args
@@ -1958,9 +2067,7 @@ class PluginsManager(PaymentInterface):
         self, event: str, channel_slug: Optional[str] = None
     ) -> bool:
         """Check if any plugin supports defined event."""
-        plugins = (
-            self.plugins_per_channel[channel_slug] if channel_slug else self.all_plugins
-        )
+        plugins = self.get_plugins(channel_slug=channel_slug)
         only_active_plugins = [plugin for plugin in plugins if plugin.active]
         return any([plugin.is_event_active(event) for plugin in only_active_plugins])
 
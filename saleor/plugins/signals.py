@@ -0,0 +1,6 @@
+from ..core.cache_version import invalidate_on_commit
+from .cache import PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY
+
+invalidate_plugin_configurations_cache = invalidate_on_commit(
+    PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY
+)
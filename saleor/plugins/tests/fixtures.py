@@ -2,7 +2,9 @@ import copy
 
 import pytest
 
+from ...tests.utils import reset_cache_version
 from ..base_plugin import ConfigurationTypeField
+from ..cache import PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY, clear_plugin_configurations
 from ..manager import PluginsManager
 from ..models import PluginConfiguration
 from .sample_plugins import (
@@ -13,6 +15,12 @@ from .sample_plugins import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_plugin_configurations_cache():
+    clear_plugin_configurations()
+    reset_cache_version(PLUGIN_CONFIGURATIONS_VERSION_CACHE_KEY)
+
+
 @pytest.fixture
 def plugin_configuration(db):
     configuration, _ = PluginConfiguration.objects.get_or_create(
@@ -36,6 +36,7 @@ from ..tests.sample_plugins import (
     ALL_PLUGINS,
     ActiveDummyPaymentGateway,
     ActivePaymentGateway,
+    ActivePlugin,
     ChannelPluginSample,
     InactivePaymentGateway,
     PluginInactive,
@@ -975,7 +976,7 @@ def test_run_method_on_plugins_only_on_active_ones(
     mocked_method, channel_USD, all_plugins_manager
 ):
     all_plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method_name",
+        method_name="process_payment",
         default_value="default_value",
     )
     active_plugins_count = len(ACTIVE_PLUGINS)
@@ -985,10 +986,13 @@ def test_run_method_on_plugins_only_on_active_ones(
         len([p for p in all_plugins_manager.all_plugins if p.active])
         == active_plugins_count
     )
-    assert mocked_method.call_count == active_plugins_count
+    assert mocked_method.call_count == 2
 
     called_plugins_id = [arg.args[0].PLUGIN_ID for arg in mocked_method.call_args_list]
-    expected_active_plugins_id = [p.PLUGIN_ID for p in ACTIVE_PLUGINS]
+    expected_active_plugins_id = [
+        ActivePaymentGateway.PLUGIN_ID,
+        ActiveDummyPaymentGateway.PLUGIN_ID,
+    ]
 
     assert called_plugins_id == expected_active_plugins_id
 
@@ -1017,7 +1021,7 @@ def test_run_method_on_plugins_only_for_given_channel(
 
     # when
     plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method",
+        method_name="process_payment",
         default_value=default_value,
         channel_slug=channel_USD.slug,
     )
@@ -1030,6 +1034,42 @@ def test_run_method_on_plugins_only_for_given_channel(
     assert called_plugins_id == {usd_plugin_1.PLUGIN_ID, usd_plugin_2.PLUGIN_ID}
 
 
+@mock.patch(
+    "saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_single_plugin"
+)
+def test_run_method_on_plugins_skips_plugins_without_method(
+    mocked_method, channel_USD, all_plugins_manager
+):
+    # when
+    all_plugins_manager._PluginsManager__run_method_on_plugins(
+        method_name="method_does_not_exist",
+        default_value="default_value",
+    )
+
+    # then
+    mocked_method.assert_not_called()
+
+
+def test_get_plugins_implementing_method_is_memoized(channel_USD, all_plugins_manager):
+    # given
+    plugins = all_plugins_manager._get_plugins_implementing(
+        "process_payment", channel_USD.slug
+    )
+
+    # when
+    cached_plugins = all_plugins_manager._get_plugins_implementing(
+        "process_payment", channel_USD.slug
+    )
+
+    # then
+    assert cached_plugins is plugins
+    assert [type(plugin) for plugin in plugins] == [
+        ActivePaymentGateway,
+        ActiveDummyPaymentGateway,
+        InactivePaymentGateway,
+    ]
+
+
 def test_run_method_on_single_plugin_method_does_not_exist(plugins_manager):
     default_value = "default_value"
     method_name = "method_does_not_exist"
@@ -1390,3 +1430,111 @@ def test_stored_payment_method_request_delete(
     mocked_stored_payment_method_request_delete.assert_called_once_with(
         request_delete_data, previous_value=previous_response
     )
+
+
+def test_manager_loads_plugins_lazily(
+    settings, channel_USD, channel_PLN, django_assert_num_queries
+):
+    # given
+    settings.PLUGINS = [
+        "saleor.plugins.tests.sample_plugins.ChannelPluginSample",
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+    ]
+
+    # when
+    with django_assert_num_queries(0):
+        manager = get_plugins_manager()
+    plugins = manager.get_plugins(channel_slug=channel_USD.slug)
+
+    # then
+    assert len(plugins) == 2
+    assert {plugin.channel for plugin in plugins} == {channel_USD, None}
+    assert set(manager._plugins_per_channel.keys()) == {channel_USD.slug}
+
+
+def test_manager_get_plugins_for_not_existing_channel(settings, channel_USD):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    manager = get_plugins_manager()
+
+    # when
+    plugins = manager.get_plugins(channel_slug="not-existing")
+
+    # then
+    assert plugins == []
+
+
+def test_manager_reuses_plugin_configurations_between_instances(
+    settings, channel_USD, plugin_configuration, django_assert_num_queries
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    get_plugins_manager().get_plugins()
+
+    # when
+    with django_assert_num_queries(1):
+        plugins = get_plugins_manager().get_plugins()
+
+    # then
+    assert len(plugins) == 1
+    assert plugins[0].db_config == plugin_configuration
+
+
+def test_manager_plugin_configurations_invalidated_on_save(
+    settings, channel_USD, plugin_configuration
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    plugin = get_plugins_manager().get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin.active
+
+    # when
+    plugin_configuration.active = False
+    plugin_configuration.save(update_fields=["active"])
+
+    # then
+    plugin = get_plugins_manager().get_plugin(PluginSample.PLUGIN_ID)
+    assert not plugin.active
+
+
+def test_manager_product_variants_created_calls_bulk_method(monkeypatch, variant):
+    # given
+    bulk_method_mock = mock.Mock(return_value=None)
+    method_mock = mock.Mock(return_value=None)
+    monkeypatch.setattr(
+        ActivePlugin, "product_variants_created", bulk_method_mock, raising=False
+    )
+    monkeypatch.setattr(
+        ActivePlugin, "product_variant_created", method_mock, raising=False
+    )
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.ActivePlugin"]
+    )
+
+    # when
+    manager.product_variants_created([variant])
+
+    # then
+    bulk_method_mock.assert_called_once_with([variant], previous_value=None)
+    method_mock.assert_not_called()
+
+
+def test_manager_product_variants_created_falls_back_to_method_per_variant(
+    monkeypatch, product_variant_list
+):
+    # given
+    method_mock = mock.Mock(return_value=None)
+    monkeypatch.setattr(
+        ActivePlugin, "product_variant_created", method_mock, raising=False
+    )
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.ActivePlugin"]
+    )
+
+    # when
+    manager.product_variants_created(product_variant_list)
+
+    # then
+    assert method_mock.call_args_list == [
+        mock.call(variant, previous_value=None) for variant in product_variant_list
+    ]
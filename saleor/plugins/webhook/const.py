@@ -2,3 +2,5 @@ CACHE_EXCLUDED_SHIPPING_KEY = "webhook_exclude_shipping_id_"
 CACHE_EXCLUDED_SHIPPING_TIME = 60 * 3
 EXCLUDED_SHIPPING_REQUEST_TIMEOUT = 2
 WEBHOOK_CACHE_DEFAULT_TIMEOUT: int = 5 * 60  # 5 minutes
+# Interval of checking whether the response was cached by a concurrent request.
+WEBHOOK_CACHE_LOCK_POLL_INTERVAL: float = 0.05
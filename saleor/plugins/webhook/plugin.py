@@ -1,6 +1,7 @@
 import json
 import logging
 from decimal import Decimal
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -73,7 +74,7 @@ from ...webhook.payloads import (
     generate_transaction_session_payload,
     generate_translation_payload,
 )
-from ...webhook.utils import get_webhooks_for_event
+from ...webhook.utils import any_webhooks_for_event, get_webhooks_for_event
 from ..base_plugin import BasePlugin, ExcludedShippingMethod
 from .const import CACHE_EXCLUDED_SHIPPING_KEY, WEBHOOK_CACHE_DEFAULT_TIMEOUT
 from .shipping import (
@@ -88,12 +89,14 @@ from .stored_payment_methods import (
     invalidate_cache_for_stored_payment_methods,
 )
 from .tasks import (
+    WebhookPayloadData,
     send_webhook_request_async,
     trigger_all_webhooks_sync,
     trigger_transaction_request,
     trigger_webhook_sync,
     trigger_webhook_sync_if_not_cached,
     trigger_webhooks_async,
+    trigger_webhooks_async_for_multiple_objects,
 )
 from .utils import (
     DEFAULT_TAX_CODE,
@@ -137,6 +140,9 @@ if TYPE_CHECKING:
 
 
 CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT: Final[int] = 5 * 60  # 5 minutes
+# Time for which the expired shipping methods are still returned, while they are
+# refreshed in the background.
+CACHE_STALE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT: Final[int] = 5 * 60
 
 
 logger = logging.getLogger(__name__)
@@ -1125,6 +1131,26 @@ class WebhookPlugin(BasePlugin):
                 product_data, event_type, webhooks, product, self.requestor
             )
 
+    def products_created(self, products: List["Product"], previous_value: Any) -> Any:
+        if not self.active:
+            return previous_value
+        event_type = WebhookEventAsyncType.PRODUCT_CREATED
+        if webhooks := get_webhooks_for_event(event_type):
+            trigger_webhooks_async_for_multiple_objects(
+                event_type,
+                webhooks,
+                [
+                    WebhookPayloadData(
+                        subscribable_object=product,
+                        legacy_data_generator=partial(
+                            generate_product_payload, product, self.requestor
+                        ),
+                    )
+                    for product in products
+                ],
+                self.requestor,
+            )
+
     def product_updated(self, product: "Product", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
@@ -1249,6 +1275,45 @@ class WebhookPlugin(BasePlugin):
                 self.requestor,
             )
 
+    def product_variants_created(
+        self, product_variants: List["ProductVariant"], previous_value: Any
+    ) -> Any:
+        if not self.active:
+            return previous_value
+        self._trigger_product_variants_event(
+            WebhookEventAsyncType.PRODUCT_VARIANT_CREATED, product_variants
+        )
+
+    def product_variants_updated(
+        self, product_variants: List["ProductVariant"], previous_value: Any
+    ) -> Any:
+        if not self.active:
+            return previous_value
+        self._trigger_product_variants_event(
+            WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED, product_variants
+        )
+
+    def _trigger_product_variants_event(
+        self, event_type: str, product_variants: List["ProductVariant"]
+    ):
+        if webhooks := get_webhooks_for_event(event_type):
+            trigger_webhooks_async_for_multiple_objects(
+                event_type,
+                webhooks,
+                [
+                    WebhookPayloadData(
+                        subscribable_object=product_variant,
+                        legacy_data_generator=partial(
+                            generate_product_variant_payload,
+                            [product_variant],
+                            self.requestor,
+                        ),
+                    )
+                    for product_variant in product_variants
+                ],
+                self.requestor,
+            )
+
     def product_variant_deleted(
         self, product_variant: "ProductVariant", previous_value: Any
     ) -> Any:
@@ -1744,9 +1809,10 @@ class WebhookPlugin(BasePlugin):
             return previous_value
 
         event_type = WebhookEventSyncType.STORED_PAYMENT_METHOD_DELETE_REQUESTED
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             event_type, apps_identifier=[app_data.app_identifier]
-        ).first()
+        )
+        webhook = webhooks[0] if webhooks else None
 
         if not webhook:
             return previous_value
@@ -1921,7 +1987,8 @@ class WebhookPlugin(BasePlugin):
             )
 
         for app in apps:
-            webhook = get_webhooks_for_event(event_type, app.webhooks.all()).first()
+            webhooks = get_webhooks_for_event(event_type, apps_ids=[app.id])
+            webhook = webhooks[0] if webhooks else None
             if not webhook:
                 raise PaymentError(f"No payment webhook found for event: {event_type}.")
             response_data = trigger_webhook_sync(
@@ -2035,12 +2102,13 @@ class WebhookPlugin(BasePlugin):
                 app_identifier=transaction_session_data.payment_gateway_data.app_identifier,
                 error=error,
             )
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             webhook_event,
             apps_identifier=[
                 transaction_session_data.payment_gateway_data.app_identifier
             ],
-        ).first()
+        )
+        webhook = webhooks[0] if webhooks else None
         if not webhook:
             error = (
                 "Unable to find an active webhook for "
@@ -2270,6 +2338,7 @@ class WebhookPlugin(BasePlugin):
                     subscribable_object=checkout,
                     request_timeout=WEBHOOK_SYNC_TIMEOUT,
                     cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                    stale_timeout=CACHE_STALE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
                 )
 
                 if response_data:
@@ -2356,5 +2425,5 @@ class WebhookPlugin(BasePlugin):
         }
 
         if event in map_event:
-            return any(get_webhooks_for_event(event_type=map_event[event]))
+            return any_webhooks_for_event(event_type=map_event[event])
         return False
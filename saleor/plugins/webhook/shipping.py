@@ -19,7 +19,7 @@ from ...webhook.utils import get_webhooks_for_event
 from ..base_plugin import ExcludedShippingMethod
 from ..const import APP_ID_PREFIX
 from .const import CACHE_EXCLUDED_SHIPPING_TIME, EXCLUDED_SHIPPING_REQUEST_TIMEOUT
-from .tasks import trigger_webhook_sync
+from .tasks import trigger_webhooks_sync
 
 logger = logging.getLogger(__name__)
 
@@ -97,7 +97,7 @@ def get_excluded_shipping_methods_or_fetch(
     """Return data of all excluded shipping methods.
 
     The data will be fetched from the cache. If missing it will fetch it from all
-    defined webhooks by calling a request to each of them one by one.
+    defined webhooks by sending the requests to them concurrently.
     """
     cached_data = cache.get(cache_key)
     if cached_data:
@@ -109,16 +109,14 @@ def get_excluded_shipping_methods_or_fetch(
 
     excluded_methods = []
     # Gather responses from webhooks
-    for webhook in webhooks:
-        if not webhook:
-            continue
-        response_data = trigger_webhook_sync(
-            event_type,
-            payload,
-            webhook,
-            subscribable_object=subscribable_object,
-            timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-        )
+    responses = trigger_webhooks_sync(
+        event_type,
+        payload,
+        [webhook for webhook in webhooks if webhook],
+        subscribable_object=subscribable_object,
+        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
+    )
+    for response_data in responses:
         if response_data:
             excluded_methods.extend(
                 get_excluded_shipping_methods_from_response(response_data)
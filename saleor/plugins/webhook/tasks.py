@@ -1,33 +1,51 @@
 import json
 import logging
+import time
+from collections import defaultdict
+from concurrent.futures import wait
 from dataclasses import dataclass
+from datetime import timedelta
 from enum import Enum
 from json import JSONDecodeError
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from urllib.parse import unquote, urlparse, urlunparse
 
 import boto3
-import requests
 from botocore.exceptions import ClientError
 from celery import group
 from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 from django.urls import reverse
+from django.utils import timezone
 from google.cloud import pubsub_v1
 from requests.exceptions import RequestException
 
 from ...app.headers import AppHeaders, DeprecatedAppHeaders
 from ...celeryconf import app
 from ...core import EventDeliveryStatus
-from ...core.models import EventDelivery, EventPayload
-from ...core.tracing import webhooks_opentracing_trace
+from ...core.models import EventDelivery, EventDeliveryAttempt, EventPayload
+from ...core.tracing import opentracing_trace, webhooks_opentracing_trace
 from ...core.utils import build_absolute_uri
 from ...core.utils.events import call_event
 from ...graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
+    generate_payloads_from_subscription,
     initialize_request,
+    is_app_dependent_subscription_query,
+    normalize_subscription_query,
 )
 from ...graphql.webhook.subscription_types import WEBHOOK_TYPES_MAP
 from ...payment import PaymentError
@@ -44,19 +62,28 @@ from ...webhook.observability import WebhookData
 from ...webhook.payloads import generate_transaction_action_request_payload
 from ...webhook.utils import get_webhooks_for_event
 from . import signature_for_payload
-from .const import WEBHOOK_CACHE_DEFAULT_TIMEOUT
+from .const import WEBHOOK_CACHE_DEFAULT_TIMEOUT, WEBHOOK_CACHE_LOCK_POLL_INTERVAL
 from .utils import (
+    ATTEMPT_RESPONSE_FIELDS,
     attempt_update,
     catch_duration_time,
+    clear_successful_deliveries,
     clear_successful_delivery,
     create_attempt,
+    create_attempts,
     create_event_delivery_list_for_webhooks,
+    create_event_payloads,
     delivery_update,
     generate_cache_key_for_webhook,
+    get_deliveries_for_webhooks,
     get_delivery_for_webhook,
+    get_webhook_http_session,
+    get_webhook_sync_executor,
+    set_attempt_response,
 )
 
 if TYPE_CHECKING:
+    from ...app.models import App
     from ...webhook.models import Webhook
 
 logger = logging.getLogger(__name__)
@@ -94,44 +121,101 @@ def create_deliveries_for_subscriptions(
     :param requestor: used in subscription webhooks to generate meta data for payload.
     :return: List of event deliveries to send via webhook tasks.
     """
+    return create_deliveries_for_multiple_subscription_objects(
+        event_type, [subscribable_object], webhooks, requestor
+    )
+
+
+def create_deliveries_for_multiple_subscription_objects(
+    event_type, subscribable_objects, webhooks, requestor=None
+) -> List[EventDelivery]:
+    """Create event deliveries for each of the objects and each of the webhooks.
+
+    Payloads of all objects are generated at once for each webhook, so the data is
+    loaded in batches shared by all objects.
+
+    :param event_type: event type which should be triggered.
+    :param subscribable_objects: subscribable objects to process via subscription
+    query.
+    :param webhooks: sequence of async webhooks.
+    :param requestor: used in subscription webhooks to generate meta data for payload.
+    :return: List of event deliveries to send via webhook tasks.
+    """
     if event_type not in WEBHOOK_TYPES_MAP:
         logger.info(
             "Skipping subscription webhook. Event %s is not subscribable.", event_type
         )
         return []
 
-    event_payloads = []
-    event_deliveries = []
-    for webhook in webhooks:
-        data = generate_payload_from_subscription(
+    payloads: List[str] = []
+    payloads_webhooks: List[List["Webhook"]] = []
+    for webhooks_group in group_webhooks_by_subscription_payload(webhooks):
+        # Webhooks of the group receive the same payloads, which are generated with
+        # the app of the first one.
+        payloads_data = generate_payloads_from_subscription(
             event_type=event_type,
-            subscribable_object=subscribable_object,
-            subscription_query=webhook.subscription_query,
+            subscribable_objects=subscribable_objects,
+            subscription_query=webhooks_group[0].subscription_query,
             request=initialize_request(
                 requestor,
                 event_type in WebhookEventSyncType.ALL,
                 event_type=event_type,
             ),
-            app=webhook.app,
+            app=webhooks_group[0].app,
         )
-        if not data:
-            logger.info(
-                "No payload was generated with subscription for event: %s" % event_type
-            )
-            continue
-        event_payload = EventPayload(payload=json.dumps({**data}))
-        event_payloads.append(event_payload)
-        event_deliveries.append(
+        for data in payloads_data:
+            if not data:
+                logger.info(
+                    "No payload was generated with subscription for event: %s"
+                    % event_type
+                )
+                continue
+            payloads.append(json.dumps({**data}))
+            payloads_webhooks.append(webhooks_group)
+
+    event_payloads = create_event_payloads(payloads)
+    return EventDelivery.objects.bulk_create(
+        [
             EventDelivery(
                 status=EventDeliveryStatus.PENDING,
                 event_type=event_type,
                 payload=event_payload,
                 webhook=webhook,
             )
-        )
+            for event_payload, webhooks_group in zip(event_payloads, payloads_webhooks)
+            for webhook in webhooks_group
+        ]
+    )
 
-    EventPayload.objects.bulk_create(event_payloads)
-    return EventDelivery.objects.bulk_create(event_deliveries)
+
+def group_webhooks_by_subscription_payload(webhooks) -> List[List["Webhook"]]:
+    """Group the webhooks which receive the same subscription payload.
+
+    Payloads are the same for the webhooks with equal normalized subscription
+    queries, when their apps have the same permissions. Queries that select data
+    resolved differently for each app are grouped only within the same app.
+    """
+    webhooks_per_query: Dict[str, List["Webhook"]] = defaultdict(list)
+    for webhook in webhooks:
+        query = normalize_subscription_query(webhook.subscription_query)
+        webhooks_per_query[query].append(webhook)
+
+    groups = []
+    for query, query_webhooks in webhooks_per_query.items():
+        if len(query_webhooks) == 1:
+            groups.append(query_webhooks)
+            continue
+        app_dependent = is_app_dependent_subscription_query(query)
+        webhooks_per_app: Dict[Any, List["Webhook"]] = defaultdict(list)
+        for webhook in query_webhooks:
+            key = (
+                webhook.app_id
+                if app_dependent
+                else frozenset(webhook.app.get_permissions())
+            )
+            webhooks_per_app[key].append(webhook)
+        groups.extend(webhooks_per_app.values())
+    return groups
 
 
 def create_delivery_for_subscription_sync_event(
@@ -216,8 +300,69 @@ def trigger_webhooks_async(
             )
         )
 
-    for delivery in deliveries:
-        send_webhook_request_async.delay(delivery.id)
+    send_webhook_requests_async(deliveries)
+
+
+@dataclass
+class WebhookPayloadData:
+    subscribable_object: Any
+    # Generates the payload for the webhooks without a subscription query.
+    legacy_data_generator: Callable[[], str]
+
+
+def trigger_webhooks_async_for_multiple_objects(
+    event_type: str,
+    webhooks,
+    webhook_payloads_data: List[WebhookPayloadData],
+    requestor=None,
+):
+    """Trigger async webhooks for each of the objects of a bulk operation.
+
+    Payloads and deliveries of all objects are created in bulk.
+
+    :param event_type: used in both webhook types as event type.
+    :param webhooks: used in both webhook types, queryset of async webhooks.
+    :param webhook_payloads_data: subscribable objects and generators of payloads
+    for regular webhooks.
+    :param requestor: used in subscription webhooks to generate meta data for payload.
+    """
+    regular_webhooks, subscription_webhooks = group_webhooks_by_subscription(webhooks)
+    deliveries: List[EventDelivery] = []
+    if regular_webhooks:
+        payloads = create_event_payloads(
+            [
+                payload_data.legacy_data_generator()
+                for payload_data in webhook_payloads_data
+            ]
+        )
+        deliveries.extend(
+            EventDelivery.objects.bulk_create(
+                [
+                    EventDelivery(
+                        status=EventDeliveryStatus.PENDING,
+                        event_type=event_type,
+                        payload=payload,
+                        webhook=webhook,
+                    )
+                    for payload in payloads
+                    for webhook in regular_webhooks
+                ]
+            )
+        )
+    if subscription_webhooks:
+        deliveries.extend(
+            create_deliveries_for_multiple_subscription_objects(
+                event_type=event_type,
+                subscribable_objects=[
+                    payload_data.subscribable_object
+                    for payload_data in webhook_payloads_data
+                ],
+                webhooks=subscription_webhooks,
+                requestor=requestor,
+            )
+        )
+
+    send_webhook_requests_async(deliveries)
 
 
 def group_webhooks_by_subscription(webhooks):
@@ -236,35 +381,133 @@ def trigger_webhook_sync_if_not_cached(
     request_timeout=None,
     cache_timeout=None,
     request=None,
+    stale_timeout: int = 0,
 ) -> Optional[dict]:
     """Get response for synchronous webhook.
 
     - Send a synchronous webhook request if cache is expired.
     - Fetch response from cache if it is still valid.
+    - Fetch response from cache for `stale_timeout` seconds after it expired and
+      refresh it in the background.
+
+    Only one request for the same cache key is sent at a time, concurrent calls wait
+    for its response instead of sending their own.
     """
 
     cache_key = generate_cache_key_for_webhook(
         cache_data, webhook.target_url, event_type, webhook.app_id
     )
-    response_data = cache.get(cache_key)
-    if response_data is None:
-        response_data = trigger_webhook_sync(
-            event_type,
-            payload,
-            webhook,
-            subscribable_object=subscribable_object,
-            timeout=request_timeout,
-            request=request,
-        )
-        if response_data is not None:
-            cache.set(
-                cache_key,
-                response_data,
-                timeout=cache_timeout or WEBHOOK_CACHE_DEFAULT_TIMEOUT,
+    lock_key = f"{cache_key}-lock"
+    cache_timeout = cache_timeout or WEBHOOK_CACHE_DEFAULT_TIMEOUT
+    lock_timeout = request_timeout or settings.WEBHOOK_SYNC_TIMEOUT
+
+    with opentracing_trace("webhooks.cache", "webhooks", "webhooks") as span:
+        span.set_tag("webhooks.event_type", event_type)
+        cached_response = cache.get(cache_key)
+        if cached_response is not None:
+            response_data, fresh_until = cached_response
+            if fresh_until > time.time():
+                span.set_tag("webhooks.cache", "hit")
+                return response_data
+
+            span.set_tag("webhooks.cache", "stale")
+            if cache.add(lock_key, True, timeout=lock_timeout):
+                delivery = create_delivery_for_sync_event(
+                    event_type, payload, webhook, subscribable_object, request
+                )
+                if delivery:
+                    transaction.on_commit(
+                        lambda: refresh_webhook_response_cache_task.delay(
+                            delivery.id,
+                            cache_key,
+                            cache_timeout,
+                            stale_timeout,
+                            request_timeout,
+                        )
+                    )
+                else:
+                    cache.delete(lock_key)
+            return response_data
+
+        locked = cache.add(lock_key, True, timeout=lock_timeout)
+        if not locked:
+            cached_response = wait_for_cached_webhook_response(
+                cache_key, lock_key, lock_timeout
             )
+            if cached_response is not None:
+                span.set_tag("webhooks.cache", "coalesced")
+                return cached_response[0]
+
+        span.set_tag("webhooks.cache", "miss")
+        try:
+            response_data = trigger_webhook_sync(
+                event_type,
+                payload,
+                webhook,
+                subscribable_object=subscribable_object,
+                timeout=request_timeout,
+                request=request,
+            )
+            if response_data is not None:
+                set_cached_webhook_response(
+                    cache_key, response_data, cache_timeout, stale_timeout
+                )
+        finally:
+            if locked:
+                cache.delete(lock_key)
     return response_data
 
 
+def set_cached_webhook_response(
+    cache_key: str, response_data, cache_timeout: int, stale_timeout: int = 0
+):
+    """Cache the response along with the time until which it's fresh."""
+    cache.set(
+        cache_key,
+        (response_data, time.time() + cache_timeout),
+        timeout=cache_timeout + stale_timeout,
+    )
+
+
+def wait_for_cached_webhook_response(
+    cache_key: str, lock_key: str, timeout: float
+) -> Optional[Tuple[Any, float]]:
+    """Wait until the request sent by another call caches the response.
+
+    Return None if the request was finished without caching the response or if it
+    didn't finish in the given time.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(WEBHOOK_CACHE_LOCK_POLL_INTERVAL)
+        cached_response = cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+        if cache.get(lock_key) is None:
+            return None
+    return None
+
+
+@app.task(queue=settings.WEBHOOK_CELERY_QUEUE_NAME)
+def refresh_webhook_response_cache_task(
+    event_delivery_id, cache_key, cache_timeout, stale_timeout, request_timeout=None
+):
+    try:
+        delivery = get_delivery_for_webhook(event_delivery_id)
+        if not delivery:
+            return
+        kwargs = {}
+        if request_timeout:
+            kwargs = {"timeout": request_timeout}
+        response_data = send_webhook_request_sync(delivery, **kwargs)
+        if response_data is not None:
+            set_cached_webhook_response(
+                cache_key, response_data, cache_timeout, stale_timeout
+            )
+    finally:
+        cache.delete(f"{cache_key}-lock")
+
+
 def trigger_webhook_sync(
     event_type: str,
     payload: str,
@@ -274,29 +517,68 @@ def trigger_webhook_sync(
     request=None,
 ) -> Optional[Dict[Any, Any]]:
     """Send a synchronous webhook request."""
+    delivery = create_delivery_for_sync_event(
+        event_type, payload, webhook, subscribable_object, request
+    )
+    if not delivery:
+        return None
+
+    kwargs = {}
+    if timeout:
+        kwargs = {"timeout": timeout}
+
+    return send_webhook_request_sync(delivery, **kwargs)
+
+
+def create_delivery_for_sync_event(
+    event_type: str,
+    payload: str,
+    webhook: "Webhook",
+    subscribable_object=None,
+    request=None,
+) -> Optional[EventDelivery]:
     if webhook.subscription_query:
-        delivery = create_delivery_for_subscription_sync_event(
+        return create_delivery_for_subscription_sync_event(
             event_type=event_type,
             subscribable_object=subscribable_object,
             webhook=webhook,
             request=request,
         )
-        if not delivery:
-            return None
-    else:
-        event_payload = EventPayload.objects.create(payload=payload)
-        delivery = EventDelivery.objects.create(
-            status=EventDeliveryStatus.PENDING,
-            event_type=event_type,
-            payload=event_payload,
-            webhook=webhook,
-        )
+    event_payload = EventPayload.objects.create(payload=payload)
+    return EventDelivery.objects.create(
+        status=EventDeliveryStatus.PENDING,
+        event_type=event_type,
+        payload=event_payload,
+        webhook=webhook,
+    )
+
+
+def trigger_webhooks_sync(
+    event_type: str,
+    payload: str,
+    webhooks: List["Webhook"],
+    subscribable_object=None,
+    timeout=None,
+) -> List[Optional[Dict[Any, Any]]]:
+    """Send synchronous webhook requests and return responses of all webhooks.
 
+    Requests are sent concurrently, see `send_webhook_requests_sync`.
+    """
+    deliveries = list(
+        _create_deliveries_for_sync_event(
+            event_type, webhooks, lambda: payload, subscribable_object
+        )
+    )
     kwargs = {}
     if timeout:
         kwargs = {"timeout": timeout}
 
-    return send_webhook_request_sync(delivery, **kwargs)
+    responses = iter(
+        send_webhook_requests_sync(
+            [delivery for delivery in deliveries if delivery], **kwargs
+        )
+    )
+    return [next(responses) if delivery else None for delivery in deliveries]
 
 
 R = TypeVar("R")
@@ -312,13 +594,52 @@ def trigger_all_webhooks_sync(
 ) -> Optional[R]:
     """Send all synchronous webhook request for given event type.
 
-    Requests are send sequentially.
-    If the current webhook does not return expected response,
-    the next one is send.
-    If no webhook responds with expected response,
-    this function returns None.
+    Requests to multiple webhooks are sent concurrently and the first response
+    (in the order of webhooks) which is the expected one is returned. With
+    `WEBHOOK_SYNC_MAX_WORKERS` set to 1, requests are sent sequentially and the
+    next one is sent only if the current webhook does not return expected response.
+    If no webhook responds with expected response, this function returns None.
     """
     webhooks = get_webhooks_for_event(event_type)
+    deliveries = _create_deliveries_for_sync_event(
+        event_type,
+        webhooks,
+        generate_payload,
+        subscribable_object,
+        requestor,
+        allow_replica,
+    )
+    if len(webhooks) > 1 and settings.WEBHOOK_SYNC_MAX_WORKERS > 1:
+        deliveries_list = list(deliveries)
+        if not all(deliveries_list):
+            return None
+        for response_data in send_webhook_requests_sync(deliveries_list):
+            if parsed_response := parse_response(response_data):
+                return parsed_response
+        return None
+
+    for delivery in deliveries:
+        if not delivery:
+            return None
+        response_data = send_webhook_request_sync(delivery)
+        if parsed_response := parse_response(response_data):
+            return parsed_response
+    return None
+
+
+def _create_deliveries_for_sync_event(
+    event_type: str,
+    webhooks: List["Webhook"],
+    generate_payload: Callable,
+    subscribable_object=None,
+    requestor=None,
+    allow_replica=True,
+) -> Iterator[Optional[EventDelivery]]:
+    """Create deliveries of the sync event lazily, one webhook at a time.
+
+    The payload for webhooks without a subscription query is generated once and
+    shared between their deliveries.
+    """
     request_context = None
     event_payload = None
     for webhook in webhooks:
@@ -331,30 +652,23 @@ def trigger_all_webhooks_sync(
                     event_type=event_type,
                 )
 
-            delivery = create_delivery_for_subscription_sync_event(
+            yield create_delivery_for_subscription_sync_event(
                 event_type=event_type,
                 subscribable_object=subscribable_object,
                 webhook=webhook,
                 request=request_context,
                 requestor=requestor,
             )
-            if not delivery:
-                return None
         else:
             if event_payload is None:
                 event_payload = EventPayload.objects.create(payload=generate_payload())
-            delivery = EventDelivery.objects.create(
+            yield EventDelivery.objects.create(
                 status=EventDeliveryStatus.PENDING,
                 event_type=event_type,
                 payload=event_payload,
                 webhook=webhook,
             )
 
-        response_data = send_webhook_request_sync(delivery)
-        if parsed_response := parse_response(response_data):
-            return parsed_response
-    return None
-
 
 def send_webhook_using_http(
     target_url,
@@ -393,7 +707,7 @@ def send_webhook_using_http(
         headers.update(custom_headers)
 
     try:
-        response = requests.post(
+        response = get_webhook_http_session().post(
             target_url,
             data=message,
             headers=headers,
@@ -579,6 +893,57 @@ def handle_webhook_retry(
     return is_success
 
 
+def send_webhook_requests_async(deliveries: List[EventDelivery]):
+    """Schedule sending the deliveries.
+
+    Deliveries of the same webhook are sent in batches by a single task, up to
+    `WEBHOOK_ASYNC_BATCH_SIZE` deliveries each, to limit the number of published
+    tasks.
+    """
+    batch_size = settings.WEBHOOK_ASYNC_BATCH_SIZE
+    delivery_ids_per_webhook: Dict[int, List[int]] = defaultdict(list)
+    for delivery in deliveries:
+        delivery_ids_per_webhook[delivery.webhook_id].append(delivery.id)
+
+    for delivery_ids in delivery_ids_per_webhook.values():
+        if batch_size <= 1 or len(delivery_ids) == 1:
+            for delivery_id in delivery_ids:
+                send_webhook_request_async.delay(delivery_id)
+            continue
+        for index in range(0, len(delivery_ids), batch_size):
+            send_webhook_requests_batch_async.delay(
+                delivery_ids[index : index + batch_size]
+            )
+
+
+def _send_webhook_request_async(delivery: EventDelivery) -> WebhookResponse:
+    webhook = delivery.webhook
+    domain = Site.objects.get_current().domain
+    if not delivery.payload:
+        raise ValueError("Event delivery id: %r has no payload." % delivery.id)
+    data = delivery.payload.payload
+    with webhooks_opentracing_trace(delivery.event_type, domain, app=webhook.app):
+        response = send_webhook_using_scheme_method(
+            webhook.target_url,
+            domain,
+            webhook.secret_key,
+            delivery.event_type,
+            data,
+            webhook.custom_headers,
+        )
+    return response
+
+
+def _log_successful_delivery(delivery: EventDelivery):
+    task_logger.info(
+        "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+        delivery.webhook.id,
+        delivery.webhook.target_url,
+        delivery.event_type,
+        delivery.id,
+    )
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
@@ -590,38 +955,18 @@ def send_webhook_request_async(self, event_delivery_id):
     if not delivery:
         return None
 
-    webhook = delivery.webhook
-    domain = Site.objects.get_current().domain
     attempt = create_attempt(delivery, self.request.id)
     delivery_status = EventDeliveryStatus.SUCCESS
     try:
-        if not delivery.payload:
-            raise ValueError(
-                "Event delivery id: %r has no payload." % event_delivery_id
-            )
-        data = delivery.payload.payload
-        with webhooks_opentracing_trace(delivery.event_type, domain, app=webhook.app):
-            response = send_webhook_using_scheme_method(
-                webhook.target_url,
-                domain,
-                webhook.secret_key,
-                delivery.event_type,
-                data,
-                webhook.custom_headers,
-            )
-
+        response = _send_webhook_request_async(delivery)
         attempt_update(attempt, response)
         if response.status == EventDeliveryStatus.FAILED:
-            handle_webhook_retry(self, webhook, response.content, delivery, attempt)
+            handle_webhook_retry(
+                self, delivery.webhook, response.content, delivery, attempt
+            )
             delivery_status = EventDeliveryStatus.FAILED
         elif response.status == EventDeliveryStatus.SUCCESS:
-            task_logger.info(
-                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
-                webhook.id,
-                webhook.target_url,
-                delivery.event_type,
-                delivery.id,
-            )
+            _log_successful_delivery(delivery)
         delivery_update(delivery, delivery_status)
     except ValueError as e:
         response = WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
@@ -631,9 +976,80 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
-def _send_webhook_request_sync(
-    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
-) -> Tuple[WebhookResponse, Optional[Dict[Any, Any]]]:
+@app.task(queue=settings.WEBHOOK_CELERY_QUEUE_NAME, bind=True)
+def send_webhook_requests_batch_async(self, event_delivery_ids):
+    """Make the first attempt to send each of the deliveries.
+
+    Pending attempts of all deliveries are created before sending any request, so
+    the ones in progress are recorded, and are updated in bulk once all requests
+    are sent. Failed deliveries are retried by separate `send_webhook_request_async`
+    tasks, scheduled as their first retry, so each delivery keeps its own retries
+    count.
+    """
+    deliveries = get_deliveries_for_webhooks(event_delivery_ids)
+    attempts = create_attempts(deliveries, self.request.id)
+    failed_attempts = []
+    invalid_deliveries = []
+    retried_delivery_ids = set()
+    for delivery, attempt in zip(deliveries, attempts):
+        try:
+            response = _send_webhook_request_async(delivery)
+        except ValueError as e:
+            response = WebhookResponse(
+                content=str(e), status=EventDeliveryStatus.FAILED
+            )
+            invalid_deliveries.append(delivery)
+        else:
+            if response.status == EventDeliveryStatus.FAILED:
+                task_logger.info(
+                    "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+                    " Delivery attempt id: %r",
+                    delivery.webhook.id,
+                    delivery.webhook.target_url,
+                    response.content,
+                    delivery.event_type,
+                    attempt.id,
+                )
+                retried_delivery_ids.add(delivery.id)
+            else:
+                _log_successful_delivery(delivery)
+                delivery.status = EventDeliveryStatus.SUCCESS
+
+        set_attempt_response(attempt, response)
+        if response.status == EventDeliveryStatus.FAILED:
+            failed_attempts.append(attempt)
+
+    # Attempts of the successful deliveries are deleted along with them.
+    EventDeliveryAttempt.objects.bulk_update(failed_attempts, ATTEMPT_RESPONSE_FIELDS)
+    if invalid_deliveries:
+        EventDelivery.objects.filter(
+            pk__in=[delivery.pk for delivery in invalid_deliveries]
+        ).update(status=EventDeliveryStatus.FAILED)
+
+    countdown = send_webhook_request_async.retry_backoff
+    next_retry = timezone.now() + timedelta(seconds=countdown)
+    for delivery, attempt in zip(deliveries, attempts):
+        if delivery.id in retried_delivery_ids:
+            send_webhook_request_async.apply_async(
+                (delivery.id,), countdown=countdown, retries=1
+            )
+            observability.report_event_delivery_attempt(attempt, next_retry)
+        else:
+            observability.report_event_delivery_attempt(attempt)
+    clear_successful_deliveries(deliveries)
+
+
+@dataclass
+class WebhookSyncRequest:
+    delivery: EventDelivery
+    attempt: EventDeliveryAttempt
+    app: "App"
+    domain: str
+    message: bytes
+    signature: str
+
+
+def _prepare_webhook_request_sync(delivery, attempt=None) -> WebhookSyncRequest:
     event_payload = delivery.payload
     data = event_payload.payload
     webhook = delivery.webhook
@@ -653,18 +1069,34 @@ def _send_webhook_request_sync(
     )
     if attempt is None:
         attempt = create_attempt(delivery=delivery, task_id=None)
+    return WebhookSyncRequest(
+        delivery=delivery,
+        attempt=attempt,
+        app=webhook.app,
+        domain=domain,
+        message=message,
+        signature=signature,
+    )
+
+
+def _send_prepared_webhook_request_sync(
+    request: WebhookSyncRequest, timeout
+) -> Tuple[WebhookResponse, Optional[Dict[Any, Any]]]:
+    """Send the prepared webhook request; it doesn't query the database."""
+    delivery = request.delivery
+    webhook = delivery.webhook
     response = WebhookResponse(content="")
     response_data = None
 
     try:
         with webhooks_opentracing_trace(
-            delivery.event_type, domain, sync=True, app=webhook.app
+            delivery.event_type, request.domain, sync=True, app=request.app
         ):
             response = send_webhook_using_http(
                 webhook.target_url,
-                message,
-                domain,
-                signature,
+                request.message,
+                request.domain,
+                request.signature,
                 delivery.event_type,
                 timeout=timeout,
                 custom_headers=webhook.custom_headers,
@@ -677,7 +1109,7 @@ def _send_webhook_request_sync(
             "ID of failed DeliveryAttempt: %r . ",
             webhook.target_url,
             e,
-            attempt.id,
+            request.attempt.id,
         )
         response.status = EventDeliveryStatus.FAILED
     else:
@@ -687,20 +1119,33 @@ def _send_webhook_request_sync(
                 "ID of failed DeliveryAttempt: %r . ",
                 webhook.target_url,
                 response.content,
-                attempt.id,
+                request.attempt.id,
             )
         if response.status == EventDeliveryStatus.SUCCESS:
             logger.debug(
                 "[Webhook] Success response from %r."
                 "Successful DeliveryAttempt id: %r",
                 webhook.target_url,
-                attempt.id,
+                request.attempt.id,
             )
+    return response, response_data
 
-    attempt_update(attempt, response)
-    delivery_update(delivery, response.status)
-    observability.report_event_delivery_attempt(attempt)
-    clear_successful_delivery(delivery)
+
+def _record_webhook_response_sync(
+    request: WebhookSyncRequest, response: WebhookResponse
+):
+    attempt_update(request.attempt, response)
+    delivery_update(request.delivery, response.status)
+    observability.report_event_delivery_attempt(request.attempt)
+    clear_successful_delivery(request.delivery)
+
+
+def _send_webhook_request_sync(
+    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
+) -> Tuple[WebhookResponse, Optional[Dict[Any, Any]]]:
+    request = _prepare_webhook_request_sync(delivery, attempt)
+    response, response_data = _send_prepared_webhook_request_sync(request, timeout)
+    _record_webhook_response_sync(request, response)
     return response, response_data
 
 
@@ -711,6 +1156,51 @@ def send_webhook_request_sync(
     return response_data if response.status == EventDeliveryStatus.SUCCESS else None
 
 
+def send_webhook_requests_sync(
+    deliveries: List[EventDelivery], timeout=settings.WEBHOOK_SYNC_TIMEOUT
+) -> List[Optional[Dict[Any, Any]]]:
+    """Send synchronous webhook requests concurrently.
+
+    The HTTP requests are sent by the threads of the process pool, while the
+    deliveries and attempts are saved by the calling thread. The timeout is also
+    the deadline for all requests; the ones not finished by then are reported as
+    failed and, as any other failed request, have None in place of the response.
+    """
+    if len(deliveries) < 2 or settings.WEBHOOK_SYNC_MAX_WORKERS < 2:
+        return [send_webhook_request_sync(delivery, timeout) for delivery in deliveries]
+
+    requests = [_prepare_webhook_request_sync(delivery) for delivery in deliveries]
+    executor = get_webhook_sync_executor()
+    futures = [
+        executor.submit(_send_prepared_webhook_request_sync, request, timeout)
+        for request in requests
+    ]
+    done, _ = wait(futures, timeout=timeout)
+
+    responses = []
+    for request, future in zip(requests, futures):
+        if future in done:
+            response, response_data = future.result()
+        else:
+            future.cancel()
+            logger.info(
+                "[Webhook] Request to %r not finished in %ss. "
+                "ID of failed DeliveryAttempt: %r . ",
+                request.delivery.webhook.target_url,
+                timeout,
+                request.attempt.id,
+            )
+            response = WebhookResponse(
+                content="", status=EventDeliveryStatus.FAILED, duration=timeout
+            )
+            response_data = None
+        _record_webhook_response_sync(request, response)
+        responses.append(
+            response_data if response.status == EventDeliveryStatus.SUCCESS else None
+        )
+    return responses
+
+
 def send_observability_events(webhooks: List[WebhookData], events: List[Any]):
     event_type = WebhookEventAsyncType.OBSERVABILITY
     for webhook in webhooks:
@@ -815,15 +1305,16 @@ def trigger_transaction_request(
             ),
         )
         return None
-    webhook = get_webhooks_for_event(
+    webhooks = get_webhooks_for_event(
         event_type, apps_ids=[transaction_data.transaction_app_owner.pk]
-    ).first()
-    if not webhook:
+    )
+    if not webhooks:
         create_failed_transaction_event(
             transaction_data.event,
             cause="Cannot find a webhook that can process the action.",
         )
         return None
+    webhook = webhooks[0]
 
     if webhook.subscription_query:
         delivery = create_delivery_for_subscription_sync_event(
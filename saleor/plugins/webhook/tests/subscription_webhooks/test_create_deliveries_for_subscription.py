@@ -5,16 +5,25 @@ import graphene
 import pytest
 from django.core.files import File
 from freezegun import freeze_time
+from graphql.execution import ExecutionResult
 
+from .....app.models import App
 from .....channel.models import Channel
+from .....core.models import EventPayload
 from .....giftcard.models import GiftCard
+from .....graphql.webhook.subscription_payload import SubscriptionDocument
 from .....graphql.webhook.subscription_query import SubscriptionQuery
 from .....menu.models import Menu, MenuItem
 from .....product.models import Category
 from .....shipping.models import ShippingMethod, ShippingZone
 from .....site.models import SiteSettings
 from .....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
-from ...tasks import create_deliveries_for_subscriptions, logger
+from .....webhook.models import Webhook
+from ...tasks import (
+    create_deliveries_for_multiple_subscription_objects,
+    create_deliveries_for_subscriptions,
+    logger,
+)
 from . import subscription_queries
 from .payloads import (
     generate_account_events_payload,
@@ -1337,6 +1346,93 @@ def test_product_variant_created(variant, subscription_product_variant_created_w
     assert deliveries[0].webhook == webhooks[0]
 
 
+def test_product_variants_created(
+    product_variant_list,
+    subscription_product_variant_created_webhook,
+):
+    # given
+    webhooks = [subscription_product_variant_created_webhook]
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_CREATED
+
+    # when
+    deliveries = create_deliveries_for_multiple_subscription_objects(
+        event_type, product_variant_list, webhooks
+    )
+
+    # then
+    assert len(deliveries) == len(product_variant_list)
+    for delivery, variant in zip(deliveries, product_variant_list):
+        variant_id = graphene.Node.to_global_id("ProductVariant", variant.id)
+        assert delivery.payload.payload == json.dumps(
+            {"productVariant": {"id": variant_id}}
+        )
+        assert delivery.webhook == webhooks[0]
+
+
+def test_product_variants_created_shares_payload_of_equal_queries(
+    product_variant_list, subscription_product_variant_created_webhook
+):
+    # given
+    webhook = subscription_product_variant_created_webhook
+    app = App.objects.create(name="Other app", is_active=True)
+    app.permissions.set(webhook.app.permissions.all())
+    other_webhook = Webhook.objects.create(
+        app=app,
+        target_url="http://www.example.com/other",
+        subscription_query=" ".join(webhook.subscription_query.split()),
+    )
+    webhooks = [webhook, other_webhook]
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_CREATED
+
+    # when
+    deliveries = create_deliveries_for_multiple_subscription_objects(
+        event_type, product_variant_list, webhooks
+    )
+
+    # then
+    assert len(deliveries) == len(product_variant_list) * len(webhooks)
+    assert EventPayload.objects.count() == len(product_variant_list)
+    assert {delivery.webhook for delivery in deliveries} == set(webhooks)
+
+
+def test_product_variants_created_doesnt_share_payload_between_apps(
+    product_variant_list, subscription_webhook
+):
+    # given
+    query = """
+    subscription{
+      event{
+        ...on ProductVariantCreated{
+          productVariant{
+            id
+          }
+          recipient{
+            id
+          }
+        }
+      }
+    }
+    """
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_CREATED
+    webhook = subscription_webhook(query, event_type)
+    app = App.objects.create(name="Other app", is_active=True)
+    app.permissions.set(webhook.app.permissions.all())
+    other_webhook = Webhook.objects.create(
+        app=app, target_url="http://www.example.com/other", subscription_query=query
+    )
+
+    # when
+    deliveries = create_deliveries_for_multiple_subscription_objects(
+        event_type, product_variant_list, [webhook, other_webhook]
+    )
+
+    # then
+    assert EventPayload.objects.count() == len(deliveries)
+    for delivery in deliveries:
+        app_id = graphene.Node.to_global_id("App", delivery.webhook.app_id)
+        assert json.loads(delivery.payload.payload)["recipient"] == {"id": app_id}
+
+
 def test_product_variant_updated(variant, subscription_product_variant_updated_webhook):
     webhooks = [subscription_product_variant_updated_webhook]
     event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
@@ -2643,18 +2739,18 @@ def test_create_deliveries_for_subscriptions_unsubscribable_event(
     assert len(deliveries) == 0
 
 
-@patch("saleor.graphql.webhook.subscription_payload.get_default_backend")
+@patch.object(SubscriptionDocument, "execute")
 @patch.object(logger, "info")
 def test_create_deliveries_for_subscriptions_document_executed_with_error(
     mocked_task_logger,
-    mocked_backend,
+    mocked_execute,
     product,
     subscription_product_updated_webhook,
 ):
     # given
     webhooks = [subscription_product_updated_webhook]
     event_type = WebhookEventAsyncType.ORDER_CREATED
-    mocked_backend.document_from_string.execute.errors = "errors"
+    mocked_execute.return_value = ExecutionResult(errors=["errors"], invalid=True)
     # when
     deliveries = create_deliveries_for_subscriptions(event_type, product, webhooks)
     # then
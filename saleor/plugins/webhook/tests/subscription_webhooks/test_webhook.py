@@ -117,7 +117,7 @@ def test_trigger_webhook_sync_with_subscription_within_mutation_use_default_db(
 
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async")
 @mock.patch("saleor.plugins.webhook.tasks.get_webhooks_for_event")
-@mock.patch("saleor.plugins.webhook.tasks.generate_payload_from_subscription")
+@mock.patch("saleor.plugins.webhook.tasks.generate_payloads_from_subscription")
 def test_trigger_webhook_async_with_subscription_use_replica_db(
     mocked_generate_payload,
     mocked_get_webhooks_for_event,
@@ -1,13 +1,20 @@
+import time
 from datetime import timedelta
 from decimal import Decimal
 from unittest import mock
 
+from django.core.cache import cache
 from django.utils import timezone
+from freezegun import freeze_time
 
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.payloads import generate_checkout_payload
-from ..plugin import CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT
+from ..plugin import (
+    CACHE_STALE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+    CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+)
 from ..shipping import get_cache_data_for_shipping_list_methods_for_checkout
+from ..tasks import set_cached_webhook_response
 from ..utils import generate_cache_key_for_webhook
 
 
@@ -70,14 +77,17 @@ def test_get_shipping_methods_for_checkout_use_cache(
     shipping_app,
 ):
     # given
-    mocked_cache_get.return_value = [
-        {
-            "id": "method-1",
-            "name": "Standard Shipping",
-            "amount": Decimal("5.5"),
-            "currency": "GBP",
-        }
-    ]
+    mocked_cache_get.return_value = (
+        [
+            {
+                "id": "method-1",
+                "name": "Standard Shipping",
+                "amount": Decimal("5.5"),
+                "currency": "GBP",
+            }
+        ],
+        time.time() + 60,
+    )
     plugin = webhook_plugin()
 
     # when
@@ -98,7 +108,7 @@ def test_get_shipping_methods_for_checkout_use_cache_for_empty_list(
     shipping_app,
 ):
     # given
-    mocked_cache_get.return_value = []
+    mocked_cache_get.return_value = ([], time.time() + 60)
     plugin = webhook_plugin()
 
     # when
@@ -158,11 +168,14 @@ def test_checkout_change_invalidates_cache_key(
 
     # then
     assert cache_key != new_cache_key
-    mocked_cache_get.assert_called_once_with(new_cache_key)
+    assert mocked_cache_get.call_args_list.count(mock.call(new_cache_key)) == 1
     mocked_cache_set.assert_called_once_with(
         new_cache_key,
-        mocked_webhook_response,
-        timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+        (mocked_webhook_response, mock.ANY),
+        timeout=(
+            CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT
+            + CACHE_STALE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT
+        ),
     )
 
 
@@ -215,9 +228,87 @@ def test_ignore_selected_fields_on_generating_cache_key(
 
     # then
     assert cache_key == new_cache_key
-    mocked_cache_get.assert_called_once_with(new_cache_key)
+    assert mocked_cache_get.call_args_list.count(mock.call(new_cache_key)) == 1
     mocked_cache_set.assert_called_once_with(
         new_cache_key,
-        mocked_webhook_response,
-        timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+        (mocked_webhook_response, mock.ANY),
+        timeout=(
+            CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT
+            + CACHE_STALE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT
+        ),
+    )
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+def test_get_shipping_methods_for_checkout_refresh_stale_cache_in_background(
+    mocked_webhook,
+    webhook_plugin,
+    checkout_with_item,
+    shipping_app,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    stale_response = [
+        {"id": "method-1", "name": "Standard", "amount": "5.5", "currency": "GBP"}
+    ]
+    refreshed_response = [
+        {"id": "method-1", "name": "Standard", "amount": "6.5", "currency": "GBP"}
+    ]
+    mocked_webhook.return_value = stale_response
+    plugin = webhook_plugin()
+    plugin.get_shipping_methods_for_checkout(checkout_with_item, None)
+    mocked_webhook.return_value = refreshed_response
+    expired_at = timezone.now() + timedelta(
+        seconds=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT + 1
+    )
+
+    # when
+    with freeze_time(expired_at):
+        with django_capture_on_commit_callbacks(execute=True):
+            stale_methods = plugin.get_shipping_methods_for_checkout(
+                checkout_with_item, None
+            )
+        refreshed_methods = plugin.get_shipping_methods_for_checkout(
+            checkout_with_item, None
+        )
+
+    # then
+    assert mocked_webhook.call_count == 2
+    assert stale_methods[0].price.amount == Decimal("5.5")
+    assert refreshed_methods[0].price.amount == Decimal("6.5")
+
+
+@mock.patch("saleor.plugins.webhook.tasks.time.sleep")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+def test_get_shipping_methods_for_checkout_wait_for_concurrent_request(
+    mocked_webhook,
+    mocked_sleep,
+    webhook_plugin,
+    checkout_with_item,
+    shipping_app,
+):
+    # given
+    payload = generate_checkout_payload(checkout_with_item)
+    cache_key = generate_cache_key_for_webhook(
+        get_cache_data_for_shipping_list_methods_for_checkout(payload),
+        shipping_app.webhooks.first().target_url,
+        WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+        shipping_app.id,
+    )
+    response = [
+        {"id": "method-1", "name": "Standard", "amount": "5.5", "currency": "GBP"}
+    ]
+    # the request sent by the concurrent call holds the lock and caches the response
+    cache.add(f"{cache_key}-lock", True)
+    mocked_sleep.side_effect = lambda _: set_cached_webhook_response(
+        cache_key, response, CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT
     )
+    plugin = webhook_plugin()
+
+    # when
+    methods = plugin.get_shipping_methods_for_checkout(checkout_with_item, None)
+
+    # then
+    assert not mocked_webhook.called
+    assert mocked_sleep.call_count == 1
+    assert methods[0].price.amount == Decimal("5.5")
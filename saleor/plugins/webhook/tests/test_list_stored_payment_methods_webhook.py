@@ -1,3 +1,5 @@
+import time
+
 import graphene
 import mock
 
@@ -67,10 +69,10 @@ def test_list_stored_payment_methods_with_static_payload(
     delivery = EventDelivery.objects.get()
     mock_request.assert_called_once_with(delivery, timeout=WEBHOOK_SYNC_TIMEOUT)
 
-    mocked_cache_get.assert_called_once_with(expected_cache_key)
+    assert mocked_cache_get.call_args_list.count(mock.call(expected_cache_key)) == 1
     mocked_cache_set.assert_called_once_with(
         expected_cache_key,
-        webhook_list_stored_payment_methods_response,
+        (webhook_list_stored_payment_methods_response, mock.ANY),
         timeout=WEBHOOK_CACHE_DEFAULT_TIMEOUT,
     )
 
@@ -127,10 +129,10 @@ def test_list_stored_payment_methods_with_subscription_payload(
     delivery = EventDelivery.objects.get()
     mock_request.assert_called_once_with(delivery, timeout=WEBHOOK_SYNC_TIMEOUT)
 
-    mocked_cache_get.assert_called_once_with(expected_cache_key)
+    assert mocked_cache_get.call_args_list.count(mock.call(expected_cache_key)) == 1
     mocked_cache_set.assert_called_once_with(
         expected_cache_key,
-        webhook_list_stored_payment_methods_response,
+        (webhook_list_stored_payment_methods_response, mock.ANY),
         timeout=WEBHOOK_CACHE_DEFAULT_TIMEOUT,
     )
 
@@ -157,7 +159,10 @@ def test_list_stored_payment_methods_uses_cache_if_available(
 ):
     # given
     mock_request.return_value = webhook_list_stored_payment_methods_response
-    mocked_cache_get.return_value = webhook_list_stored_payment_methods_response
+    mocked_cache_get.return_value = (
+        webhook_list_stored_payment_methods_response,
+        time.time() + 60,
+    )
 
     webhook = list_stored_payment_methods_app.webhooks.first()
     webhook.subscription_query = LIST_STORED_PAYMENT_METHODS
@@ -184,7 +189,7 @@ def test_list_stored_payment_methods_uses_cache_if_available(
     response = plugin.list_stored_payment_methods(data, [])
 
     # then
-    mocked_cache_get.assert_called_once_with(expected_cache_key)
+    assert mocked_cache_get.call_args_list.count(mock.call(expected_cache_key)) == 1
     assert not mock_request.called
     assert not mocked_cache_set.called
 
@@ -241,7 +246,7 @@ def test_list_stored_payment_methods_app_returns_incorrect_response(
     delivery = EventDelivery.objects.get()
     mock_request.assert_called_once_with(delivery, timeout=WEBHOOK_SYNC_TIMEOUT)
 
-    mocked_cache_get.assert_called_once_with(expected_cache_key)
+    assert mocked_cache_get.call_args_list.count(mock.call(expected_cache_key)) == 1
     assert not mocked_cache_set.called
 
     assert response == []
@@ -67,7 +67,7 @@ CHECKOUT_QUERY_SHIPPING_METHOD = """
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -85,14 +85,16 @@ def test_excluded_shipping_methods_for_order(
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
-            {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+    mocked_webhook.return_value = [
+        {
+            "excluded_methods": [
+                {
+                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                    "reason": webhook_reason,
+                }
+            ]
+        }
+    ]
     payload = mock.MagicMock()
     mocked_payload.return_value = payload
     plugin = webhook_plugin()
@@ -118,7 +120,7 @@ def test_excluded_shipping_methods_for_order(
     mocked_webhook.assert_called_once_with(
         WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS,
         payload,
-        shipping_app.webhooks.get(events__event_type=event_type),
+        [shipping_app.webhooks.get(events__event_type=event_type)],
         subscribable_object=order_with_lines,
         timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
@@ -134,7 +136,7 @@ def test_excluded_shipping_methods_for_order(
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -153,7 +155,7 @@ def test_multiple_app_with_excluded_shipping_methods_for_order(
     webhook_reason = "Order contains dangerous products."
     webhook_second_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.side_effect = [
+    mocked_webhook.return_value = [
         {
             "excluded_methods": [
                 {
@@ -196,17 +198,13 @@ def test_multiple_app_with_excluded_shipping_methods_for_order(
     assert webhook_reason in em.reason
     assert webhook_second_reason in em.reason
     event_type = WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS
-    mocked_webhook.assert_any_call(
-        event_type,
-        payload,
-        shipping_app.webhooks.get(events__event_type=event_type),
-        subscribable_object=order_with_lines,
-        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-    )
-    mocked_webhook.assert_any_call(
+    mocked_webhook.assert_called_once_with(
         event_type,
         payload,
-        second_shipping_app.webhooks.get(events__event_type=event_type),
+        [
+            shipping_app.webhooks.get(events__event_type=event_type),
+            second_shipping_app.webhooks.get(events__event_type=event_type),
+        ],
         subscribable_object=order_with_lines,
         timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
@@ -226,7 +224,7 @@ def test_multiple_app_with_excluded_shipping_methods_for_order(
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -257,7 +255,7 @@ def test_multiple_webhooks_on_the_same_app_with_excluded_shipping_methods_for_or
     webhook_reason = "Order contains dangerous products."
     webhook_second_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.side_effect = [
+    mocked_webhook.return_value = [
         {
             "excluded_methods": [
                 {
@@ -299,16 +297,17 @@ def test_multiple_webhooks_on_the_same_app_with_excluded_shipping_methods_for_or
     assert em.id == "1"
     assert webhook_reason in em.reason
     assert webhook_second_reason in em.reason
-    webhooks = shipping_app.webhooks.filter(events__event_type=event_type)
+    webhooks = list(
+        shipping_app.webhooks.filter(events__event_type=event_type).order_by("pk")
+    )
     assert len(webhooks) > 1
-    for webhook in webhooks:
-        mocked_webhook.assert_any_call(
-            event_type,
-            payload,
-            webhook,
-            subscribable_object=order_with_lines,
-            timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-        )
+    mocked_webhook.assert_called_once_with(
+        event_type,
+        payload,
+        webhooks,
+        subscribable_object=order_with_lines,
+        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
+    )
 
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + str(order_with_lines.id)
 
@@ -522,7 +521,7 @@ def test_trigger_webhook_sync(mock_request, shipping_app):
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -541,14 +540,16 @@ def test_excluded_shipping_methods_for_checkout_webhook(
     webhook_reason = "Checkout contains dangerous products."
     other_reason = "Shipping is not applicable for this checkout."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
-            {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+    mocked_webhook.return_value = [
+        {
+            "excluded_methods": [
+                {
+                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                    "reason": webhook_reason,
+                }
+            ]
+        }
+    ]
     payload = mock.MagicMock()
     mocked_payload.return_value = payload
     plugin = webhook_plugin()
@@ -573,7 +574,7 @@ def test_excluded_shipping_methods_for_checkout_webhook(
     mocked_webhook.assert_called_once_with(
         event_type,
         payload,
-        shipping_app.webhooks.get(events__event_type=event_type),
+        [shipping_app.webhooks.get(events__event_type=event_type)],
         subscribable_object=checkout_with_items,
         timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
@@ -635,7 +636,7 @@ def test_excluded_shipping_methods_for_checkout(
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -655,7 +656,7 @@ def test_multiple_app_with_excluded_shipping_methods_for_checkout(
     webhook_reason = "Checkout contains dangerous products."
     webhook_second_reason = "Shipping is not applicable for this checkout."
 
-    mocked_webhook.side_effect = [
+    mocked_webhook.return_value = [
         {
             "excluded_methods": [
                 {
@@ -697,17 +698,13 @@ def test_multiple_app_with_excluded_shipping_methods_for_checkout(
     assert webhook_reason in em.reason
     assert webhook_second_reason in em.reason
     event_type = WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS
-    mocked_webhook.assert_any_call(
-        event_type,
-        payload,
-        shipping_app.webhooks.get(events__event_type=event_type),
-        subscribable_object=checkout_with_items,
-        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-    )
-    mocked_webhook.assert_any_call(
+    mocked_webhook.assert_called_once_with(
         event_type,
         payload,
-        second_shipping_app.webhooks.get(events__event_type=event_type),
+        [
+            shipping_app.webhooks.get(events__event_type=event_type),
+            second_shipping_app.webhooks.get(events__event_type=event_type),
+        ],
         subscribable_object=checkout_with_items,
         timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
@@ -728,7 +725,7 @@ def test_multiple_app_with_excluded_shipping_methods_for_checkout(
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -760,7 +757,7 @@ def test_multiple_webhooks_on_the_same_app_with_excluded_shipping_methods_for_ch
     webhook_reason = "Checkout contains dangerous products."
     webhook_second_reason = "Shipping is not applicable for this checkout."
 
-    mocked_webhook.side_effect = [
+    mocked_webhook.return_value = [
         {
             "excluded_methods": [
                 {
@@ -801,16 +798,17 @@ def test_multiple_webhooks_on_the_same_app_with_excluded_shipping_methods_for_ch
     assert em.id == "1"
     assert webhook_reason in em.reason
     assert webhook_second_reason in em.reason
-    webhooks = shipping_app.webhooks.filter(events__event_type=event_type)
+    webhooks = list(
+        shipping_app.webhooks.filter(events__event_type=event_type).order_by("pk")
+    )
     assert len(webhooks) > 1
-    for webhook in webhooks:
-        mocked_webhook.assert_any_call(
-            event_type,
-            payload,
-            webhook,
-            subscribable_object=checkout_with_items,
-            timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-        )
+    mocked_webhook.assert_called_once_with(
+        event_type,
+        payload,
+        webhooks,
+        subscribable_object=checkout_with_items,
+        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
+    )
 
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + str(checkout_with_items.token)
 
@@ -162,7 +162,7 @@ def test_trigger_transaction_request_with_webhook_subscription(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("requests.Session.post")
 def test_handle_transaction_request_task_with_only_psp_reference(
     mocked_post_request,
     transaction_item_generator,
@@ -228,7 +228,7 @@ def test_handle_transaction_request_task_with_only_psp_reference(
 @pytest.mark.parametrize("status_code", [500, 501, 510])
 @freeze_time("2022-06-11 12:50")
 @mock.patch("saleor.plugins.webhook.tasks.handle_webhook_retry")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("requests.Session.post")
 def test_handle_transaction_request_task_with_server_error(
     mocked_post_request,
     mocked_webhook_retry,
@@ -284,7 +284,7 @@ def test_handle_transaction_request_task_with_server_error(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("requests.Session.post")
 def test_handle_transaction_request_task_with_missing_psp_reference(
     mocked_post_request,
     transaction_item_created_by_app,
@@ -362,7 +362,7 @@ def test_handle_transaction_request_task_with_missing_psp_reference(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("requests.Session.post")
 def test_handle_transaction_request_task_with_missing_required_event_field(
     mocked_post_request,
     transaction_item_created_by_app,
@@ -445,7 +445,7 @@ def test_handle_transaction_request_task_with_missing_required_event_field(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("requests.Session.post")
 def test_handle_transaction_request_task_with_result_event(
     mocked_post_request,
     transaction_item_generator,
@@ -543,7 +543,7 @@ def test_handle_transaction_request_task_with_result_event(
 
 
 @freeze_time("2022-06-11T17:50:00+00:00")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("requests.Session.post")
 def test_handle_transaction_request_task_with_only_required_fields_for_result_event(
     mocked_post_request,
     transaction_item_generator,
@@ -639,7 +639,7 @@ def test_handle_transaction_request_task_with_only_required_fields_for_result_ev
     "saleor.payment.utils.recalculate_transaction_amounts",
     wraps=recalculate_transaction_amounts,
 )
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("requests.Session.post")
 def test_handle_transaction_request_task_calls_recalculation_of_amounts(
     mocked_post_request,
     mocked_recalculation,
@@ -709,7 +709,7 @@ def test_handle_transaction_request_task_calls_recalculation_of_amounts(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("requests.Session.post")
 def test_handle_transaction_request_task_with_available_actions(
     mocked_post_request,
     transaction_item_generator,
@@ -1,3 +1,5 @@
+import json
+import threading
 from unittest import mock
 
 import pytest
@@ -6,7 +8,11 @@ from ....core import EventDeliveryStatus
 from ....core.models import EventDelivery, EventPayload
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook, WebhookEvent
-from ..tasks import trigger_all_webhooks_sync
+from ..tasks import (
+    WebhookResponse,
+    send_webhook_requests_sync,
+    trigger_all_webhooks_sync,
+)
 from ..utils import parse_tax_data
 
 
@@ -67,8 +73,10 @@ def test_trigger_tax_webhook_sync_multiple_webhooks_first(
     mock_request,
     tax_checkout_webhooks,
     tax_data_response,
+    settings,
 ):
     # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 1
     mock_request.side_effect = [tax_data_response, {}, {}]
     event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
     data = '{"key": "value"}'
@@ -95,8 +103,10 @@ def test_trigger_tax_webhook_sync_multiple_webhooks_last(
     mock_request,
     tax_checkout_webhooks,
     tax_data_response,
+    settings,
 ):
     # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 1
     mock_request.side_effect = [{}, {}, tax_data_response]
     event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
     data = '{"key": "value"}'
@@ -127,8 +137,10 @@ def test_trigger_tax_webhook_sync_invalid_webhooks(
     mock_request,
     tax_checkout_webhooks,
     tax_data_response,
+    settings,
 ):
     # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 1
     mock_request.return_value = {}
     event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
     data = '{"key": "value"}'
@@ -139,3 +151,68 @@ def test_trigger_tax_webhook_sync_invalid_webhooks(
     # then
     assert mock_request.call_count == len(tax_checkout_webhooks)
     assert tax_data is None
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_tax_webhook_sync_multiple_webhooks_concurrently(
+    mock_request,
+    tax_checkout_webhooks,
+    tax_data_response,
+):
+    # given
+    responses = {
+        tax_checkout_webhooks[1].target_url: tax_data_response,
+        tax_checkout_webhooks[2].target_url: {**tax_data_response, "currency": "USD"},
+    }
+    mock_request.side_effect = lambda target_url, *args, **kwargs: WebhookResponse(
+        content=json.dumps(responses.get(target_url, {}))
+    )
+    event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
+    data = '{"key": "value"}'
+
+    # when
+    tax_data = trigger_all_webhooks_sync(event_type, lambda: data, parse_tax_data)
+
+    # then
+    assert mock_request.call_count == len(tax_checkout_webhooks)
+    assert tax_data == parse_tax_data(tax_data_response)
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_send_webhook_requests_sync_skips_requests_exceeding_deadline(
+    mock_request,
+    tax_checkout_webhooks,
+    tax_data_response,
+):
+    # given
+    slow_webhook, webhook = tax_checkout_webhooks[:2]
+    released = threading.Event()
+
+    def send_request(target_url, *args, **kwargs):
+        if target_url == slow_webhook.target_url:
+            released.wait(5)
+        return WebhookResponse(content=json.dumps(tax_data_response))
+
+    mock_request.side_effect = send_request
+    event_payload = EventPayload.objects.create(payload='{"key": "value"}')
+    deliveries = [
+        EventDelivery.objects.create(
+            event_type=WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES,
+            payload=event_payload,
+            webhook=delivery_webhook,
+        )
+        for delivery_webhook in [slow_webhook, webhook]
+    ]
+
+    # when
+    try:
+        responses = send_webhook_requests_sync(deliveries, timeout=0.5)
+    finally:
+        released.set()
+
+    # then
+    assert responses == [None, tax_data_response]
+    slow_delivery = EventDelivery.objects.get()
+    assert slow_delivery.webhook == slow_webhook
+    assert slow_delivery.status == EventDeliveryStatus.FAILED
+    assert slow_delivery.attempts.get().status == EventDeliveryStatus.FAILED
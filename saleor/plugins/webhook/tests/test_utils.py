@@ -1,7 +1,10 @@
 import copy
+from unittest.mock import patch
 
 import pytest
+from django.test import override_settings
 
+from ....core.models import EventPayload
 from ....payment.interface import PaymentGateway
 from ....webhook.event_types import WebhookEventSyncType
 from ..stored_payment_methods import (
@@ -9,7 +12,13 @@ from ..stored_payment_methods import (
     get_list_stored_payment_methods_from_response,
     get_payment_method_from_response,
 )
-from ..utils import generate_cache_key_for_webhook, to_payment_app_id
+from ..utils import (
+    create_event_payloads,
+    create_webhook_http_session,
+    generate_cache_key_for_webhook,
+    get_webhook_http_session,
+    to_payment_app_id,
+)
 
 
 @pytest.fixture()
@@ -398,3 +407,51 @@ def test_get_list_stored_payment_methods_from_response(payment_method_response,
     assert response == [
         get_payment_method_from_response(app, payment_method_response, "usd")
     ]
+
+
+def test_get_webhook_http_session_reuses_session():
+    # when
+    session = get_webhook_http_session()
+
+    # then
+    assert get_webhook_http_session() is session
+
+
+def test_get_webhook_http_session_creates_new_session_in_forked_process():
+    # given
+    session = get_webhook_http_session()
+
+    # when
+    with patch("saleor.plugins.webhook.utils.os.getpid", return_value=-1):
+        forked_process_session = get_webhook_http_session()
+
+    # then
+    assert forked_process_session is not session
+
+
+@override_settings(WEBHOOK_HTTP_POOL_HOSTS=5, WEBHOOK_HTTP_POOL_MAXSIZE=2)
+def test_create_webhook_http_session():
+    # when
+    session = create_webhook_http_session()
+
+    # then
+    adapter = session.get_adapter("https://app.example.com")
+    assert adapter._pool_connections == 5
+    assert adapter._pool_maxsize == 2
+    assert adapter._pool_block is False
+    assert session.get_adapter("http://app.example.com") is adapter
+    # cookies are not shared between the apps
+    assert session.cookies.get_policy().allowed_domains() == ()
+
+
+def test_create_event_payloads_stores_identical_payloads_once(db):
+    # given
+    payloads = ['{"id": 1}', '{"id": 2}', '{"id": 1}']
+
+    # when
+    event_payloads = create_event_payloads(payloads)
+
+    # then
+    assert [event_payload.payload for event_payload in event_payloads] == payloads
+    assert event_payloads[0] is event_payloads[2]
+    assert EventPayload.objects.count() == 2
@@ -13,6 +13,8 @@ from celery.exceptions import Retry as CeleryTaskRetryError
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.sites.models import Site
 from django.core.serializers import serialize
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from freezegun import freeze_time
 from kombu.asynchronous.aws.sqs.connection import AsyncSQSConnection
@@ -58,7 +60,12 @@ from ....webhook.payloads import (
 from ....webhook.utils import get_webhooks_for_event
 from ...manager import get_plugins_manager
 from .. import signature_for_payload
-from ..tasks import send_webhook_request_async, trigger_webhooks_async
+from ..tasks import (
+    send_webhook_request_async,
+    send_webhook_requests_async,
+    send_webhook_requests_batch_async,
+    trigger_webhooks_async,
+)
 from .utils import generate_request_headers
 
 first_url = "http://www.example.com/first/"
@@ -1810,7 +1817,7 @@ def test_send_webhook_request_async_when_delivery_attempt_failed(
     mocked_observability.assert_called_once_with(attempt, None)
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post", side_effect=RequestException)
+@mock.patch("requests.Session.post", side_effect=RequestException)
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
 def test_send_webhook_request_async_with_request_exception(
     mocked_observability, mocked_post, event_delivery, webhook_response_failed
@@ -1861,6 +1868,174 @@ def test_send_webhook_request_async_when_max_retries_exceeded(
     mocked_observability.assert_called_once_with(attempt)
 
 
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_requests_batch_async.delay")
+def test_send_webhook_requests_async_batches_deliveries_of_webhook(
+    mocked_send_batch, mocked_send, event_payload, webhook, settings
+):
+    # given
+    settings.WEBHOOK_ASYNC_BATCH_SIZE = 2
+    other_webhook = webhook.app.webhooks.create(target_url="http://www.example.com/")
+    deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ANY,
+                payload=event_payload,
+                webhook=delivery_webhook,
+            )
+            for delivery_webhook in [webhook, webhook, webhook, other_webhook]
+        ]
+    )
+
+    # when
+    send_webhook_requests_async(deliveries)
+
+    # then
+    assert mocked_send_batch.call_args_list == [
+        mock.call([deliveries[0].id, deliveries[1].id]),
+        mock.call([deliveries[2].id]),
+    ]
+    mocked_send.assert_called_once_with(deliveries[3].id)
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_requests_batch_async.delay")
+def test_send_webhook_requests_async_batches_disabled(
+    mocked_send_batch, mocked_send, event_payload, webhook, settings
+):
+    # given
+    settings.WEBHOOK_ASYNC_BATCH_SIZE = 1
+    deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ANY,
+                payload=event_payload,
+                webhook=webhook,
+            )
+            for _ in range(2)
+        ]
+    )
+
+    # when
+    send_webhook_requests_async(deliveries)
+
+    # then
+    mocked_send_batch.assert_not_called()
+    assert mocked_send.call_args_list == [
+        mock.call(delivery.id) for delivery in deliveries
+    ]
+
+
+@mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_batch_async(
+    mocked_send_response,
+    mocked_observability,
+    event_delivery,
+    webhook_response,
+):
+    # given
+    mocked_send_response.return_value = webhook_response
+    other_delivery = EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY,
+        payload=EventPayload.objects.create(payload="{}"),
+        webhook=event_delivery.webhook,
+    )
+
+    # when
+    send_webhook_requests_batch_async([event_delivery.pk, other_delivery.pk])
+
+    # then
+    assert mocked_send_response.call_count == 2
+    assert mocked_observability.call_count == 2
+    assert not EventDelivery.objects.exists()
+    assert not EventPayload.objects.exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.apply_async")
+@mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_batch_async_schedules_retry_of_failed_delivery(
+    mocked_send_response,
+    mocked_observability,
+    mocked_send_retry,
+    event_delivery,
+    webhook_response_failed,
+):
+    # given
+    mocked_send_response.return_value = webhook_response_failed
+
+    # when
+    send_webhook_requests_batch_async([event_delivery.pk])
+
+    # then
+    mocked_send_retry.assert_called_once_with(
+        (event_delivery.pk,),
+        countdown=send_webhook_request_async.retry_backoff,
+        retries=1,
+    )
+    attempt = EventDeliveryAttempt.objects.get(delivery=event_delivery)
+    event_delivery.refresh_from_db()
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert event_delivery.status == EventDeliveryStatus.PENDING
+    mocked_observability.assert_called_once_with(attempt, mock.ANY)
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.apply_async")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_batch_async_records_attempts_in_bulk(
+    mocked_send_response,
+    mocked_send_retry,
+    event_delivery,
+    webhook_response,
+    webhook_response_failed,
+):
+    # given
+    deliveries = [event_delivery] + [
+        EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY,
+            payload=EventPayload.objects.create(payload="{}"),
+            webhook=event_delivery.webhook,
+        )
+        for _ in range(4)
+    ]
+    delivery_ids = [delivery.pk for delivery in deliveries]
+    mocked_send_response.return_value = webhook_response
+    with CaptureQueriesContext(connection) as single_delivery_queries:
+        send_webhook_requests_batch_async(delivery_ids[-1:])
+    mocked_send_response.side_effect = [webhook_response_failed] + [
+        webhook_response
+    ] * 3
+
+    # when
+    with CaptureQueriesContext(connection) as batch_queries:
+        send_webhook_requests_batch_async(delivery_ids[:-1])
+
+    # then
+    assert len(batch_queries) <= len(single_delivery_queries) + 2
+    mocked_send_retry.assert_called_once()
+    failed_delivery = EventDelivery.objects.get()
+    assert failed_delivery == event_delivery
+    assert failed_delivery.status == EventDeliveryStatus.PENDING
+    attempt = failed_delivery.attempts.get()
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response == webhook_response_failed.content
+
+
+def test_send_webhook_requests_batch_async_when_webhook_is_disabled(event_delivery):
+    # given
+    event_delivery.webhook.is_active = False
+    event_delivery.webhook.save(update_fields=["is_active"])
+
+    # when
+    send_webhook_requests_batch_async([event_delivery.pk])
+
+    # then
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+    assert not EventDeliveryAttempt.objects.exists()
+
+
 def test_is_event_active(settings, webhook, permission_manage_orders):
     # given
     event = "invoice_request"
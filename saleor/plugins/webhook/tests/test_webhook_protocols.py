@@ -213,7 +213,7 @@ def test_trigger_webhooks_with_google_pub_sub_and_secret_key(
     )
 
 
-@patch("saleor.plugins.webhook.tasks.requests.post")
+@patch("requests.Session.post")
 def test_trigger_webhooks_with_http(
     mock_request,
     webhook,
@@ -263,7 +263,7 @@ def test_trigger_webhooks_with_http(
     )
 
 
-@patch("saleor.plugins.webhook.tasks.requests.post")
+@patch("requests.Session.post")
 def test_trigger_webhooks_with_http_and_secret_key(
     mock_request, webhook, order_with_lines, permission_manage_orders
 ):
@@ -308,7 +308,7 @@ def test_trigger_webhooks_with_http_and_secret_key(
     )
 
 
-@patch("saleor.plugins.webhook.tasks.requests.post")
+@patch("requests.Session.post")
 def test_trigger_webhooks_with_http_and_secret_key_as_empty_string(
     mock_request, webhook, order_with_lines, permission_manage_orders
 ):
@@ -357,7 +357,7 @@ def test_trigger_webhooks_with_http_and_secret_key_as_empty_string(
     )
 
 
-@patch("saleor.plugins.webhook.tasks.requests.post")
+@patch("requests.Session.post")
 def test_trigger_webhooks_with_http_and_custom_headers(
     mock_request, webhook, order_with_lines, permission_manage_orders
 ):
@@ -2,10 +2,18 @@ import decimal
 import hashlib
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
 from time import time
-from typing import TYPE_CHECKING, Any, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 from ...app.models import App
 from ...core.models import (
@@ -27,6 +35,76 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_http_session: Optional[requests.Session] = None
+_http_session_pid: Optional[int] = None
+_http_session_lock = threading.Lock()
+
+
+def get_webhook_http_session() -> requests.Session:
+    """Return the HTTP session shared by webhook requests sent from the process.
+
+    Connections to the app hosts are kept alive and reused, so the following
+    requests to the same host skip the TCP and TLS handshakes. Each process creates
+    its own session, as connections can't be shared with forked workers.
+    """
+    global _http_session, _http_session_pid
+
+    pid = os.getpid()
+    session = _http_session
+    if session is not None and _http_session_pid == pid:
+        return session
+
+    with _http_session_lock:
+        if _http_session is None or _http_session_pid != pid:
+            _http_session = create_webhook_http_session()
+            _http_session_pid = pid
+        return _http_session
+
+
+def create_webhook_http_session() -> requests.Session:
+    session = requests.Session()
+    # Cookies set by one app must not be sent in requests to any other app.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=settings.WEBHOOK_HTTP_POOL_HOSTS,
+        pool_maxsize=settings.WEBHOOK_HTTP_POOL_MAXSIZE,
+        # Requests never wait for a free connection, when all of them are in use
+        # a new one is opened and closed after the request.
+        pool_block=False,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_sync_executor: Optional[ThreadPoolExecutor] = None
+_sync_executor_pid: Optional[int] = None
+_sync_executor_lock = threading.Lock()
+
+
+def get_webhook_sync_executor() -> ThreadPoolExecutor:
+    """Return the thread pool sending concurrent sync webhook requests.
+
+    The pool is shared by all requests handled by the process, so the number of
+    threads is bounded by `WEBHOOK_SYNC_MAX_WORKERS`. Forked workers create their
+    own pool, as threads aren't copied to the child process.
+    """
+    global _sync_executor, _sync_executor_pid
+
+    pid = os.getpid()
+    executor = _sync_executor
+    if executor is not None and _sync_executor_pid == pid:
+        return executor
+
+    with _sync_executor_lock:
+        if _sync_executor is None or _sync_executor_pid != pid:
+            _sync_executor = ThreadPoolExecutor(
+                max_workers=settings.WEBHOOK_SYNC_MAX_WORKERS,
+                thread_name_prefix="webhook-sync",
+            )
+            _sync_executor_pid = pid
+        return _sync_executor
+
 
 @dataclass
 class PaymentAppData:
@@ -194,12 +272,53 @@ def get_delivery_for_webhook(event_delivery_id) -> Optional["EventDelivery"]:
     return delivery
 
 
+def get_deliveries_for_webhooks(event_delivery_ids) -> List["EventDelivery"]:
+    """Return the deliveries which webhooks are active, in the given order."""
+    deliveries = EventDelivery.objects.select_related(
+        "payload", "webhook__app"
+    ).in_bulk(event_delivery_ids)
+    active_deliveries = []
+    inactive_deliveries = []
+    for event_delivery_id in event_delivery_ids:
+        delivery = deliveries.get(event_delivery_id)
+        if not delivery:
+            logger.error("Event delivery id: %r not found", event_delivery_id)
+        elif not delivery.webhook.is_active:
+            logger.info("Event delivery id: %r webhook is disabled.", event_delivery_id)
+            inactive_deliveries.append(delivery)
+        else:
+            active_deliveries.append(delivery)
+
+    if inactive_deliveries:
+        for delivery in inactive_deliveries:
+            delivery.status = EventDeliveryStatus.FAILED
+        EventDelivery.objects.bulk_update(inactive_deliveries, ["status"])
+    return active_deliveries
+
+
 @contextmanager
 def catch_duration_time():
     start = time()
     yield lambda: time() - start
 
 
+def create_event_payloads(payloads: Sequence[str]) -> List[EventPayload]:
+    """Create event payloads, returning one for each of the given payloads.
+
+    Identical payloads, recognized by the hash of their content, are stored once
+    and the same object is returned for each of them.
+    """
+    event_payloads: Dict[str, EventPayload] = {}
+    result = []
+    for payload in payloads:
+        payload_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        if payload_hash not in event_payloads:
+            event_payloads[payload_hash] = EventPayload(payload=payload)
+        result.append(event_payloads[payload_hash])
+    EventPayload.objects.bulk_create(event_payloads.values())
+    return result
+
+
 def create_event_delivery_list_for_webhooks(
     webhooks: Sequence["Webhook"],
     event_payload: "EventPayload",
@@ -235,26 +354,56 @@ def create_attempt(
     return attempt
 
 
+def create_attempts(
+    deliveries: Sequence["EventDelivery"],
+    task_id: Optional[str] = None,
+) -> List["EventDeliveryAttempt"]:
+    """Create pending attempts of the deliveries with a single query."""
+    return EventDeliveryAttempt.objects.bulk_create(
+        [
+            EventDeliveryAttempt(
+                delivery=delivery,
+                task_id=task_id,
+                duration=None,
+                response=None,
+                request_headers=None,
+                response_headers=None,
+                status=EventDeliveryStatus.PENDING,
+            )
+            for delivery in deliveries
+        ]
+    )
+
+
+ATTEMPT_RESPONSE_FIELDS = [
+    "duration",
+    "response",
+    "response_headers",
+    "response_status_code",
+    "request_headers",
+    "status",
+]
+
+
 def attempt_update(
     attempt: "EventDeliveryAttempt",
     webhook_response: "WebhookResponse",
 ):
+    set_attempt_response(attempt, webhook_response)
+    attempt.save(update_fields=ATTEMPT_RESPONSE_FIELDS)
+
+
+def set_attempt_response(
+    attempt: "EventDeliveryAttempt",
+    webhook_response: "WebhookResponse",
+):
+    """Set the response fields of the attempt without saving it."""
     attempt.duration = webhook_response.duration
     attempt.response = webhook_response.content
     attempt.response_headers = json.dumps(webhook_response.response_headers)
     attempt.response_status_code = webhook_response.response_status_code
     attempt.request_headers = json.dumps(webhook_response.request_headers)
     attempt.status = webhook_response.status
-    attempt.save(
-        update_fields=[
-            "duration",
-            "response",
-            "response_headers",
-            "response_status_code",
-            "request_headers",
-            "status",
-        ]
-    )
 
 
 def delivery_update(delivery: "EventDelivery", status: str):
@@ -270,6 +419,26 @@ def clear_successful_delivery(delivery: "EventDelivery"):
             EventPayload.objects.filter(pk=payload_id, deliveries__isnull=True).delete()
 
 
+def clear_successful_deliveries(deliveries: Sequence["EventDelivery"]):
+    """Delete the successful deliveries and their payloads with bulk queries."""
+    successful_deliveries = [
+        delivery
+        for delivery in deliveries
+        if delivery.status == EventDeliveryStatus.SUCCESS
+    ]
+    if not successful_deliveries:
+        return
+    EventDelivery.objects.filter(
+        pk__in=[delivery.pk for delivery in successful_deliveries]
+    ).delete()
+    if payload_ids := {
+        delivery.payload_id for delivery in successful_deliveries if delivery.payload_id
+    }:
+        EventPayload.objects.filter(
+            pk__in=payload_ids, deliveries__isnull=True
+        ).delete()
+
+
 DEFAULT_TAX_CODE = "UNMAPPED"
 DEFAULT_TAX_DESCRIPTION = "Unmapped Product/Product Type"
 
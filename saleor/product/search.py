@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 from django.conf import settings
 from django.contrib.postgres.search import SearchQuery, SearchRank
@@ -6,6 +6,7 @@ from django.db.models import F, Q, Value, prefetch_related_objects
 
 from ..attribute import AttributeInputType
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
+from ..core.search_indexer import get_search_vectors_size, update_search_data_in_batches
 from ..core.utils.editorjs import clean_editor_js
 from .models import Product
 
@@ -25,30 +26,43 @@ PRODUCTS_BATCH_SIZE = 300
 # when testing locally. Should be adjusted after some time by running
 # update task on a large dataset and measuring the total time, memory usage
 # and time of a single SQL statement.
+# The following batches are sized by the amount of indexed data, up to the
+# maximum below.
+PRODUCTS_MAX_BATCH_SIZE = 1000
 
 
-def _prep_product_search_vector_index(products):
+def _prep_product_search_vector_index(products) -> int:
     prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
+    indexed_size = 0
     for product in products:
-        product.search_vector = FlatConcatSearchVector(
-            *prepare_product_search_vector_value(product, already_prefetched=True)
+        search_vectors = prepare_product_search_vector_value(
+            product, already_prefetched=True
         )
+        indexed_size += get_search_vectors_size(search_vectors)
+        product.search_vector = FlatConcatSearchVector(*search_vectors)
         product.search_index_dirty = False
 
     Product.objects.bulk_update(
         products, ["search_vector", "updated_at", "search_index_dirty"]
     )
+    return indexed_size
 
 
-def update_products_search_vector(products: "QuerySet", use_batches=True):
+def update_products_search_vector(
+    products: "QuerySet",
+    use_batches=True,
+    limit: Optional[int] = None,
+    max_duration: Optional[float] = None,
+):
     if use_batches:
-        last_id = 0
-        while True:
-            products_batch = list(products.filter(id__gt=last_id)[:PRODUCTS_BATCH_SIZE])
-            if not products_batch:
-                break
-            last_id = products_batch[-1].id
-            _prep_product_search_vector_index(products_batch)
+        update_search_data_in_batches(
+            products,
+            _prep_product_search_vector_index,
+            batch_size=PRODUCTS_BATCH_SIZE,
+            max_batch_size=PRODUCTS_MAX_BATCH_SIZE,
+            limit=limit,
+            max_duration=max_duration,
+        )
     else:
         _prep_product_search_vector_index(products)
 
@@ -12,7 +12,7 @@ from ..core.exceptions import PreorderAllocationError
 from ..discount.models import Sale
 from ..warehouse.management import deactivate_preorder_for_variant
 from .models import Product, ProductType, ProductVariant
-from .search import PRODUCTS_BATCH_SIZE, update_products_search_vector
+from .search import update_products_search_vector
 from .utils.variant_prices import (
     update_products_discounted_price,
     update_products_discounted_prices,
@@ -136,7 +136,9 @@ def _get_preorder_variants_to_clean():
     expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
 )
 def update_products_search_vector_task():
-    products = Product.objects.filter(search_index_dirty=True).order_by()[
-        :PRODUCTS_BATCH_SIZE
-    ]
-    update_products_search_vector(products, use_batches=False)
+    # The task keeps indexing dirty products in batches until it's time for the
+    # next scheduled run, so large imports don't wait for many runs to be indexed.
+    products = Product.objects.filter(search_index_dirty=True)
+    update_products_search_vector(
+        products, max_duration=settings.UPDATE_SEARCH_VECTOR_INDEX_MAX_DURATION_SEC
+    )
@@ -547,6 +547,11 @@ BEAT_EXPIRE_ORDERS_AFTER_TIMEDELTA = timedelta(
 # entry 'update-products-search-vectors' expire if it wasn't picked up by a worker.
 BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC = 20
 
+# Defines after how many seconds the task triggered by the Celery beat entry
+# 'update-products-search-vectors' stops starting new batches. It should be lower
+# than the schedule interval, so the consecutive runs don't overlap.
+UPDATE_SEARCH_VECTOR_INDEX_MAX_DURATION_SEC = 15
+
 # Defines the Celery beat scheduler entries.
 #
 # Note: if a Celery task triggered by a Celery beat entry has an expiration
@@ -619,6 +624,12 @@ EVENT_PAYLOAD_DELETE_PERIOD = timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_PERIOD", "14 days"))
 )
 
+# Event payloads of at least this many characters are stored compressed. Set to 0
+# to store all payloads as plain text.
+EVENT_PAYLOAD_COMPRESSION_THRESHOLD = int(
+    os.environ.get("EVENT_PAYLOAD_COMPRESSION_THRESHOLD", 0)
+)
+
 # Observability settings
 OBSERVABILITY_BROKER_URL = os.environ.get("OBSERVABILITY_BROKER_URL")
 OBSERVABILITY_ACTIVE = bool(OBSERVABILITY_BROKER_URL)
@@ -640,6 +651,11 @@ OBSERVABILITY_REPORT_PERIOD = timedelta(
 OBSERVABILITY_BUFFER_TIMEOUT = timedelta(
     seconds=parse(os.environ.get("OBSERVABILITY_BUFFER_TIMEOUT", "5 minutes"))
 )
+# Level of zlib compression of the buffered events, from 0 (no compression, the
+# fastest) to 9 (the smallest size).
+OBSERVABILITY_BUFFER_COMPRESSION_LEVEL = int(
+    os.environ.get("OBSERVABILITY_BUFFER_COMPRESSION_LEVEL", 1)
+)
 if OBSERVABILITY_ACTIVE:
     CELERY_BEAT_SCHEDULE["observability-reporter"] = {
         "task": "saleor.plugins.webhook.tasks.observability_reporter_task",
@@ -693,6 +709,33 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Number of parsed and validated GraphQL documents kept in memory by each process.
+# Set GRAPHQL_DOCUMENT_CACHE_SIZE=0 in env to disable.
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+
+# Automatic persisted queries: clients may send only the SHA-256 hash of a query
+# that was registered before. Registered queries are stored in the cache for
+# GRAPHQL_PERSISTED_QUERIES_TIMEOUT seconds.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", True
+)
+GRAPHQL_PERSISTED_QUERIES_TIMEOUT = int(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_TIMEOUT", 60 * 60 * 24)
+)
+# Path to a JSON file with queries that are always available by their hash.
+GRAPHQL_PERSISTED_QUERIES_MANIFEST = os.environ.get(
+    "GRAPHQL_PERSISTED_QUERIES_MANIFEST"
+)
+# When enabled, only the queries from the manifest can be executed.
+GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST_ONLY = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ALLOW_LIST_ONLY", False
+)
+# Time in seconds for which shared caches (e.g. CDNs) may store successful
+# responses to anonymous GET requests for persisted queries. Set to 0 to disable.
+GRAPHQL_PERSISTED_QUERIES_CACHE_MAX_AGE = int(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_CACHE_MAX_AGE", 60)
+)
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -735,6 +778,20 @@ PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 WEBHOOK_TIMEOUT = 10
 WEBHOOK_SYNC_TIMEOUT = 20
 
+# Maximum number of threads of a process sending sync webhook requests of the same
+# event to multiple webhooks concurrently. Set to 1 to send them sequentially.
+WEBHOOK_SYNC_MAX_WORKERS = int(os.environ.get("WEBHOOK_SYNC_MAX_WORKERS", 10))
+
+# Connections to the webhook target hosts are reused by each process. The number
+# of hosts with kept-alive connections and the maximum number of connections kept
+# alive for a single host.
+WEBHOOK_HTTP_POOL_HOSTS = int(os.environ.get("WEBHOOK_HTTP_POOL_HOSTS", 50))
+WEBHOOK_HTTP_POOL_MAXSIZE = int(os.environ.get("WEBHOOK_HTTP_POOL_MAXSIZE", 10))
+
+# Maximum number of deliveries of the same webhook sent by a single Celery task.
+# Set to 1 to send each delivery by a separate task.
+WEBHOOK_ASYNC_BATCH_SIZE = int(os.environ.get("WEBHOOK_ASYNC_BATCH_SIZE", 50))
+
 # Since we split checkout complete logic into two separate transactions, in order to
 # mimic stock lock, we apply short reservation for the stocks. The value represents
 # time of the reservation in seconds.
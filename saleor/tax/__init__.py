@@ -1,3 +1,6 @@
+default_app_config = "saleor.tax.app.TaxAppConfig"
+
+
 class TaxCalculationStrategy:
     FLAT_RATES = "FLAT_RATES"
     TAX_APP = "TAX_APP"
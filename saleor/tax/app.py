@@ -0,0 +1,35 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class TaxAppConfig(AppConfig):
+    name = "saleor.tax"
+
+    def ready(self):
+        from .models import (
+            TaxClass,
+            TaxClassCountryRate,
+            TaxConfiguration,
+            TaxConfigurationPerCountry,
+        )
+        from .signals import invalidate_tax_configuration_cache
+
+        # preventing duplicate signals
+        for model in [
+            TaxClass,
+            TaxClassCountryRate,
+            TaxConfiguration,
+            TaxConfigurationPerCountry,
+        ]:
+            post_save.connect(
+                invalidate_tax_configuration_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_tax_configuration_on_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_tax_configuration_cache,
+                sender=model,
+                dispatch_uid=(
+                    f"invalidate_tax_configuration_on_{model.__name__}_delete"
+                ),
+            )
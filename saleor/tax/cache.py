@@ -0,0 +1,4 @@
+# Version stamp of the tax configurations, tax classes and their rates. It's a part
+# of the checkout pricing fingerprint, so changing any of them makes checkouts
+# recalculate their prices.
+TAX_CONFIGURATION_VERSION_CACHE_KEY = "tax_configuration_version"
@@ -0,0 +1,6 @@
+from ..core.cache_version import invalidate_on_commit
+from .cache import TAX_CONFIGURATION_VERSION_CACHE_KEY
+
+invalidate_tax_configuration_cache = invalidate_on_commit(
+    TAX_CONFIGURATION_VERSION_CACHE_KEY
+)
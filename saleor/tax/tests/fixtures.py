@@ -7,9 +7,16 @@ from ...plugins.avatax import (
     META_DESCRIPTION_KEY,
     TAX_CODE_NON_TAXABLE_PRODUCT,
 )
+from ...tests.utils import reset_cache_version
+from ..cache import TAX_CONFIGURATION_VERSION_CACHE_KEY
 from ..models import TaxClass, TaxClassCountryRate
 
 
+@pytest.fixture(autouse=True)
+def reset_tax_configuration_version():
+    reset_cache_version(TAX_CONFIGURATION_VERSION_CACHE_KEY)
+
+
 @pytest.fixture(autouse=True)
 def default_tax_class(db):
     tax_class, _ = TaxClass.objects.get_or_create(
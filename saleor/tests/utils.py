@@ -1,5 +1,7 @@
 import json
+from uuid import uuid4
 
+from django.core.cache import cache
 from django.db import connections, transaction
 
 
@@ -21,3 +23,12 @@ def flush_post_commit_hooks():
 def dummy_editorjs(text, json_format=False):
     data = {"blocks": [{"data": {"text": text}, "type": "paragraph"}]}
     return json.dumps(data) if json_format else data
+
+
+def reset_cache_version(key: str):
+    """Store a new version stamp of the data cached in the process memory.
+
+    The stamp is replaced rather than deleted, as reading a missing key from the
+    local memory cache fails in tests that freeze the time before 1970.
+    """
+    cache.set(key, str(uuid4()), None)
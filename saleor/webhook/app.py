@@ -0,0 +1,29 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WebhookAppConfig(AppConfig):
+    name = "saleor.webhook"
+
+    def ready(self):
+        from ..app.models import App
+        from .models import Webhook, WebhookEvent
+        from .signals import invalidate_webhooks_routing_cache
+
+        # preventing duplicate signals
+        for model in [Webhook, WebhookEvent, App]:
+            post_save.connect(
+                invalidate_webhooks_routing_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_webhooks_routing_on_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_webhooks_routing_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_webhooks_routing_on_{model.__name__}_delete",
+            )
+        m2m_changed.connect(
+            invalidate_webhooks_routing_cache,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_webhooks_routing_on_app_permissions_change",
+        )
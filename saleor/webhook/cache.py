@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, DefaultDict, Dict, List, Optional, Set
+
+from ..core.cache_version import get_version, invalidate
+from .event_types import WebhookEventAsyncType, WebhookEventSyncType
+
+if TYPE_CHECKING:
+    from .models import Webhook
+
+WEBHOOKS_ROUTING_VERSION_CACHE_KEY = "webhooks_routing_version"
+
+# Upper bound for how long the routing table is reused, in case webhooks or apps
+# are changed in a way that doesn't send any signal (e.g. `QuerySet.update`).
+WEBHOOKS_ROUTING_TIMEOUT = 5 * 60
+
+
+class WebhooksRoutingTable:
+    """Active webhooks of the active apps grouped by the event type."""
+
+    def __init__(self, version: str, webhooks: List["Webhook"]):
+        self.version = version
+        self.created_at = time.monotonic()
+        self.webhooks_per_event: DefaultDict[str, List["Webhook"]] = defaultdict(list)
+        self.app_permissions: Dict[int, Set[str]] = {}
+        for webhook in webhooks:
+            for event in webhook.events.all():
+                self.webhooks_per_event[event.event_type].append(webhook)
+            if webhook.app_id not in self.app_permissions:
+                self.app_permissions[webhook.app_id] = {
+                    f"{permission.content_type.app_label}.{permission.codename}"
+                    for permission in webhook.app.permissions.all()
+                }
+        self._routes: Dict[str, List["Webhook"]] = {}
+
+    def is_valid(self, version: str) -> bool:
+        return (
+            self.version == version
+            and time.monotonic() - self.created_at < WEBHOOKS_ROUTING_TIMEOUT
+        )
+
+    def get_webhooks(self, event_type: str) -> List["Webhook"]:
+        """Return webhooks subscribed to the event which apps have the permission.
+
+        Async events are also sent to the webhooks subscribed to any event.
+        """
+        webhooks = self._routes.get(event_type)
+        if webhooks is not None:
+            return webhooks
+
+        required_permission = WebhookEventAsyncType.PERMISSIONS.get(
+            event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
+        )
+        webhooks_by_pk = {
+            webhook.pk: webhook
+            for webhook in self.webhooks_per_event.get(event_type, [])
+        }
+        if event_type in WebhookEventAsyncType.ALL:
+            webhooks_by_pk.update(
+                (webhook.pk, webhook)
+                for webhook in self.webhooks_per_event.get(
+                    WebhookEventAsyncType.ANY, []
+                )
+            )
+        webhooks = [
+            webhook
+            for _, webhook in sorted(webhooks_by_pk.items())
+            if not required_permission
+            or required_permission.value in self.app_permissions[webhook.app_id]
+        ]
+        self._routes[event_type] = webhooks
+        return webhooks
+
+
+_routing_table: Optional[WebhooksRoutingTable] = None
+_lock = threading.Lock()
+
+
+def get_webhooks_routing_table() -> WebhooksRoutingTable:
+    """Return the routing table of the current process, rebuilt when outdated."""
+    global _routing_table
+
+    version = get_version(WEBHOOKS_ROUTING_VERSION_CACHE_KEY)
+    routing_table = _routing_table
+    if routing_table is not None and routing_table.is_valid(version):
+        return routing_table
+
+    routing_table = WebhooksRoutingTable(version, fetch_active_webhooks())
+    with _lock:
+        _routing_table = routing_table
+    return routing_table
+
+
+def fetch_active_webhooks() -> List["Webhook"]:
+    from .models import Webhook
+
+    return list(
+        Webhook.objects.filter(is_active=True, app__is_active=True)
+        .select_related("app")
+        .prefetch_related("events", "app__permissions__content_type")
+    )
+
+
+def invalidate_webhooks_routing():
+    invalidate(WEBHOOKS_ROUTING_VERSION_CACHE_KEY)
+
+
+def clear_webhooks_routing():
+    """Drop the routing table cached by the current process."""
+    global _routing_table
+
+    with _lock:
+        _routing_table = None
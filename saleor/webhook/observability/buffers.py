@@ -15,7 +15,6 @@ _local = Local()
 
 
 class BaseBuffer:
-    _compressor_preset = 6
     _pickle_version = 5
 
     def __init__(
@@ -26,6 +25,7 @@ class BaseBuffer:
         batch_size: int,
         connection_timeout=DEFAULT_CONNECTION_TIMEOUT,
         timeout: int = 60,
+        compression_level: int = 1,
     ):
         self.broker_url = broker_url
         self.key = key
@@ -33,14 +33,19 @@ class BaseBuffer:
         self.batch_size = batch_size
         self.connection_timeout = connection_timeout
         self.timeout = timeout
+        self.compression_level = compression_level
 
     def decode(self, value: bytes) -> Any:
+        # Pickled data starts with the PROTO opcode, anything else is compressed.
+        if value[:1] == pickle.PROTO:
+            return pickle.loads(value)
         return pickle.loads(zlib.decompress(value))
 
     def encode(self, value: Any) -> bytes:
-        return zlib.compress(
-            pickle.dumps(value, self._pickle_version), self._compressor_preset
-        )
+        data = pickle.dumps(value, self._pickle_version)
+        if not self.compression_level:
+            return data
+        return zlib.compress(data, self.compression_level)
 
     def put_event(self, event: Any) -> int:
         raise NotImplementedError(
@@ -52,6 +57,11 @@ class BaseBuffer:
             "subclasses of BaseBuffer must provide a put_events() method"
         )
 
+    def put_events_get_size(self, events: List[Any]) -> Tuple[int, int]:
+        raise NotImplementedError(
+            "subclasses of BaseBuffer must provide a put_events_get_size() method"
+        )
+
     def put_multi_key_events(
         self, events_dict: Dict[KEY_TYPE, List[Any]]
     ) -> Dict[KEY_TYPE, int]:
@@ -132,11 +142,19 @@ class RedisBuffer(BaseBuffer):
         client.expire(key, self.timeout)
         return max(0, len(events) - self.max_size)
 
-    def put_events(self, events: List[Any]) -> int:
+    def put_events_get_size(self, events: List[Any]) -> Tuple[int, int]:
+        """Put the events and return the number of dropped events and buffer size."""
         with self.client.pipeline(transaction=False) as pipe:
             dropped = self._put_events(self.key, events, client=pipe)
             result = pipe.execute()
-        return dropped + max(0, result[0] - self.max_size)
+        buffer_len = result[0]
+        return dropped + max(0, buffer_len - self.max_size), min(
+            buffer_len, self.max_size
+        )
+
+    def put_events(self, events: List[Any]) -> int:
+        dropped, _ = self.put_events_get_size(events)
+        return dropped
 
     def put_event(self, event: Any) -> int:
         return self.put_events([event])
@@ -209,4 +227,5 @@ def get_buffer(
         batch_size,
         connection_timeout=connection_timeout,
         timeout=timeout,
+        compression_level=settings.OBSERVABILITY_BUFFER_COMPRESSION_LEVEL,
     )
@@ -80,6 +80,37 @@ def test_buffer_drops_events_when_put_events(buffer):
     assert buffer.size() == MAX_SIZE
 
 
+def test_put_events_get_size(buffer):
+    events = [{"event": "data"}] * (MAX_SIZE + 2)
+    dropped, size = buffer.put_events_get_size(events)
+    assert dropped == 2
+    assert size == MAX_SIZE
+
+
+@pytest.mark.parametrize("compression_level", [0, 1, 9])
+def test_encode_decode(buffer, compression_level):
+    buffer.compression_level = compression_level
+    event = {"event": "data" * 100}
+    encoded = buffer.encode(event)
+    assert buffer.decode(encoded) == event
+
+
+def test_encode_without_compression_is_not_compressed(buffer):
+    event = {"event": "data" * 100}
+    buffer.compression_level = 0
+    uncompressed = buffer.encode(event)
+    buffer.compression_level = 1
+    assert len(buffer.encode(event)) < len(uncompressed)
+
+
+def test_decode_events_encoded_with_different_compression_level(buffer):
+    buffer.compression_level = 6
+    buffer.put_event({"event": "compressed"})
+    buffer.compression_level = 0
+    buffer.put_event({"event": "uncompressed"})
+    assert buffer.pop_events() == [{"event": "compressed"}, {"event": "uncompressed"}]
+
+
 def test_put_multi_key_events(patch_connection_pool):
     key_a, events_a = "buffer_a", [{"event": "data"}] * 2
     key_b, events_b = "buffer_b", [{"event": "data"}] * MAX_SIZE
@@ -21,7 +21,7 @@ from ..utils import (
     report_gql_operation,
     task_next_retry_date,
 )
-from .conftest import BATCH_SIZE
+from .conftest import BATCH_SIZE, MAX_SIZE
 
 
 @pytest.fixture
@@ -248,6 +248,18 @@ def test_put_event(patch_get_buffer, buffer):
     assert buffer.size() == 1
 
 
+@patch("saleor.webhook.observability.utils.opentracing_trace")
+def test_put_event_reports_buffer_metrics(mocked_trace, patch_get_buffer, buffer):
+    buffer.put_events([{"payload": "data"}] * MAX_SIZE)
+    span = mocked_trace.return_value.__enter__.return_value
+
+    put_event(lambda: {"payload": "data"})
+
+    span.set_tag.assert_any_call("buffer.dropped_events", 1)
+    span.set_tag.assert_any_call("buffer.size", MAX_SIZE)
+    span.set_tag.assert_any_call("buffer.fill", 1.0)
+
+
 @pytest.mark.parametrize(
     "error",
     [
@@ -11,4 +11,4 @@ def opentracing_trace(span_name, component):
         span = scope.span
         span.set_tag("service.name", "observability")
         span.set_tag(opentracing.tags.COMPONENT, component)
-        yield
+        yield span
@@ -92,8 +92,13 @@ def task_next_retry_date(retry_error: "Retry") -> Optional[datetime]:
 def put_event(generate_payload: Callable[[], Any]):
     try:
         payload = generate_payload()
-        with opentracing_trace("put_event", "buffer"):
-            if get_buffer(get_buffer_name()).put_event(payload):
+        with opentracing_trace("put_event", "buffer") as span:
+            buffer = get_buffer(get_buffer_name())
+            dropped, size = buffer.put_events_get_size([payload])
+            span.set_tag("buffer.dropped_events", dropped)
+            span.set_tag("buffer.size", size)
+            span.set_tag("buffer.fill", size / buffer.max_size)
+            if dropped:
                 logger.warning("Observability buffer full, event dropped.")
     except TruncationError as err:
         logger.warning("Observability event dropped. %s", err, extra=err.extra)
@@ -102,11 +107,14 @@ def put_event(generate_payload: Callable[[], Any]):
 
 
 def pop_events_with_remaining_size() -> Tuple[List[Any], int]:
-    with opentracing_trace("pop_events", "buffer"):
+    with opentracing_trace("pop_events", "buffer") as span:
         try:
             buffer = get_buffer(get_buffer_name())
             events, remaining = buffer.pop_events_get_size()
             batch_count = buffer.in_batches(remaining)
+            span.set_tag("buffer.popped_events", len(events))
+            span.set_tag("buffer.size", remaining)
+            span.set_tag("buffer.fill", remaining / buffer.max_size)
         except Exception:
             logger.error("Could not pop observability events batch.", exc_info=True)
             events, batch_count = [], 0
@@ -0,0 +1,6 @@
+from ..core.cache_version import invalidate_on_commit
+from .cache import WEBHOOKS_ROUTING_VERSION_CACHE_KEY
+
+invalidate_webhooks_routing_cache = invalidate_on_commit(
+    WEBHOOKS_ROUTING_VERSION_CACHE_KEY
+)
@@ -0,0 +1,10 @@
+import pytest
+
+from ...tests.utils import reset_cache_version
+from ..cache import WEBHOOKS_ROUTING_VERSION_CACHE_KEY, clear_webhooks_routing
+
+
+@pytest.fixture(autouse=True)
+def clear_webhooks_routing_cache():
+    clear_webhooks_routing()
+    reset_cache_version(WEBHOOKS_ROUTING_VERSION_CACHE_KEY)
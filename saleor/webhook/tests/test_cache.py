@@ -0,0 +1,143 @@
+from ...app.models import App
+from ..cache import clear_webhooks_routing
+from ..event_types import WebhookEventAsyncType, WebhookEventSyncType
+from ..models import Webhook, WebhookEvent
+from ..utils import any_webhooks_for_event, get_webhooks_for_event
+
+
+def test_get_webhooks_for_event_reuses_routing_table(
+    webhook, permission_manage_orders, django_assert_num_queries
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    webhook.app.permissions.add(permission_manage_orders)
+    get_webhooks_for_event(event_type)
+
+    # when
+    with django_assert_num_queries(0):
+        webhooks = get_webhooks_for_event(event_type)
+        other_webhooks = get_webhooks_for_event(WebhookEventAsyncType.ORDER_UPDATED)
+
+    # then
+    assert webhooks == [webhook]
+    assert other_webhooks == []
+
+
+def test_get_webhooks_for_event_rebuilds_routing_table_of_process(
+    webhook, permission_manage_orders
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    webhook.app.permissions.add(permission_manage_orders)
+    get_webhooks_for_event(event_type)
+    clear_webhooks_routing()
+
+    # when
+    webhooks = get_webhooks_for_event(event_type)
+
+    # then
+    assert webhooks == [webhook]
+
+
+def test_get_webhooks_for_event_invalidated_on_webhook_change(
+    webhook, permission_manage_orders
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    webhook.app.permissions.add(permission_manage_orders)
+    assert get_webhooks_for_event(event_type) == [webhook]
+
+    # when
+    webhook.is_active = False
+    webhook.save(update_fields=["is_active"])
+
+    # then
+    assert get_webhooks_for_event(event_type) == []
+
+
+def test_get_webhooks_for_event_invalidated_on_webhook_event_change(
+    webhook, permission_manage_orders
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+    webhook.app.permissions.add(permission_manage_orders)
+    assert get_webhooks_for_event(event_type) == []
+
+    # when
+    WebhookEvent.objects.create(webhook=webhook, event_type=event_type)
+
+    # then
+    assert get_webhooks_for_event(event_type) == [webhook]
+
+
+def test_get_webhooks_for_event_invalidated_on_app_change(
+    webhook, permission_manage_orders
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    webhook.app.permissions.add(permission_manage_orders)
+    assert get_webhooks_for_event(event_type) == [webhook]
+
+    # when
+    app = webhook.app
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert get_webhooks_for_event(event_type) == []
+
+
+def test_get_webhooks_for_event_invalidated_on_app_permissions_change(
+    webhook, permission_manage_payments
+):
+    # given
+    event_type = WebhookEventSyncType.PAYMENT_AUTHORIZE
+    webhook.events.create(event_type=event_type)
+    assert get_webhooks_for_event(event_type) == []
+
+    # when
+    webhook.app.permissions.add(permission_manage_payments)
+
+    # then
+    assert get_webhooks_for_event(event_type) == [webhook]
+
+
+def test_get_webhooks_for_event_filtered_by_apps(webhook, permission_manage_orders):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    webhook.app.permissions.add(permission_manage_orders)
+    app = App.objects.create(name="Other app", identifier="other-app")
+    app.permissions.add(permission_manage_orders)
+    other_webhook = Webhook.objects.create(app=app, target_url="http://example.com")
+    other_webhook.events.create(event_type=event_type)
+
+    # when
+    webhooks_by_id = get_webhooks_for_event(event_type, apps_ids=[app.id])
+    webhooks_by_identifier = get_webhooks_for_event(
+        event_type, apps_identifier=[app.identifier]
+    )
+
+    # then
+    assert get_webhooks_for_event(event_type) == [webhook, other_webhook]
+    assert webhooks_by_id == [other_webhook]
+    assert webhooks_by_identifier == [other_webhook]
+
+
+def test_any_webhooks_for_event(
+    webhook, permission_manage_orders, django_assert_num_queries
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    webhook.app.permissions.add(permission_manage_orders)
+    any_webhooks_for_event(event_type)
+
+    # when
+    with django_assert_num_queries(0):
+        has_webhooks = any_webhooks_for_event(event_type)
+        has_other_webhooks = any_webhooks_for_event(
+            WebhookEventSyncType.PAYMENT_AUTHORIZE
+        )
+
+    # then
+    assert has_webhooks is True
+    assert has_other_webhooks is False
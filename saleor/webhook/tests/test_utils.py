@@ -102,7 +102,7 @@ def test_get_webhook_for_event_no_duplicates(async_app_factory, async_type):
 
     webhooks = get_webhooks_for_event(async_type)
 
-    assert webhooks.count() == 1
+    assert len(webhooks) == 1
 
 
 def test_get_webhook_for_event_not_returning_any_webhook_for_sync_event_types(
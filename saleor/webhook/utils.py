@@ -1,50 +1,46 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from django.db.models import Q
-from django.db.models.expressions import Exists, OuterRef
-
-from ..app.models import App
-from .event_types import WebhookEventAsyncType, WebhookEventSyncType
-from .models import Webhook, WebhookEvent
+from .cache import get_webhooks_routing_table
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
+    from .models import Webhook
+
 
 def get_webhooks_for_event(
     event_type: str,
     webhooks: Optional["QuerySet[Webhook]"] = None,
     apps_ids: Optional["list[int]"] = None,
     apps_identifier: Optional[list[str]] = None,
-) -> "QuerySet[Webhook]":
-    """Get active webhooks from the database for an event."""
-    permissions = {}
-    required_permission = WebhookEventAsyncType.PERMISSIONS.get(
-        event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
-    )
-    if required_permission:
-        app_label, codename = required_permission.value.split(".")
-        permissions["permissions__content_type__app_label"] = app_label
-        permissions["permissions__codename"] = codename
-
-    if webhooks is None:
-        webhooks = Webhook.objects.all()
-    app_kwargs: dict = {"is_active": True, **permissions}
+) -> List["Webhook"]:
+    """Get active webhooks for an event.
+
+    Webhooks are taken from the routing table cached by the process, they are
+    queried from the database only when the table is outdated.
+    """
+    event_webhooks = get_webhooks_routing_table().get_webhooks(event_type)
+    if webhooks is not None:
+        webhooks_ids = set(webhooks.values_list("id", flat=True))
+        event_webhooks = [
+            webhook for webhook in event_webhooks if webhook.id in webhooks_ids
+        ]
     if apps_ids:
-        app_kwargs["id__in"] = apps_ids
+        event_webhooks = [
+            webhook for webhook in event_webhooks if webhook.app_id in apps_ids
+        ]
     if apps_identifier:
-        app_kwargs["identifier__in"] = apps_identifier
-
-    apps = App.objects.filter(**app_kwargs)
-    event_types = [event_type]
-    if event_type in WebhookEventAsyncType.ALL:
-        event_types.append(WebhookEventAsyncType.ANY)
-    webhook_events = WebhookEvent.objects.filter(event_type__in=event_types)
-    return (
-        webhooks.filter(
-            Q(is_active=True, app__in=apps)
-            & Q(Exists(webhook_events.filter(webhook_id=OuterRef("id"))))
-        )
-        .select_related("app")
-        .prefetch_related("app__permissions__content_type")
-    )
+        event_webhooks = [
+            webhook
+            for webhook in event_webhooks
+            if webhook.app.identifier in apps_identifier
+        ]
+    return event_webhooks
+
+
+def any_webhooks_for_event(event_type: str) -> bool:
+    """Return whether any active webhook is subscribed to the event.
+
+    Use it to skip generating the event payload when nobody would receive it.
+    """
+    return bool(get_webhooks_routing_table().get_webhooks(event_type))